@@ -0,0 +1,64 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import time
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+USERS = 200
+# a database that handles a few queries at a time
+database_connections = asyncio.Semaphore(10)
+round_trips = 0
+
+
+async def query_users(user_ids: list[int]) -> list[str]:
+    global round_trips
+    async with database_connections:
+        round_trips += 1
+        await asyncio.sleep(0.002)
+    return [f"user {user_id}" for user_id in user_ids]
+
+
+@flow_function(cached=True)
+async def user__using_user_id(user_id: int) -> str:
+    return (await query_users([user_id]))[0]
+
+
+@flow_function(cached=True, batched=True)
+async def batched_user__using_user_id(user_ids: list[int]) -> list[str]:
+    return await query_users(user_ids)
+
+
+@flow_function()
+async def user_greeting(user_id: int, user: FlowFunction[str]) -> str:
+    return f"Hello, {await user(user_id)}!"
+
+
+async def greet_users(
+    user_ids: list[int], user_greeting: FlowFunction[str]
+) -> list[str]:
+    return list(await asyncio.gather(*(user_greeting(user_id) for user_id in user_ids)))
+
+
+per_item = flow(user=user__using_user_id, user_greeting=user_greeting)(greet_users)
+batched = flow(user=batched_user__using_user_id, user_greeting=user_greeting)(
+    greet_users
+)
+
+
+async def main() -> None:
+    global round_trips
+    for name, greet_flow in (("per item", per_item), ("batched", batched)):
+        round_trips = 0
+        started = time.perf_counter()
+        await greet_flow(user_ids=list(range(USERS)))
+        elapsed = time.perf_counter() - started
+        print(
+            f"{name:>8}: {round_trips:3} round-trips for {USERS} users,"
+            f" {elapsed * 1e3:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+INVOCATIONS = 100
+LOOKUP_LATENCY = 0.002
+
+
+@flow_function(cached=True)
+async def user() -> str:
+    await asyncio.sleep(LOOKUP_LATENCY)
+    return "Vinko"
+
+
+@flow_function(cached=True)
+async def user_language() -> str:
+    await asyncio.sleep(LOOKUP_LATENCY)
+    return "en"
+
+
+@flow_function(cached=True)
+async def user_timezone() -> str:
+    await asyncio.sleep(LOOKUP_LATENCY)
+    return "Europe/Zagreb"
+
+
+@flow_function(cached=True)
+async def tenant() -> str:
+    await asyncio.sleep(LOOKUP_LATENCY)
+    return "execution-flows"
+
+
+@flow_function(cached=True)
+async def feature_flags() -> list[str]:
+    await asyncio.sleep(LOOKUP_LATENCY)
+    return ["greetings"]
+
+
+@flow_function()
+async def greeting(
+    user: FlowFunction[str],
+    user_language: FlowFunction[str],
+    user_timezone: FlowFunction[str],
+    tenant: FlowFunction[str],
+    feature_flags: FlowFunction[list[str]],
+) -> str:
+    return (
+        f"{await user()} {await user_language()} {await user_timezone()}"
+        f" {await tenant()} {await feature_flags()}"
+    )
+
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "user": user,
+    "user_language": user_language,
+    "user_timezone": user_timezone,
+    "tenant": tenant,
+    "feature_flags": feature_flags,
+    "greeting": greeting,
+}
+
+
+@flow(**configuration)
+async def sequential(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+@flow(**configuration, concurrent=True)
+async def concurrent(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+async def p50(invoke_flow: Callable[[], Awaitable[Any]]) -> float:
+    durations = []
+    for _ in range(INVOCATIONS):
+        started = time.perf_counter()
+        await invoke_flow()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+async def main() -> None:
+    for name, invoke_flow in (("sequential", sequential), ("concurrent", concurrent)):
+        print(
+            f"{name:>10}: {await p50(invoke_flow) * 1e3:.2f} ms p50"
+            f" for 5 independent {LOOKUP_LATENCY * 1e3:.0f} ms lookups"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
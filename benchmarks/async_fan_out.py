@@ -0,0 +1,48 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import time
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+FAN_OUT = 10
+INVOCATIONS = 100
+round_trips = 0
+
+
+@flow_function(cached=True)
+async def user() -> str:
+    global round_trips
+    round_trips += 1
+    await asyncio.sleep(0.001)
+    return "Vinko"
+
+
+@flow_function()
+async def section(index: int, user: FlowFunction[str]) -> str:
+    return f"{index}: {await user()}"
+
+
+@flow(
+    user=user,
+    section=section,
+)
+async def page(section: FlowFunction[str]) -> list[str]:
+    return list(await asyncio.gather(*(section(index) for index in range(FAN_OUT))))
+
+
+async def main() -> None:
+    started = time.perf_counter()
+    for _ in range(INVOCATIONS):
+        await page()
+    elapsed = time.perf_counter() - started
+    print(
+        f"fan-out of {FAN_OUT} sub-functions sharing a cached user():"
+        f" {round_trips / INVOCATIONS:.1f} round-trips,"
+        f" {elapsed / INVOCATIONS * 1e3:.2f} ms per flow invocation"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import time
+
+from collections.abc import Awaitable, Callable
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+ITERATIONS = 3_000_000
+HEARTBEAT_INTERVAL = 0.001
+
+
+async def render(price: FlowFunction[int]) -> int:
+    base_price = await price()
+    total = 0
+    for index in range(ITERATIONS):
+        total += (base_price * index) % 7
+    return total
+
+
+@flow_function(cached=True)
+async def price() -> int:
+    return 100
+
+
+inline_render = flow_function()(render)
+process_render = flow_function(executor="process")(render)
+# the worker process imports the flow function by its module-level name
+render = process_render
+
+
+@flow(price=price, render=inline_render)
+async def inline(render: FlowFunction[int]) -> int:
+    return await render()
+
+
+@flow(price=price, render=process_render)
+async def in_process(render: FlowFunction[int]) -> int:
+    return await render()
+
+
+async def max_event_loop_lag(render_flow: Callable[[], Awaitable[int]]) -> float:
+    """The longest delay of a heartbeat task while the flow renders."""
+    lags = []
+
+    async def heartbeat() -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            lags.append(time.perf_counter() - started - HEARTBEAT_INTERVAL)
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(HEARTBEAT_INTERVAL)
+    await render_flow()
+    # the heartbeat delayed by the rendering records its lag
+    await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+    heartbeat_task.cancel()
+    return max(lags)
+
+
+async def main() -> None:
+    # start the process pool before measuring
+    await in_process()
+    for name, render_flow in (("inline", inline), ("process", in_process)):
+        lag = await max_event_loop_lag(render_flow)
+        print(f"{name:>8}: {lag * 1e3:.1f} ms max event loop lag during rendering")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+INVOCATIONS = 200
+LOOKUP_LATENCY = 0.002
+
+
+@flow_function(cached=True)
+async def user() -> str:
+    await asyncio.sleep(LOOKUP_LATENCY)
+    return "Vinko"
+
+
+@flow_function(cached=True)
+async def permissions() -> list[str]:
+    await asyncio.sleep(LOOKUP_LATENCY)
+    return ["greet"]
+
+
+@flow_function(cached=True)
+async def tenant() -> str:
+    await asyncio.sleep(LOOKUP_LATENCY)
+    return "execution-flows"
+
+
+async def greeting(
+    user: FlowFunction[str],
+    permissions: FlowFunction[list[str]],
+    tenant: FlowFunction[str],
+) -> str:
+    return f"{await user()} {await permissions()} {await tenant()}"
+
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "user": user,
+    "permissions": permissions,
+    "tenant": tenant,
+}
+
+unprofiled = flow(**configuration)(greeting)
+speculative = flow(**configuration, speculate=True)(greeting)
+
+
+async def p50(invoke_flow: Callable[[], Awaitable[Any]]) -> float:
+    durations = []
+    for _ in range(INVOCATIONS):
+        started = time.perf_counter()
+        await invoke_flow()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+async def main() -> None:
+    for name, invoke_flow in (("unprofiled", unprofiled), ("speculative", speculative)):
+        print(
+            f"{name:>11}: {await p50(invoke_flow) * 1e3:.2f} ms p50"
+            f" for 3 sequential {LOOKUP_LATENCY * 1e3:.0f} ms lookups"
+        )
+    print(f"{speculative.speculation_info()}")  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
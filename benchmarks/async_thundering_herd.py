@@ -0,0 +1,68 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import time
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+CONCURRENT_INVOCATIONS = 500
+round_trips = 0
+
+
+async def fetch_tenant_settings(tenant_id: int) -> dict[str, str]:
+    global round_trips
+    round_trips += 1
+    await asyncio.sleep(0.005)
+    return {"language": "en"}
+
+
+@flow_function(cached="process")
+async def tenant_settings(tenant_id: int) -> dict[str, str]:
+    return await fetch_tenant_settings(tenant_id)
+
+
+@flow_function(cached="process", coalesce=True)
+async def coalesced_tenant_settings(tenant_id: int) -> dict[str, str]:
+    return await fetch_tenant_settings(tenant_id)
+
+
+@flow(
+    settings=tenant_settings,
+)
+async def tenant_language(
+    tenant_id: int, settings: FlowFunction[dict[str, str]]
+) -> str:
+    return (await settings(tenant_id))["language"]
+
+
+@flow(
+    settings=coalesced_tenant_settings,
+)
+async def coalesced_tenant_language(
+    tenant_id: int, settings: FlowFunction[dict[str, str]]
+) -> str:
+    return (await settings(tenant_id))["language"]
+
+
+async def main() -> None:
+    global round_trips
+    for name, language_flow in (
+        ("process cache", tenant_language),
+        ("process cache with coalescing", coalesced_tenant_language),
+    ):
+        round_trips = 0
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(language_flow(tenant_id=1) for _ in range(CONCURRENT_INVOCATIONS))
+        )
+        elapsed = time.perf_counter() - started
+        print(
+            f"{name:>30}: {round_trips:4} round-trips for"
+            f" {CONCURRENT_INVOCATIONS} concurrent invocations on a cold cache,"
+            f" {elapsed * 1e3:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
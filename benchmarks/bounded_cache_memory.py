@@ -0,0 +1,73 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import time
+import tracemalloc
+
+from flow_compose import flow, flow_function, FlowFunction
+
+BASKET_SIZE = 100_000
+
+
+@flow_function(cached=True)
+def price(index: int) -> str:
+    return f"price of the item {index}"
+
+
+@flow_function(cached=True, maxsize=1_000)
+def price_with_maxsize(index: int) -> str:
+    return f"price of the item {index}"
+
+
+@flow_function(cached=True, maxbytes=64 * 1024)
+def price_with_maxbytes(index: int) -> str:
+    return f"price of the item {index}"
+
+
+@flow_function()
+def basket_total(price: FlowFunction[str]) -> int:
+    return sum(len(price(index)) for index in range(BASKET_SIZE))
+
+
+@flow(
+    price=price,
+)
+def unbounded(total: FlowFunction[int] = basket_total) -> int:
+    return total()
+
+
+@flow(
+    price=price_with_maxsize,
+)
+def bounded_by_maxsize(total: FlowFunction[int] = basket_total) -> int:
+    return total()
+
+
+@flow(
+    price=price_with_maxbytes,
+)
+def bounded_by_maxbytes(total: FlowFunction[int] = basket_total) -> int:
+    return total()
+
+
+def main() -> None:
+    for name, invoke_flow in (
+        ("unbounded", unbounded),
+        ("maxsize=1000", bounded_by_maxsize),
+        ("maxbytes=64KiB", bounded_by_maxbytes),
+    ):
+        started = time.perf_counter()
+        invoke_flow()
+        elapsed = time.perf_counter() - started
+        tracemalloc.start()
+        invoke_flow()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:>15}: {peak / 1024 / 1024:8.2f} MiB peak,"
+            f" {elapsed * 1e3:8.1f} ms per invocation"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import timeit
+
+from flow_compose import flow, flow_function, FlowFunction, identity_key
+
+CALLS = 1_000
+
+
+@flow_function(cached=True)
+def greeting_hello_world() -> str:
+    return "Hello, World!"
+
+
+@flow_function(cached=True)
+def greeting_with_index(index: int, punctuation: str = "!") -> str:
+    return f"Hello, World{punctuation} - {index}"
+
+
+LARGE_ARGUMENT = tuple(range(10_000))
+
+
+@flow_function(cached=True)
+def argument_length(values: tuple[int, ...]) -> int:
+    return len(values)
+
+
+@flow_function(cached=True, key=identity_key)
+def argument_length_by_identity(values: tuple[int, ...]) -> int:
+    return len(values)
+
+
+@flow_function(cached=True)
+def reference_data() -> int:
+    return sum(range(10_000))
+
+
+@flow_function(cached="process", maxsize=1)
+def process_reference_data() -> int:
+    return sum(range(10_000))
+
+
+@flow(
+    greeting=greeting_hello_world,
+)
+def nullary_calls(greeting: FlowFunction[str]) -> None:
+    for _ in range(CALLS):
+        greeting()
+
+
+@flow(
+    greeting=greeting_with_index,
+)
+def positional_calls(greeting: FlowFunction[str]) -> None:
+    for _ in range(CALLS):
+        greeting(11, "!")
+
+
+@flow(
+    greeting=greeting_with_index,
+)
+def keyword_calls(greeting: FlowFunction[str]) -> None:
+    for _ in range(CALLS):
+        greeting(index=11)
+
+
+@flow(
+    reference=reference_data,
+)
+def invocation_cached_reference(reference: FlowFunction[int]) -> int:
+    return reference()
+
+
+@flow(
+    reference=process_reference_data,
+)
+def process_cached_reference(reference: FlowFunction[int]) -> int:
+    return reference()
+
+
+@flow(
+    length=argument_length,
+)
+def large_argument_calls(length: FlowFunction[int]) -> None:
+    for _ in range(CALLS):
+        length(LARGE_ARGUMENT)
+
+
+@flow(
+    length=argument_length_by_identity,
+)
+def large_argument_calls_by_identity(length: FlowFunction[int]) -> None:
+    for _ in range(CALLS):
+        length(LARGE_ARGUMENT)
+
+
+def main() -> None:
+    for name, calls in (
+        ("nullary", nullary_calls),
+        ("positional arguments", positional_calls),
+        ("keyword arguments with default", keyword_calls),
+        ("large tuple argument", large_argument_calls),
+        ("large tuple argument by identity", large_argument_calls_by_identity),
+    ):
+        seconds = min(timeit.repeat(calls, number=100, repeat=5))
+        print(f"{name:>32}: {seconds / 100 / CALLS * 1e9:8.1f} ns per cached call")
+    for name, invocation in (
+        ("cached per invocation", invocation_cached_reference),
+        ("cached per process", process_cached_reference),
+    ):
+        seconds = min(timeit.repeat(invocation, number=CALLS, repeat=5))
+        print(f"{name:>32}: {seconds / CALLS * 1e6:8.1f} us per flow invocation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from flow_compose import flow, flow_function, FlowFunction, FlowArgument
+
+
+@flow_function()
+def greeting_hello_world() -> str:
+    return "Hello, World!"
+
+
+def build_flow(aliases: int) -> Callable[..., str]:
+    flow_configuration: dict[str, FlowFunction[Any]] = {
+        f"alias_{index}": greeting_hello_world for index in range(aliases - 2)
+    }
+    flow_configuration["user_id"] = FlowArgument(int)
+    flow_configuration["greeting"] = greeting_hello_world
+
+    @flow(**flow_configuration)
+    def hello_world(greeting: FlowFunction[str]) -> str:
+        return greeting()
+
+    return hello_world
+
+
+def main() -> None:
+    calls = 1_000
+    for aliases in (5, 50, 500):
+        hello_world = build_flow(aliases)
+        hello_world(user_id=1)
+
+        tracemalloc.start()
+        allocated = 0
+        for _ in range(calls):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            hello_world(user_id=1)
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - current
+        tracemalloc.stop()
+
+        print(
+            f"{aliases:>4} aliases: {allocated / calls:10.1f} bytes allocated per call"
+        )
+
+
+if __name__ == "__main__":
+    main()
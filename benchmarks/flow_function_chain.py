@@ -0,0 +1,58 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from flow_compose import flow, flow_function, FlowFunction
+
+
+@flow_function()
+def step_0() -> int:
+    return 0
+
+
+def build_flow(depth: int, calls: int = 1) -> Callable[..., int]:
+    """Chain of `depth` flow functions where `step_<n>` calls `step_<n - 1>`."""
+    flow_configuration: dict[str, FlowFunction[Any]] = {"step_0": step_0}
+    for index in range(1, depth):
+        namespace: dict[str, Any] = {"FlowFunction": FlowFunction}
+        exec(
+            f"def step_{index}(step_{index - 1}: FlowFunction[int]) -> int:\n"
+            f"    return step_{index - 1}() + 1\n",
+            namespace,
+        )
+        flow_configuration[f"step_{index}"] = flow_function()(
+            namespace[f"step_{index}"]
+        )
+
+    namespace = {"FlowFunction": FlowFunction}
+    exec(
+        f"def chain(step_{depth - 1}: FlowFunction[int]) -> int:\n"
+        f"    for _ in range({calls - 1}):\n"
+        f"        step_{depth - 1}()\n"
+        f"    return step_{depth - 1}()\n",
+        namespace,
+    )
+    return flow(**flow_configuration)(namespace["chain"])
+
+
+def main() -> None:
+    number = 20_000
+    for depth in (1, 5, 20):
+        chain = build_flow(depth)
+        assert chain() == depth - 1
+        seconds = min(timeit.repeat(chain, number=number, repeat=5))
+        repeated_chain = build_flow(depth, calls=100)
+        repeated_seconds = min(
+            timeit.repeat(repeated_chain, number=number // 100, repeat=5)
+        )
+        print(
+            f"depth {depth:>2}: {seconds / number * 1e6:8.2f} us per flow call,"
+            f" {repeated_seconds / number * 1e6:8.2f} us per repeated chain call"
+        )
+
+
+if __name__ == "__main__":
+    main()
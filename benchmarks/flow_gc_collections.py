@@ -0,0 +1,90 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import gc
+
+import flow_compose
+import flow_compose.a
+
+
+@flow_compose.flow_function(cached=True)
+def user__using_user_id(user_id: flow_compose.FlowFunction[int]) -> str:
+    return f"user-{user_id()}"
+
+
+@flow_compose.flow_function()
+def greeting__using_user(user: flow_compose.FlowFunction[str]) -> str:
+    return f"Hello, {user()}!"
+
+
+@flow_compose.flow(
+    user_id=flow_compose.FlowArgument(int),
+    user=user__using_user_id,
+    greeting=greeting__using_user,
+)
+def hello_user(greeting: flow_compose.FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow_compose.a.flow_function(cached=True)
+async def async_user__using_user_id(
+    user_id: flow_compose.a.FlowFunction[int],
+) -> str:
+    return f"user-{await user_id()}"
+
+
+@flow_compose.a.flow_function()
+async def async_greeting__using_user(
+    user: flow_compose.a.FlowFunction[str],
+) -> str:
+    return f"Hello, {await user()}!"
+
+
+@flow_compose.a.flow(
+    user_id=flow_compose.a.FlowArgument(int),
+    user=async_user__using_user_id,
+    greeting=async_greeting__using_user,
+)
+async def async_hello_user(greeting: flow_compose.a.FlowFunction[str]) -> str:
+    return await greeting()
+
+
+INVOCATIONS = 100_000
+
+
+def collections() -> list[int]:
+    return [generation["collections"] for generation in gc.get_stats()]
+
+
+def report(name: str, before: list[int], after: list[int]) -> None:
+    print(
+        f"{name}: "
+        + ", ".join(
+            f"gen{generation} {after[generation] - before[generation]:>5}"
+            for generation in range(len(before))
+        )
+        + f" collections per {INVOCATIONS} invocations"
+    )
+
+
+async def invoke_async_flow() -> None:
+    for index in range(INVOCATIONS):
+        await async_hello_user(user_id=index)
+
+
+def main() -> None:
+    gc.collect()
+    before = collections()
+    for index in range(INVOCATIONS):
+        hello_user(user_id=index)
+    report("sync flow ", before, collections())
+
+    gc.collect()
+    before = collections()
+    asyncio.run(invoke_async_flow())
+    report("async flow", before, collections())
+
+
+if __name__ == "__main__":
+    main()
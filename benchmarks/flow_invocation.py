@@ -0,0 +1,70 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from flow_compose import flow, flow_function, FlowFunction, FlowArgument
+
+
+@flow_function()
+def greeting_hello_world() -> str:
+    return "Hello, World!"
+
+
+@flow_function()
+def greet_using_greeting(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+def build_flow(aliases: int, compile: bool = False) -> Callable[..., str]:
+    flow_configuration: dict[str, FlowFunction[Any]] = {
+        f"alias_{index}": greeting_hello_world for index in range(aliases - 3)
+    }
+    flow_configuration["user_id"] = FlowArgument(int)
+    flow_configuration["greeting"] = greeting_hello_world
+
+    @flow(compile=compile, **flow_configuration)
+    def hello_world(greet: FlowFunction[str] = greet_using_greeting) -> str:
+        return greet()
+
+    return hello_world
+
+
+def hand_written_greeting() -> str:
+    return "Hello, World!"
+
+
+def hand_written_greet(greeting: Callable[[], str]) -> str:
+    return greeting()
+
+
+def hand_written_hello_world(user_id: int) -> str:
+    return hand_written_greet(hand_written_greeting)
+
+
+def measure(invoke: Callable[[], str], number: int) -> float:
+    return min(timeit.repeat(invoke, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    number = 40_000
+    for aliases in (5, 50, 500):
+        hello_world = build_flow(aliases)
+        compiled_hello_world = build_flow(aliases, compile=True)
+        print(
+            f"{aliases:>4} aliases:"
+            f" {measure(lambda: hello_world(user_id=1), number):8.2f} us per call,"
+            f" {measure(lambda: compiled_hello_world(user_id=1), number):8.2f} us"
+            f" per call with compile=True"
+        )
+    print(
+        f"hand-written:"
+        f" {measure(lambda: hand_written_hello_world(user_id=1), number):8.2f} us"
+        f" per call"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from flow_compose import flow, flow_function, FlowArgument, FlowFunction
+
+RECORDS = 20_000
+LOOKUP_RECORDS = 2_000
+LOOKUP_LATENCY = 0.001
+REPEAT = 5
+
+
+@flow_function(cached=True)
+def tax_rates() -> dict[str, float]:
+    return {"HR": 0.25, "DE": 0.19}
+
+
+@flow_function(cached=True)
+def looked_up_tax_rates() -> dict[str, float]:
+    time.sleep(LOOKUP_LATENCY)
+    return {"HR": 0.25, "DE": 0.19}
+
+
+@flow_function(cached=True)
+def tax_rate(
+    country: FlowFunction[str], tax_rates: FlowFunction[dict[str, float]]
+) -> float:
+    return tax_rates()[country()]
+
+
+@flow_function()
+def price_with_tax(price: FlowFunction[float], tax_rate: FlowFunction[float]) -> float:
+    return price() * (1 + tax_rate())
+
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "price": FlowArgument(float),
+    "country": FlowArgument(str),
+    "tax_rate": tax_rate,
+    "price_with_tax": price_with_tax,
+}
+
+
+@flow(tax_rates=tax_rates, **configuration)
+def price_record(price_with_tax: FlowFunction[float]) -> float:
+    return price_with_tax()
+
+
+@flow(tax_rates=looked_up_tax_rates, **configuration)
+def price_looked_up_record(price_with_tax: FlowFunction[float]) -> float:
+    return price_with_tax()
+
+
+def records(count: int) -> Iterator[dict[str, Any]]:
+    for index in range(count):
+        yield {"price": float(index), "country": "HR" if index % 2 else "DE"}
+
+
+def measure(invoke: Callable[[], Any], count: int) -> float:
+    durations = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        invoke()
+        durations.append(time.perf_counter() - started)
+    return min(durations) / count * 1e6
+
+
+def main() -> None:
+    for name, invoke in (
+        ("loop", lambda: [price_record(**record) for record in records(RECORDS)]),
+        ("map", lambda: list(price_record.map(records(RECORDS)))),  # type: ignore[attr-defined]
+    ):
+        print(
+            f"{name:>10}: {measure(invoke, RECORDS):7.2f} us per record"
+            f" for {RECORDS} records"
+        )
+    for name, invoke in (
+        (
+            "loop",
+            lambda: [
+                price_looked_up_record(**record) for record in records(LOOKUP_RECORDS)
+            ],
+        ),
+        ("map", lambda: list(price_looked_up_record.map(records(LOOKUP_RECORDS)))),  # type: ignore[attr-defined]
+        (
+            "map shared",
+            lambda: list(
+                price_looked_up_record.map(  # type: ignore[attr-defined]
+                    records(LOOKUP_RECORDS), shared=["tax_rates"]
+                )
+            ),
+        ),
+    ):
+        print(
+            f"{name:>10}: {measure(invoke, LOOKUP_RECORDS):7.2f} us per record"
+            f" for {LOOKUP_RECORDS} records"
+            f" with a {LOOKUP_LATENCY * 1e3:.0f} ms tax rates lookup"
+        )
+
+
+if __name__ == "__main__":
+    main()
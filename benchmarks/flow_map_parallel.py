@@ -0,0 +1,83 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import multiprocessing
+import time
+from collections.abc import Callable
+from typing import Any
+
+from flow_compose import flow, flow_function, FlowArgument, FlowFunction
+
+RECORDS = 2_000
+WORKERS = 2
+CHUNKSIZE = 100
+LOOKUP_LATENCY = 0.001
+
+
+@flow_function(cached=True)
+def tax_rates() -> dict[str, float]:
+    time.sleep(LOOKUP_LATENCY)
+    return {"HR": 0.25, "DE": 0.19}
+
+
+@flow_function()
+def price_with_tax(
+    price: FlowFunction[float],
+    country: FlowFunction[str],
+    tax_rates: FlowFunction[dict[str, float]],
+) -> float:
+    return price() * (1 + tax_rates()[country()])
+
+
+@flow(
+    price=FlowArgument(float),
+    country=FlowArgument(str),
+    tax_rates=tax_rates,
+    price_with_tax=price_with_tax,
+)
+def price_record(price_with_tax: FlowFunction[float]) -> float:
+    return price_with_tax()
+
+
+records = [
+    {"price": float(index), "country": "HR" if index % 2 else "DE"}
+    for index in range(RECORDS)
+]
+
+
+def invoke_price_record(record: dict[str, Any]) -> float:
+    return price_record(**record)
+
+
+def pool_map() -> list[float]:
+    with multiprocessing.Pool(WORKERS) as pool:
+        return pool.map(invoke_price_record, records, chunksize=CHUNKSIZE)
+
+
+def map_parallel() -> list[float]:
+    return list(
+        price_record.map_parallel(  # type: ignore[attr-defined]
+            records, workers=WORKERS, chunksize=CHUNKSIZE, shared=["tax_rates"]
+        )
+    )
+
+
+def measure(invoke: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    invoke()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    for name, invoke in (
+        ("multiprocessing.Pool", pool_map),
+        ("map_parallel", map_parallel),
+    ):
+        print(
+            f"{name:>20}: {measure(invoke) * 1e3:8.1f} ms for {RECORDS} records,"
+            f" {WORKERS} workers and a {LOOKUP_LATENCY * 1e3:.0f} ms tax rates lookup"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from flow_compose import flow, flow_function, FlowFunction, FlowArgument, Flow
+
+
+@flow_function()
+def greeting_hello_world() -> str:
+    return "Hello, World!"
+
+
+@flow_function()
+def greet_using_greeting(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(
+    greeting=greeting_hello_world,
+)
+def hello_world(greet: FlowFunction[str] = greet_using_greeting) -> str:
+    return greet()
+
+
+@flow_function(cached=True)
+def user__using_user_email(user_email: FlowFunction[str]) -> str:
+    return user_email().split("@")[0]
+
+
+@flow_function(cached=True)
+def user_language__using_user(user: FlowFunction[str]) -> str:
+    return "en" if user() else "hr"
+
+
+@flow_function(cached=True)
+def greeting__using_user_language(
+    user: FlowFunction[str], user_language: FlowFunction[str]
+) -> str:
+    return f"Hello, {user()}!" if user_language() == "en" else f"Bok, {user()}!"
+
+
+@flow(
+    user_email=FlowArgument(str),
+    user=user__using_user_email,
+    user_language=user_language__using_user,
+    greeting=greeting__using_user_language,
+    greet=greet_using_greeting,
+)
+def greet_in_user_language__by_user_email(greet: FlowFunction[str]) -> str:
+    return greet()
+
+
+@flow(
+    greeting=Flow(hello_world, cached=True),
+)
+def hello_world_twice(greeting: FlowFunction[str]) -> str:
+    return f"{greeting()} {greeting()}"
+
+
+FLOWS: list[tuple[str, Callable[[], Any]]] = [
+    ("function composing another function", hello_world),
+    (
+        "cached functions with a flow argument",
+        lambda: greet_in_user_language__by_user_email(user_email="vinko@example.com"),
+    ),
+    ("flow composing another cached flow", hello_world_twice),
+]
+
+
+def main() -> None:
+    calls = 1_000
+    for name, invoke_flow in FLOWS:
+        invoke_flow()
+        tracemalloc.start()
+        allocated = 0
+        for _ in range(calls):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            invoke_flow()
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - current
+        tracemalloc.stop()
+        print(f"{name:>40}: {allocated / calls:8.1f} bytes allocated per invocation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import os
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from flow_compose import flow, flow_function, FlowFunction, FlowArgument
+
+INVOCATIONS = 3200
+
+
+@flow_function(cached=True)
+def prices(order_id: FlowFunction[int]) -> list[float]:
+    return [(order_id() * index) % 97 / 10 for index in range(2000)]
+
+
+@flow_function(cached=True)
+def discount(order_id: FlowFunction[int]) -> float:
+    return 0.1 if order_id() % 2 else 0.0
+
+
+@flow_function()
+def order_total(
+    prices: FlowFunction[list[float]], discount: FlowFunction[float]
+) -> float:
+    return sum(price * (1 - discount()) for price in prices())
+
+
+@flow_function(cached=True)
+def tax_rate(currency: str) -> float:
+    return 0.25
+
+
+@flow(
+    order_id=FlowArgument(int),
+    prices=prices,
+    discount=discount,
+    order_total=order_total,
+    tax_rate=tax_rate,
+)
+def cpu_heavy(order_total: FlowFunction[float], tax_rate: FlowFunction[float]) -> float:
+    return order_total() * (1 + tax_rate("EUR"))
+
+
+@flow_function()
+def step(index: int) -> int:
+    return index + 1
+
+
+@flow(
+    order_id=FlowArgument(int),
+    step=step,
+)
+def dispatch_heavy(order_id: FlowArgument[int], step: FlowFunction[int]) -> int:
+    value = order_id()
+    for index in range(200):
+        value = step(value)
+    return value
+
+
+def hand_written_cpu_heavy(order_id: int) -> float:
+    order_prices = [(order_id * index) % 97 / 10 for index in range(2000)]
+    order_discount = 0.1 if order_id % 2 else 0.0
+    return sum(price * (1 - order_discount) for price in order_prices) * (1 + 0.25)
+
+
+def hand_written_dispatch_heavy(order_id: int) -> int:
+    value = order_id
+    for index in range(200):
+        value = value + 1
+    return value
+
+
+def duration(flow_invoker: Callable[..., Any], threads: int, invocations: int) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        started = time.perf_counter()
+        list(
+            executor.map(
+                lambda order_id: flow_invoker(order_id=order_id), range(invocations)
+            )
+        )
+        return time.perf_counter() - started
+
+
+def speedups(
+    flow_invoker: Callable[..., Any], invocations: int
+) -> list[tuple[int, float, float]]:
+    # warm-up
+    duration(flow_invoker, 1, invocations // 10)
+    durations = [
+        (threads, duration(flow_invoker, threads, invocations))
+        for threads in (1, 2, 4, 8, 16)
+    ]
+    return [
+        (threads, invocations / threads_duration, durations[0][1] / threads_duration)
+        for threads, threads_duration in durations
+    ]
+
+
+def main() -> None:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]},"
+        f" GIL {'enabled' if is_gil_enabled else 'disabled'},"
+        f" {os.cpu_count()} CPUs"
+    )
+    for name, flow_invoker, hand_written, invocations in (
+        ("cpu heavy", cpu_heavy, hand_written_cpu_heavy, INVOCATIONS),
+        (
+            "dispatch heavy",
+            dispatch_heavy,
+            hand_written_dispatch_heavy,
+            INVOCATIONS * 4,
+        ),
+    ):
+        for (threads, throughput, speedup), (_, _, hand_written_speedup) in zip(
+            speedups(flow_invoker, invocations), speedups(hand_written, invocations)
+        ):
+            print(
+                f"{name:>14}, {threads:>2} threads:"
+                f" {throughput:8.0f} invocations/s,"
+                f" {speedup:5.2f}x speedup,"
+                f" {hand_written_speedup:5.2f}x hand-written speedup"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import statistics
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from flow_compose import flow, flow_function, FlowFunction
+
+INVOCATIONS = 100
+LOOKUP_LATENCY = 0.002
+
+executor = ThreadPoolExecutor(max_workers=4)
+
+
+@flow_function(cached=True, io_bound=True)
+def user() -> str:
+    time.sleep(LOOKUP_LATENCY)
+    return "Vinko"
+
+
+@flow_function(cached=True, io_bound=True)
+def permissions() -> list[str]:
+    time.sleep(LOOKUP_LATENCY)
+    return ["greet"]
+
+
+@flow_function(cached=True, io_bound=True)
+def tenant() -> str:
+    time.sleep(LOOKUP_LATENCY)
+    return "execution-flows"
+
+
+@flow_function(cached=True, io_bound=True)
+def locale() -> str:
+    time.sleep(LOOKUP_LATENCY)
+    return "hr"
+
+
+@flow_function()
+def greeting(
+    user: FlowFunction[str],
+    permissions: FlowFunction[list[str]],
+    tenant: FlowFunction[str],
+    locale: FlowFunction[str],
+) -> str:
+    return f"{user()} {permissions()} {tenant()} {locale()}"
+
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "user": user,
+    "permissions": permissions,
+    "tenant": tenant,
+    "locale": locale,
+    "greeting": greeting,
+}
+
+
+@flow(**configuration)
+def sequential(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(executor=executor, **configuration)
+def concurrent(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+def p50(invoke_flow: Callable[[], Any]) -> float:
+    durations = []
+    for _ in range(INVOCATIONS):
+        started = time.perf_counter()
+        invoke_flow()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def main() -> None:
+    for name, invoke_flow in (("sequential", sequential), ("executor", concurrent)):
+        print(
+            f"{name:>10}: {p50(invoke_flow) * 1e3:.2f} ms p50"
+            f" for 4 independent {LOOKUP_LATENCY * 1e3:.0f} ms lookups"
+        )
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
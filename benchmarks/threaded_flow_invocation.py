@@ -0,0 +1,61 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from flow_compose import flow, flow_function, FlowFunction, FlowArgument
+
+INVOCATIONS = 2000
+QUERY_LATENCY = 0.0005
+
+
+@flow_function(cached=True)
+def user(user_id: FlowFunction[int]) -> str:
+    # a blocking query releases the GIL
+    time.sleep(QUERY_LATENCY)
+    return f"user {user_id()}"
+
+
+@flow(
+    user_id=FlowArgument(int),
+    user=user,
+)
+def greet(user: FlowFunction[str]) -> str:
+    return f"Hello, {user()}!"
+
+
+# flow arguments used to be set on the shared FlowArgument objects,
+#  so concurrent invocations of a flow had to be serialized
+flow_lock = threading.Lock()
+
+
+def greet_serialized(user_id: int) -> str:
+    with flow_lock:
+        return greet(user_id=user_id)
+
+
+def throughput(greet_flow: Callable[..., str], threads: int) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        started = time.perf_counter()
+        list(
+            executor.map(
+                lambda user_id: greet_flow(user_id=user_id), range(INVOCATIONS)
+            )
+        )
+        return INVOCATIONS / (time.perf_counter() - started)
+
+
+def main() -> None:
+    for threads in (1, 2, 4, 8, 16):
+        print(
+            f"{threads:>2} threads:"
+            f" {throughput(greet_serialized, threads):8.0f} invocations/s serialized,"
+            f" {throughput(greet, threads):8.0f} invocations/s concurrent"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy
+
+from flow_compose import flow, flow_function, FlowArgument, FlowFunction
+
+RECORDS = 100_000
+REPEAT = 5
+
+
+@flow_function(vectorized=True)
+def price_with_tax(price: FlowFunction[Any], tax_rate: FlowFunction[Any]) -> Any:
+    return price() * (1 + tax_rate())
+
+
+@flow_function(vectorized=True)
+def rounded_price(price_with_tax: FlowFunction[Any]) -> Any:
+    return numpy.round(price_with_tax(), 2)
+
+
+@flow_function()
+def price_label(rounded_price: FlowFunction[float]) -> str:
+    return f"{rounded_price():.2f} EUR"
+
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "price": FlowArgument(float),
+    "tax_rate": FlowArgument(float, default=0.25),
+    "price_with_tax": price_with_tax,
+    "rounded_price": rounded_price,
+    "price_label": price_label,
+}
+
+
+@flow(**configuration)
+def price_record(rounded_price: FlowFunction[Any]) -> Any:
+    return rounded_price()
+
+
+@flow(**configuration)
+def price_label_record(price_label: FlowFunction[str]) -> str:
+    return price_label()
+
+
+def measure(invoke: Callable[[], Any]) -> float:
+    durations = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        invoke()
+        durations.append(time.perf_counter() - started)
+    return min(durations) * 1e3
+
+
+def main() -> None:
+    prices = numpy.arange(RECORDS, dtype=numpy.float64)
+    records = [{"price": price} for price in prices.tolist()]
+    flows: tuple[tuple[str, Any], ...] = (
+        ("vectorized", price_record),
+        ("per row", price_label_record),
+    )
+    for flow_name, flow_invoker in flows:
+        for name, invoke in (
+            ("map", lambda: list(flow_invoker.map(records))),
+            ("map_columns", lambda: flow_invoker.map_columns({"price": prices})),
+        ):
+            print(
+                f"{flow_name:>10} {name:>11}: {measure(invoke):8.1f} ms"
+                f" for {RECORDS} records"
+            )
+
+
+if __name__ == "__main__":
+    main()
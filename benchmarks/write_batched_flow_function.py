@@ -0,0 +1,55 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import time
+
+from flow_compose import flow, flow_function, FlowFunction
+
+WRITES = 50
+ROUND_TRIP_LATENCY = 0.0005
+round_trips = 0
+
+
+def insert_audit_rows(rows: list[str]) -> None:
+    global round_trips
+    round_trips += 1
+    time.sleep(ROUND_TRIP_LATENCY)
+
+
+@flow_function()
+def audit_log(row: str) -> None:
+    insert_audit_rows([row])
+
+
+@flow_function(write_batched=True)
+def write_batched_audit_log(rows: list[str]) -> None:
+    insert_audit_rows(rows)
+
+
+def process_items(audit_log: FlowFunction[None]) -> None:
+    for item in range(WRITES):
+        audit_log(f"processed {item}")
+
+
+per_call = flow(audit_log=audit_log)(process_items)
+write_batched = flow(audit_log=write_batched_audit_log)(process_items)
+
+
+def main() -> None:
+    global round_trips
+    for name, process_flow in (
+        ("per call", per_call),
+        ("write batched", write_batched),
+    ):
+        round_trips = 0
+        started = time.perf_counter()
+        process_flow()
+        elapsed = time.perf_counter() - started
+        print(
+            f"{name:>13}: {round_trips:2} round-trips for {WRITES} writes,"
+            f" {elapsed * 1e3:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
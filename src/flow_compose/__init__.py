@@ -8,6 +8,14 @@ from flow_compose.implementation.classes.flow_argument import FlowArgument
 from flow_compose.implementation.classes.flow_function import FlowFunction
 from flow_compose.implementation.decorators.flow import decorator as flow
 from flow_compose.implementation.classes.flow import Flow
+from flow_compose.implementation.classes.base.flow_function_invoker import (
+    FlowContext,
+)
+from flow_compose.implementation.cache_keys import (
+    attribute_key,
+    identity_key,
+    protocol_key,
+)
 from flow_compose.types import ReturnType
 
 
@@ -17,5 +25,9 @@ __all__ = [
     "FlowFunction",
     "FlowArgument",
     "Flow",
+    "FlowContext",
     "ReturnType",
+    "attribute_key",
+    "identity_key",
+    "protocol_key",
 ]
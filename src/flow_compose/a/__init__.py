@@ -9,6 +9,15 @@ from flow_compose.implementation.classes.a.flow_argument import FlowArgument
 from flow_compose.implementation.classes.a.flow_function import FlowFunction
 from flow_compose.implementation.decorators.a.flow import decorator as flow
 from flow_compose.implementation.classes.a.flow import Flow
+from flow_compose.implementation.classes.base.flow_function_invoker import (
+    FlowContext,
+)
+from flow_compose.implementation.classes.base.flow_profile import FlowProfile
+from flow_compose.implementation.cache_keys import (
+    attribute_key,
+    identity_key,
+    protocol_key,
+)
 from flow_compose.types import ReturnType
 
 
@@ -18,5 +27,10 @@ __all__ = [
     "FlowFunction",
     "FlowArgument",
     "Flow",
+    "FlowContext",
+    "FlowProfile",
     "ReturnType",
+    "attribute_key",
+    "identity_key",
+    "protocol_key",
 ]
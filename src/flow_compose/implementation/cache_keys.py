@@ -0,0 +1,59 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class ArgumentCacheKey:
+    """A cache key strategy that replaces each argument with its own key.
+
+    Arguments are mapped before the call is normalized, so positional,
+    keyword and omitted default arguments of the same call
+    still share a cache entry.
+    """
+
+    __slots__ = ("argument_key",)
+
+    def __init__(self, argument_key: Callable[[Any], Hashable]) -> None:
+        self.argument_key = argument_key
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Hashable:
+        argument_key = self.argument_key
+        return tuple(argument_key(value) for value in args), frozenset(
+            (name, argument_key(value)) for name, value in kwargs.items()
+        )
+
+
+class _Identity:
+    """Compares by identity and keeps the object alive, so its id is not reused."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def _flow_cache_key(value: Any) -> Hashable:
+    flow_cache_key = getattr(type(value), "__flow_cache_key__", None)
+    return value if flow_cache_key is None else flow_cache_key(value)
+
+
+identity_key = ArgumentCacheKey(_Identity)
+"""Caches by the identity of the arguments; works for unhashable arguments."""
+
+protocol_key = ArgumentCacheKey(_flow_cache_key)
+"""Caches by `__flow_cache_key__()` of the arguments that define it."""
+
+
+def attribute_key(attribute_name: str) -> ArgumentCacheKey:
+    """Caches by the `attribute_name` attribute of the arguments that have it."""
+    return ArgumentCacheKey(
+        lambda value: getattr(value, attribute_name, value),
+    )
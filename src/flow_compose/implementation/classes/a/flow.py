@@ -4,14 +4,18 @@
 import inspect
 from typing import Generic, Callable, Any, Awaitable
 
+from flow_compose.implementation.classes import base
 from flow_compose.implementation.classes.a.flow_function import FlowFunction
 from flow_compose.implementation.classes.a.flow_function_invoker import (
     FlowFunctionInvoker,
 )
+from flow_compose.implementation.helpers import gather_fail_fast
 from flow_compose.types import ReturnType
 
 
 class Flow(FlowFunction[ReturnType], Generic[ReturnType]):
+    __slots__ = ()
+
     def __init__(
         self,
         flow: Callable[..., Awaitable[ReturnType]],
@@ -22,20 +26,51 @@ class Flow(FlowFunction[ReturnType], Generic[ReturnType]):
             cached=cached,
         )
 
-    async def __call__(self, *args: Any, **kwargs: Any) -> ReturnType:
-        flow_context = kwargs["__flow_context"]
-        for parameter in self.parameters:
-            if parameter.name not in kwargs and (
-                parameter.name in flow_context
-                or parameter.default is not inspect.Parameter.empty
-            ):
-                if parameter.name in flow_context:
-                    kwarg = flow_context[parameter.name]
-                else:
-                    kwarg = parameter.default
-                kwargs[parameter.name] = (
-                    await kwarg() if isinstance(kwarg, FlowFunctionInvoker) else kwarg
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by reference to the flow."""
+        return type(self), (self._flow_function, self.cached)
+
+    def bind(
+        self, flow_context: base.FlowContext
+    ) -> Callable[..., Awaitable[ReturnType]]:
+        context_parameters = [
+            (
+                parameter.name,
+                flow_context[parameter.name]
+                if flow_context.has_flow_function(parameter.name)
+                else parameter.default,
+            )
+            for parameter in self.parameters
+            if flow_context.has_flow_function(parameter.name)
+            or parameter.default is not inspect.Parameter.empty
+        ]
+
+        concurrent = flow_context.concurrent
+
+        async def flow_with_flow_context(*args: Any, **kwargs: Any) -> ReturnType:
+            if concurrent:
+                invoked_parameters = []
+                for parameter_name, kwarg in context_parameters:
+                    if parameter_name in kwargs:
+                        continue
+                    if isinstance(kwarg, FlowFunctionInvoker):
+                        invoked_parameters.append((parameter_name, kwarg))
+                    else:
+                        kwargs[parameter_name] = kwarg
+                values = await gather_fail_fast(
+                    *(kwarg() for _, kwarg in invoked_parameters)
                 )
+                for (parameter_name, _), value in zip(invoked_parameters, values):
+                    kwargs[parameter_name] = value
+                return await self._flow_function(*args, **kwargs)
+
+            for parameter_name, kwarg in context_parameters:
+                if parameter_name not in kwargs:
+                    kwargs[parameter_name] = (
+                        await kwarg()
+                        if isinstance(kwarg, FlowFunctionInvoker)
+                        else kwarg
+                    )
+            return await self._flow_function(*args, **kwargs)
 
-        del kwargs["__flow_context"]
-        return await super().__call__(*args, **kwargs)
+        return flow_with_flow_context
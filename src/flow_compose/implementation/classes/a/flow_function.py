@@ -1,12 +1,98 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
-from typing import Generic, Any, Awaitable
+import asyncio
+import functools
+from typing import Generic, Any, Awaitable, Callable
 
 from flow_compose.implementation.classes import base
+from flow_compose.implementation.classes.base.flow_function_invoker import (
+    EMPTY_FLOW_CONTEXT,
+)
+from flow_compose.implementation.classes.base.flow_function_batch import (
+    FlowFunctionBatch,
+)
+from flow_compose.implementation.classes.base.flow_function_process import (
+    AwaitableFlowFunctionValue,
+    call_in_process,
+    dependencies,
+    process_pool,
+)
 from flow_compose.types import ReturnType
 
 
 class FlowFunction(base.FlowFunction[Awaitable[ReturnType]], Generic[ReturnType]):
+    __slots__ = ()
+
     async def __call__(self, *args: Any, **kwargs: Any) -> ReturnType:
-        return await self._flow_function(*args, **kwargs)
+        return await self.bind(EMPTY_FLOW_CONTEXT)(*args, **kwargs)
+
+    def bind(
+        self, flow_context: base.FlowContext
+    ) -> Callable[..., Awaitable[ReturnType]]:
+        bound_flow_function = super().bind(flow_context)
+        if self.executor == "process":
+            bound_flow_function = functools.partial(
+                self._call_in_process, bound_flow_function
+            )
+        if self.write_batched:
+            return self._bind_write_batch(flow_context, bound_flow_function)
+        if not self.batched:
+            return bound_flow_function
+        # calls with a single key are collected into a batch
+        batch = (
+            FlowFunctionBatch(self.name)
+            if self.process_batches is None
+            else self.process_batches.batch()
+        )
+        return functools.partial(batch.call, bound_flow_function)
+
+    async def _call_in_process(
+        self,
+        bound_flow_function: Callable[..., Awaitable[ReturnType]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ReturnType:
+        """Call the flow function in the process pool with its dependency values.
+
+        The dependencies are resolved in this process, so the worker process
+        does not need the flow context.
+        """
+        dependency_args, dependency_kwargs = dependencies(bound_flow_function)
+        dependency_values = tuple(
+            [
+                AwaitableFlowFunctionValue(await dependency())
+                for dependency in dependency_args
+            ]
+        )
+        dependency_keyword_values = {
+            name: AwaitableFlowFunctionValue(await dependency())
+            for name, dependency in dependency_kwargs.items()
+        }
+        result: ReturnType = await asyncio.get_running_loop().run_in_executor(
+            process_pool(),
+            call_in_process,
+            self,
+            dependency_values + args,
+            {**dependency_keyword_values, **kwargs},
+        )
+        return result
+
+    @staticmethod
+    def _bind_write_batch(
+        flow_context: base.FlowContext,
+        bound_flow_function: Callable[..., Awaitable[ReturnType]],
+    ) -> Callable[..., Awaitable[None]]:
+        if flow_context is EMPTY_FLOW_CONTEXT:
+            # outside a flow invocation values are written one by one
+            async def write(value: Any) -> None:
+                await bound_flow_function([value])
+
+            return write
+
+        write_batch = flow_context.add_write_batch(bound_flow_function)
+
+        async def buffer(value: Any) -> None:
+            write_batch.write(value)
+
+        return buffer
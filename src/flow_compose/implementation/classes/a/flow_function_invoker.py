@@ -1,32 +1,176 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import functools
+from collections.abc import Hashable, Iterable, Sequence
+from concurrent import futures
 from typing import Generic, Any
 
 from flow_compose.implementation.classes import base
-from flow_compose.implementation.classes.a.flow_argument import FlowArgument
+from flow_compose.implementation.classes.base.flow_function_batch import (
+    FlowFunctionWriteBatch,
+)
+from flow_compose.implementation.classes.base.flow_function_invoker import CACHE_MISS
 from flow_compose.implementation.classes.a.flow_function import FlowFunction
+from flow_compose.implementation.helpers import gather_fail_fast
 from flow_compose.types import ReturnType
 
 
 class FlowFunctionInvoker(
     base.FlowFunctionInvoker[FlowFunction[ReturnType], ReturnType], Generic[ReturnType]
 ):
+    __slots__ = ("_pending_calls",)
+
+    def __init__(
+        self,
+        flow_function: FlowFunction[ReturnType],
+        flow_context: base.FlowContext,
+    ) -> None:
+        super().__init__(flow_function, flow_context)
+        # futures of the cached calls in progress by cache key,
+        #  looked up on the first cache miss
+        self._pending_calls: dict[Hashable, asyncio.Future[ReturnType]] | None = None
+
+    def reset(self) -> None:
+        super().reset()
+        self._pending_calls = None
+
     async def __call__(self, *args: Any, **kwargs: Any) -> ReturnType:
-        if not self._flow_function.cached:
-            if not isinstance(self._flow_function, FlowArgument):
-                kwargs["__flow_context"] = self._flow_context
-            return await self._flow_function(*args, **kwargs)
+        bound_flow_function = self._bound_flow_function or self._bind()
+        flow_function = self._flow_function
+        if not flow_function.cached:
+            return await bound_flow_function(*args, **kwargs)
 
-        values_for_hash = tuple(v for v in args + tuple(kwargs.values()))
-        cache_hash = hash(values_for_hash)
-        if cache_hash in self._flow_function_cache:
-            return self._flow_function_cache[cache_hash]
+        cache_key = (
+            flow_function.cache_key(args, kwargs)
+            if args or kwargs
+            else flow_function.empty_call_cache_key
+        )
+        result = self._flow_function_cache.get(cache_key, CACHE_MISS)
+        if result is not CACHE_MISS:
+            return result
 
-        kwargs["__flow_context"] = self._flow_context
+        coalesced_calls = flow_function.coalesced_calls
+        pending_calls = self._pending_calls
+        if pending_calls is None:
+            pending_calls = self._pending_calls = (
+                {} if coalesced_calls is None else coalesced_calls.pending_calls()
+            )
 
-        result = await self._flow_function(*args, **kwargs)
+        # concurrent callers await the call in progress instead of repeating it
+        while (pending_call := pending_calls.get(cache_key)) is not None:
+            try:
+                result = await asyncio.shield(pending_call)
+            except asyncio.CancelledError:
+                if not pending_call.cancelled():
+                    raise
+                # the leading caller was cancelled, so the next caller leads
+                continue
+            finally:
+                if coalesced_calls is not None and not pending_call.cancelled():
+                    coalesced_calls.add_coalesced()
+            if self._flow_function_cache is not flow_function.process_cache:
+                # a leading call of another flow invocation cached it in its own cache
+                self._flow_function_cache[cache_key] = result
+            return result
 
-        self._flow_function_cache[cache_hash] = result
+        if coalesced_calls is not None:
+            coalesced_calls.add_executed()
+        pending_call = asyncio.get_running_loop().create_future()
+        pending_calls[cache_key] = pending_call
+        try:
+            result = await bound_flow_function(*args, **kwargs)
+        except Exception as exception:
+            pending_call.set_exception(exception)
+            # the waiting callers re-raise the exception, nobody else retrieves it
+            pending_call.exception()
+            raise
+        except BaseException:
+            pending_call.cancel()
+            raise
+        finally:
+            del pending_calls[cache_key]
+
+        self._flow_function_cache[cache_key] = result
+        pending_call.set_result(result)
 
         return result
+
+    def prefetch(self, executor: futures.Executor | None) -> asyncio.Task[ReturnType]:
+        assert executor is None, (
+            "Async flow functions are prefetched as tasks and do not use an executor."
+        )
+        prefetched_call = asyncio.get_running_loop().create_task(self())
+        prefetched_call.add_done_callback(_retrieve_exception)
+        return prefetched_call
+
+    def speculate(self) -> asyncio.Task[ReturnType]:
+        """Start the call without arguments; see `FlowContext.speculate`."""
+        speculative_invoker = type(self)(self._flow_function, self._flow_context)
+        speculative_invoker._flow_function_cache = self._flow_function_cache
+        if self._pending_calls is None:
+            coalesced_calls = self._flow_function.coalesced_calls
+            self._pending_calls = (
+                {} if coalesced_calls is None else coalesced_calls.pending_calls()
+            )
+        speculative_invoker._pending_calls = self._pending_calls
+        return speculative_invoker.prefetch(None)
+
+    @staticmethod
+    async def flush_write_batches(
+        write_batches: Sequence[FlowFunctionWriteBatch],
+    ) -> None:
+        for write_batch in write_batches:
+            values = write_batch.take()
+            if values:
+                await write_batch.bulk_flow_function(values)
+
+
+def _retrieve_exception(prefetched_call: asyncio.Task[Any]) -> None:
+    # the exception is raised by the later calls, not reported as never retrieved
+    if not prefetched_call.cancelled():
+        prefetched_call.exception()
+
+
+async def prefetch_flow_function_invokers(
+    flow_function_invokers: Iterable[Any],
+) -> None:
+    """Resolve the cached flow functions callable without arguments concurrently.
+
+    Their results are cached, so the later calls from the function body
+    do not execute them again. A single candidate is left to the body.
+    """
+    prefetched_invokers = [
+        flow_function_invoker
+        for flow_function_invoker in flow_function_invokers
+        if isinstance(flow_function_invoker, FlowFunctionInvoker)
+        and flow_function_invoker._flow_function.cached
+        and flow_function_invoker._flow_function.callable_without_arguments
+    ]
+    if len(prefetched_invokers) > 1:
+        await gather_fail_fast(
+            *(flow_function_invoker() for flow_function_invoker in prefetched_invokers)
+        )
+
+
+class ConcurrentFlowFunctionInvoker(FlowFunctionInvoker[ReturnType]):
+    """Resolves independent dependencies of a flow function concurrently.
+
+    Before the first call of the flow function in a flow invocation,
+    its cached dependencies callable without arguments are resolved together.
+    """
+
+    __slots__ = ()
+
+    concurrent = True
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> ReturnType:
+        if self._bound_flow_function is None:
+            bound_flow_function = self._bind()
+            if isinstance(bound_flow_function, functools.partial):
+                # `bind` binds the dependency invokers with a partial
+                await prefetch_flow_function_invokers(
+                    (*bound_flow_function.args, *bound_flow_function.keywords.values())
+                )
+        return await super().__call__(*args, **kwargs)
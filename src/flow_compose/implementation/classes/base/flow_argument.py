@@ -3,13 +3,20 @@
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import inspect
 from types import UnionType
-from typing import Generic, Any
+from typing import Generic, Any, TYPE_CHECKING
 
 from flow_compose.implementation.classes.base.flow_function import FlowFunction
 from flow_compose.types import ReturnType
 
+if TYPE_CHECKING:
+    from flow_compose.implementation.classes.base.flow_function_invoker import (
+        FlowContext,
+    )
+
 
 class FlowArgument(FlowFunction[ReturnType], Generic[ReturnType]):
+    __slots__ = ("__default", "__name", "_argument_type")
+
     def __init__(
         self,
         argument_type: type[ReturnType] | UnionType,
@@ -23,6 +30,13 @@ class FlowArgument(FlowFunction[ReturnType], Generic[ReturnType]):
             cached=False,
         )
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by value; flow arguments are created in flow configurations."""
+        return type(self), (self._argument_type, self.__default), self.__name
+
+    def __setstate__(self, name: str | None) -> None:
+        self.__name = name
+
     @property
     def value_or_empty(self) -> ReturnType | Any:
         return self.__default
@@ -36,6 +50,17 @@ class FlowArgument(FlowFunction[ReturnType], Generic[ReturnType]):
     def value(self, value: ReturnType) -> None:
         self.__default = value
 
+    def invocation_value(self, flow_context: "FlowContext") -> ReturnType:
+        """The value of the flow argument in the flow invocation of the flow context.
+
+        Flow arguments are shared by all invocations of a flow,
+        so their values are passed to each invocation in its flow context.
+        """
+        flow_arguments = flow_context.flow_arguments
+        if flow_arguments is not None and self.__name in flow_arguments:
+            return flow_arguments[self.__name]
+        return self.value
+
     @property
     def name(self) -> str:
         assert self.__name is not None
@@ -0,0 +1,263 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from flow_compose.implementation.classes.base.flow_argument import FlowArgument
+from flow_compose.implementation.classes.base.flow_function import FlowFunction
+from flow_compose.implementation.classes.base.flow_function_invoker import (
+    CACHE_MISS,
+    FlowContext,
+    FlowFunctionInvoker,
+)
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment, unused-ignore]
+
+
+def column_length(value: Any) -> int | None:
+    """The length of a column value; None for values that cannot be columns."""
+    if isinstance(value, (str, bytes, Mapping)) or not hasattr(value, "__getitem__"):
+        return None
+    try:
+        return len(value)
+    except TypeError:
+        # zero-dimensional arrays have no length
+        return None
+
+
+def repeated_column(value: Any, length: int) -> Any:
+    """A column of the value repeated; a NumPy array, or a list without NumPy."""
+    if numpy is None or numpy.ndim(value) != 0:
+        return [value] * length
+    return numpy.full(length, value)
+
+
+def depends_on_flow_arguments(
+    flow_function: FlowFunction[Any],
+    flow_functions: Callable[[str], FlowFunction[Any] | None],
+    flow_functions_dependence: dict[FlowFunction[Any], bool],
+) -> bool:
+    """Whether the flow function depends on flow arguments, directly or not.
+
+    `flow_functions` resolves the aliases of the dependencies, e.g.
+    `FlowContext.flow_function`; unresolved aliases are not dependencies.
+    Arguments named like an alias count as dependencies, which covers
+    the arguments that composed flows take from the flow context.
+    Flow functions with a FlowContext argument are assumed to depend on them.
+    `flow_functions_dependence` keeps the results of the flow functions visited.
+    """
+    depends = flow_functions_dependence.get(flow_function)
+    if depends is not None:
+        return depends
+    # a dependency cycle is resolved as a dependency on flow arguments
+    flow_functions_dependence[flow_function] = True
+    if (
+        isinstance(flow_function, FlowArgument)
+        or flow_function._flow_context_parameter_name is not None
+    ):
+        return True
+    dependencies = [
+        default_flow_function
+        if default_flow_function is not None
+        else flow_functions(flow_function_name)
+        for flow_function_name, default_flow_function in (
+            flow_function._flow_functions_arguments
+        )
+    ] + [flow_functions(parameter.name) for parameter in flow_function.parameters]
+    depends = any(
+        depends_on_flow_arguments(dependency, flow_functions, flow_functions_dependence)
+        for dependency in dependencies
+        if dependency is not None
+    )
+    flow_functions_dependence[flow_function] = depends
+    return depends
+
+
+class FlowColumns:
+    """The state of a flow invocation with columns of flow argument values.
+
+    Flow arguments passed as single values are repeated to columns.
+    Only the flow argument columns, the columns returned by vectorized
+    flow functions and the lists of the results of the rows are columns;
+    other values are single values, whatever their length.
+    Vectorized flow functions are called with the whole columns; called without
+    arguments, they are called once and the rows take their values from the column.
+    Other flow functions that depend on flow arguments are called once per row,
+    in a flow context of the row, and return the list of the results.
+    The rest are called once, like in a flow invocation with single values.
+    """
+
+    __slots__ = (
+        "length",
+        "_flow_context",
+        "_columns",
+        "_row_flow_function_invoker_class",
+        "_row_value_invoker_class",
+        "_row_contexts",
+        "_row_invokers",
+        "_column_flow_functions",
+        "_vectorized_columns",
+    )
+
+    def __init__(
+        self,
+        flow_context: FlowContext,
+        columns: Mapping[str, Any],
+        length: int,
+        row_flow_function_invoker_class: type[FlowFunctionInvoker[Any, Any]],
+        row_value_invoker_class: Callable[..., FlowFunctionInvoker[Any, Any]],
+    ) -> None:
+        self.length = length
+        self._flow_context = flow_context
+        self._row_flow_function_invoker_class = row_flow_function_invoker_class
+        # invokes a vectorized flow function in the flow context of a row
+        self._row_value_invoker_class = row_value_invoker_class
+        if flow_context.flow_arguments is not None:
+            for name, value in flow_context.flow_arguments.items():
+                if name not in columns:
+                    flow_context.flow_arguments[name] = repeated_column(value, length)
+        # columns of the invocation by their id, which they keep alive
+        self._columns = {
+            id(column): column
+            for column in (
+                *columns.values(),
+                *(flow_context.flow_arguments or {}).values(),
+            )
+        }
+        # flow contexts of the rows, created on the first call made per row
+        self._row_contexts: list[FlowContext] | None = None
+        # invokers of the flow function in the flow contexts of the rows
+        #  by its invoker in the flow context of the invocation
+        self._row_invokers: dict[FlowFunctionInvoker[Any, Any], list[Any]] = {}
+        # whether a flow function depends on flow arguments
+        self._column_flow_functions: dict[FlowFunction[Any], bool] = {}
+        # columns returned by the vectorized flow functions called without arguments
+        self._vectorized_columns: dict[FlowFunctionInvoker[Any, Any], Any] = {}
+
+    def is_column(self, value: Any) -> bool:
+        return id(value) in self._columns
+
+    def add_column(self, column: Any) -> Any:
+        """Mark the value returned by a flow function as a column."""
+        self._columns[id(column)] = column
+        return column
+
+    def depends_on_columns(self, flow_function: FlowFunction[Any]) -> bool:
+        return depends_on_flow_arguments(
+            flow_function, self._flow_context.flow_function, self._column_flow_functions
+        )
+
+    def vectorized_column(
+        self,
+        flow_function_invoker: FlowFunctionInvoker[Any, Any],
+        call: Callable[[], Any],
+    ) -> Any:
+        """The column returned by the vectorized flow function called without arguments."""
+        column = self._vectorized_columns.get(flow_function_invoker, CACHE_MISS)
+        if column is CACHE_MISS:
+            column = self._vectorized_columns[flow_function_invoker] = self.add_column(
+                call()
+            )
+        return column
+
+    def call_rows(
+        self,
+        flow_function_invoker: FlowFunctionInvoker[Any, Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[Any]:
+        """Call the flow function once per row with the row values of the columns."""
+        row_invokers = self._row_invokers.get(flow_function_invoker)
+        if row_invokers is None:
+            flow_function_name = next(
+                (
+                    flow_function_name
+                    for flow_function_name, invoker in self._flow_context.items()
+                    if invoker is flow_function_invoker
+                ),
+                None,
+            )
+            row_invokers = self._row_invokers[flow_function_invoker] = [
+                row_context[flow_function_name]
+                if flow_function_name is not None
+                else row_context.create_flow_function_invoker(
+                    flow_function_invoker._flow_function
+                )
+                for row_context in self._get_row_contexts()
+            ]
+        column_args = [self.is_column(arg) for arg in args]
+        column_kwargs = {name: self.is_column(kwarg) for name, kwarg in kwargs.items()}
+        return self.add_column(
+            [
+                row_invoker(
+                    *(
+                        arg[row] if is_column else arg
+                        for arg, is_column in zip(args, column_args)
+                    ),
+                    **{
+                        name: kwarg[row] if column_kwargs[name] else kwarg
+                        for name, kwarg in kwargs.items()
+                    },
+                )
+                for row, row_invoker in enumerate(row_invokers)
+            ]
+        )
+
+    def _get_row_contexts(self) -> list[FlowContext]:
+        if self._row_contexts is None:
+            self._row_contexts = [
+                self._create_row_context(row) for row in range(self.length)
+            ]
+        return self._row_contexts
+
+    def _create_row_context(self, row: int) -> FlowContext:
+        flow_context = self._flow_context
+        row_context = FlowContext(
+            flow_functions_configuration=flow_context._flow_functions_configuration,
+            flow_function_invoker_class=self._row_flow_function_invoker_class,
+        )
+        row_context.flow_arguments = {
+            name: value[row]
+            for name, value in (flow_context.flow_arguments or {}).items()
+        }
+        # flow arguments and default flow functions of the flow body
+        #  are not in the configuration
+        for flow_function_name, flow_function_invoker in flow_context.items():
+            if flow_function_name not in flow_context._flow_functions_configuration:
+                row_context[flow_function_name] = (
+                    row_context.create_flow_function_invoker(
+                        flow_function_invoker._flow_function
+                    )
+                )
+        for (
+            flow_function_name,
+            flow_function,
+        ) in flow_context._flow_functions_configuration.items():
+            if flow_function.vectorized:
+                row_context[flow_function_name] = self._row_value_invoker_class(
+                    flow_function=flow_function,
+                    flow_context=row_context,
+                    columns=self,
+                    column_invoker=flow_context[flow_function_name],
+                    row=row,
+                )
+        return row_context
+
+    def flush(self) -> None:
+        """Write the values buffered by the write batched flow functions of the rows."""
+        for row_context in self._row_contexts or ():
+            if row_context.write_batches is not None:
+                row_context.flush()
+
+    def close(self) -> None:
+        for row_context in self._row_contexts or ():
+            row_context.close()
+        self._row_contexts = None
+        self._row_invokers.clear()
+        self._vectorized_columns.clear()
+        self._columns.clear()
@@ -1,31 +1,510 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import functools
 import inspect
-from functools import cached_property
-from typing import Generic, Callable, TypeVar
+import pickle
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Any, Generic, Callable, Literal, TypeVar, TYPE_CHECKING
 
+from flow_compose.implementation.cache_keys import ArgumentCacheKey
+from flow_compose.implementation.classes.base.flow_function_cache import (
+    FlowFunctionCache,
+    FlowFunctionCacheInfo,
+    FlowFunctionCoalescedCalls,
+    FlowFunctionCoalesceInfo,
+)
+from flow_compose.implementation.classes.base.flow_function_batch import (
+    FlowFunctionBatchInfo,
+    FlowFunctionBatches,
+)
+from flow_compose.implementation.helpers import import_qualified_name
 from flow_compose.types import ReturnType
 
+if TYPE_CHECKING:
+    from flow_compose.implementation.classes.base.flow_function_invoker import (
+        FlowContext,
+    )
+
 
 class FlowFunction(Generic[ReturnType]):
+    __slots__ = (
+        "_flow_function",
+        "_flow_function_signature",
+        "_flow_functions_parameters",
+        "_flow_functions_arguments",
+        "_positional_flow_functions_arguments",
+        "_flow_context_parameter_name",
+        "_shared_results_description",
+        "_parameters",
+        "_cache_key_signature",
+        "_positional_cache_key_length",
+        "_cache_key_defaults",
+        "_positional_parameters_count",
+        "_key",
+        "cache_key",
+        "empty_call_cache_key",
+        "cached",
+        "process_cache",
+        "_invocation_cache_limits",
+        "coalesced_calls",
+        "batched",
+        "process_batches",
+        "write_batched",
+        "io_bound",
+        "executor",
+        "vectorized",
+        "column_parameters",
+        "callable_without_arguments",
+    )
+
     def __init__(
         self,
         flow_function: Callable[..., ReturnType],
-        cached: bool,
+        cached: bool | Literal["process"],
+        flow_functions_parameters: Sequence[inspect.Parameter] = (),
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        maxbytes: int | None = None,
+        key: Callable[..., Hashable] | None = None,
+        coalesce: bool = False,
+        flow_context_parameter_name: str | None = None,
+        batched: bool | Literal["process"] = False,
+        write_batched: bool = False,
+        io_bound: bool = False,
+        executor: Literal["process"] | None = None,
+        vectorized: bool = False,
     ):
+        assert cached in (False, True, "process"), (
+            f"`cached` must be a boolean or 'process', got {cached!r}."
+        )
+        assert cached == "process" or ttl is None, "`ttl` requires `cached='process'`."
+        assert cached or maxsize is None and maxbytes is None, (
+            "`maxsize` and `maxbytes` require `cached`."
+        )
+        assert cached or key is None, "`key` requires `cached`."
+        assert cached or not coalesce, "`coalesce` requires `cached`."
+        assert batched in (False, True, "process"), (
+            f"`batched` must be a boolean or 'process', got {batched!r}."
+        )
+        assert cached or not io_bound, "`io_bound` requires `cached`."
+        assert not write_batched or not cached and not batched, (
+            "`write_batched` cannot be combined with `cached` or `batched`."
+        )
+        assert not vectorized or not cached and not batched and not write_batched, (
+            "`vectorized` cannot be combined with `cached`, `batched`"
+            " or `write_batched`."
+        )
+        assert executor in (None, "process"), (
+            f"`executor` must be None or 'process', got {executor!r}."
+        )
+        assert executor is None or "<locals>" not in flow_function.__qualname__, (
+            f"`{flow_function.__name__}` FlowFunction executed in a process"
+            f" has to be defined at the module level."
+        )
+        assert executor is None or flow_context_parameter_name is None, (
+            f"`{flow_function.__name__}` FlowFunction executed in a process"
+            f" cannot have a FlowContext argument."
+        )
         self._flow_function = flow_function
         self._flow_function_signature = inspect.signature(flow_function)
+        self._flow_functions_parameters = tuple(flow_functions_parameters)
+        # (alias, default flow function or None) of flow function arguments
+        self._flow_functions_arguments = tuple(
+            (
+                parameter.name,
+                parameter.default
+                if isinstance(parameter.default, FlowFunction)
+                else None,
+            )
+            for parameter in self._flow_functions_parameters
+        )
+        # the flow function argument that receives the flow context
+        self._flow_context_parameter_name = flow_context_parameter_name
+        # how results shared by all flow invocations are produced, if they are
+        self._shared_results_description = (
+            "cached with the 'process' scope"
+            if cached == "process"
+            else "coalesced"
+            if coalesce
+            else None
+        )
+        assert (
+            self._shared_results_description is None
+            or flow_context_parameter_name is None
+        ), (
+            f"`{flow_function.__name__}` FlowFunction"
+            f" {self._shared_results_description}"
+            f" cannot have a FlowContext argument."
+        )
+        # flow function arguments are passed positionally
+        #  when they are the only arguments of the flow function
+        self._positional_flow_functions_arguments = len(
+            self._flow_functions_parameters
+        ) == len(self._flow_function_signature.parameters) and all(
+            parameter.kind
+            in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+            for parameter in self._flow_functions_parameters
+        )
+        flow_functions_parameter_names = {
+            parameter.name for parameter in self._flow_functions_parameters
+        }
+        self._parameters = [
+            p
+            for p in self._flow_function_signature.parameters.values()
+            if p.name not in flow_functions_parameter_names
+        ]
+        assert not batched or len(self._parameters) == 1, (
+            f"`{flow_function.__name__}` batched FlowFunction has to have"
+            f" one argument that is not FlowFunction, the list of keys."
+        )
+        assert not write_batched or len(self._parameters) == 1, (
+            f"`{flow_function.__name__}` write batched FlowFunction has to have"
+            f" one argument that is not FlowFunction, the list of values."
+        )
+        self._key = key
+        cache_key_parameters = self._parameters
+        if isinstance(key, ArgumentCacheKey):
+            # defaults are mapped once, the same way as the passed arguments
+            cache_key_parameters = [
+                parameter
+                if parameter.default is inspect.Parameter.empty
+                else parameter.replace(default=key.argument_key(parameter.default))
+                for parameter in self._parameters
+            ]
+        self._cache_key_signature = inspect.Signature(cache_key_parameters)
+        # calls passing all arguments positionally are already canonical
+        self._positional_cache_key_length = (
+            len(self._parameters)
+            if all(
+                parameter.kind
+                in (
+                    inspect.Parameter.POSITIONAL_ONLY,
+                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                )
+                for parameter in self._parameters
+            )
+            else -1
+        )
+        # (keyword name, default) of parameters when the key can be built
+        #  without binding; positional-only parameters have no keyword name
+        self._cache_key_defaults = (
+            tuple(
+                (
+                    None
+                    if parameter.kind is inspect.Parameter.POSITIONAL_ONLY
+                    else parameter.name,
+                    parameter.default,
+                )
+                for parameter in cache_key_parameters
+            )
+            if all(
+                parameter.kind
+                not in (
+                    inspect.Parameter.VAR_POSITIONAL,
+                    inspect.Parameter.VAR_KEYWORD,
+                )
+                for parameter in self._parameters
+            )
+            else None
+        )
+        self._positional_parameters_count = sum(
+            1
+            for parameter in self._parameters
+            if parameter.kind
+            in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+        )
+        self.cache_key: Callable[[tuple[Any, ...], dict[str, Any]], Hashable]
+        if key is None:
+            self.cache_key = self._canonical_cache_key
+        elif isinstance(key, ArgumentCacheKey):
+            self.cache_key = self._argument_cache_key
+        else:
+            self.cache_key = self._custom_cache_key
+        # the cache key of a call without arguments; `()` for nullary functions
+        #  and for custom key functions, whose keys are wrapped in a tuple
+        self.empty_call_cache_key = (
+            self.cache_key((), {})
+            if len(self._parameters) > 0 and self.cache_key != self._custom_cache_key
+            else ()
+        )
         self.cached = cached
-        self.value: ReturnType
+        # results cached with the "process" scope are shared by all flow invocations
+        self.process_cache: FlowFunctionCache[ReturnType] | None = (
+            FlowFunctionCache(maxsize=maxsize, ttl=ttl, maxbytes=maxbytes)
+            if cached == "process"
+            else None
+        )
+        # (maxsize, maxbytes) of a bounded cache of a single flow invocation
+        self._invocation_cache_limits = (
+            (maxsize, maxbytes)
+            if cached is True and (maxsize is not None or maxbytes is not None)
+            else None
+        )
+
+        # calls in progress shared by concurrent flow invocations
+        self.coalesced_calls = FlowFunctionCoalescedCalls() if coalesce else None
+        self.batched = batched
+        # batches shared by concurrent flow invocations
+        self.process_batches = (
+            FlowFunctionBatches(flow_function.__name__)
+            if batched == "process"
+            else None
+        )
+        self.write_batched = write_batched
+        # blocking flow functions that flows with an executor call in its threads
+        self.io_bound = io_bound
+        self.executor = executor
+        # flow functions that take and return arrays of values
+        self.vectorized = vectorized
+        # (whether each positional parameter, names of keyword parameters)
+        #  that receive columns when a vectorized flow function is called
+        #  with single values: parameters without defaults, however they are passed
+        self.column_parameters = (
+            (
+                tuple(
+                    parameter.default is inspect.Parameter.empty
+                    for parameter in self._parameters
+                    if parameter.kind
+                    in (
+                        inspect.Parameter.POSITIONAL_ONLY,
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    )
+                ),
+                frozenset(
+                    parameter.name
+                    for parameter in self._parameters
+                    if parameter.default is inspect.Parameter.empty
+                    and parameter.kind
+                    in (
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        inspect.Parameter.KEYWORD_ONLY,
+                    )
+                ),
+            )
+            if vectorized
+            else None
+        )
+        # batched flow functions are called with a key and write batched with a value
+        self.callable_without_arguments = (
+            not batched
+            and not write_batched
+            and all(
+                parameter.default is not inspect.Parameter.empty
+                or parameter.kind
+                in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+                for parameter in self._parameters
+            )
+        )
+        self.check_dependencies({})
 
     @property
     def name(self) -> str:
         return self._flow_function.__name__
 
-    @cached_property
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by reference to the module and the qualified name of the function.
+
+        The flow function has to be decorated at the module level,
+        so that the name refers to it and not to the undecorated function.
+        """
+        module_name = self._flow_function.__module__
+        qualified_name = self._flow_function.__qualname__
+        try:
+            is_referenced = import_qualified_name(module_name, qualified_name) is self
+        except (ImportError, AttributeError):
+            is_referenced = False
+        if not is_referenced:
+            raise pickle.PicklingError(
+                f"Can't pickle `{self.name}` FlowFunction:"
+                f" it's not the same object as {module_name}.{qualified_name}."
+            )
+        return import_qualified_name, (module_name, qualified_name)
+
+    @property
     def parameters(self) -> list[inspect.Parameter]:
-        return [p for p in self._flow_function_signature.parameters.values()]
+        return self._parameters
+
+    def check_dependencies(
+        self, flow_functions: Mapping[str, "FlowFunction[Any]"]
+    ) -> None:
+        """Assert that the flow function dependencies fit how it is executed.
+
+        Results cached with the "process" scope and coalesced calls are shared
+        by all flow invocations, but they are keyed only by the arguments
+        of the call, so they cannot depend on flow arguments or other flow functions
+        of a single invocation.
+        Flow functions executed in a process call all their dependencies without
+        arguments before they are submitted, so the dependencies have to be
+        callable without arguments.
+        The aliases of the flow function arguments are resolved in `flow_functions`;
+        default flow functions are used as they are.
+        """
+        if self._shared_results_description is None and self.executor is None:
+            return
+        for flow_function_name, default_flow_function in self._flow_functions_arguments:
+            dependency = (
+                default_flow_function
+                if default_flow_function is not None
+                else flow_functions.get(flow_function_name)
+            )
+            if dependency is None:
+                continue
+            assert (
+                self._shared_results_description is None
+                or dependency.cached == "process"
+            ), (
+                f"`{self.name}` FlowFunction {self._shared_results_description}"
+                f" can depend only on flow functions cached with the 'process' scope,"
+                f" but `{flow_function_name}` is not."
+            )
+            assert self.executor is None or dependency.callable_without_arguments, (
+                f"`{self.name}` FlowFunction executed in a process"
+                f" can depend only on flow functions callable without arguments,"
+                f" but `{flow_function_name}` is not."
+            )
+
+    def create_cache(
+        self,
+    ) -> dict[Hashable, ReturnType] | FlowFunctionCache[ReturnType]:
+        """The cache of the flow function invoker of a single flow invocation."""
+        if self.process_cache is not None:
+            return self.process_cache
+        if self._invocation_cache_limits is None:
+            return {}
+        maxsize, maxbytes = self._invocation_cache_limits
+        return FlowFunctionCache(maxsize=maxsize, maxbytes=maxbytes)
+
+    def cache_info(self) -> FlowFunctionCacheInfo:
+        assert self.process_cache is not None, (
+            f"`{self.name}` FlowFunction is not cached with the 'process' scope."
+        )
+        return self.process_cache.info()
+
+    def cache_clear(self) -> None:
+        assert self.process_cache is not None, (
+            f"`{self.name}` FlowFunction is not cached with the 'process' scope."
+        )
+        self.process_cache.clear()
+
+    def coalesce_info(self) -> FlowFunctionCoalesceInfo:
+        assert self.coalesced_calls is not None, (
+            f"`{self.name}` FlowFunction does not coalesce calls."
+        )
+        return self.coalesced_calls.info()
+
+    def batch_info(self) -> FlowFunctionBatchInfo:
+        assert self.process_batches is not None, (
+            f"`{self.name}` FlowFunction is not batched with the 'process' scope."
+        )
+        return self.process_batches.info()
+
+    def _custom_cache_key(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Hashable:
+        assert self._key is not None
+        return (self._key(*args, **kwargs),)
+
+    def _argument_cache_key(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Hashable:
+        assert isinstance(self._key, ArgumentCacheKey)
+        argument_key = self._key.argument_key
+        return self._canonical_cache_key(
+            tuple(argument_key(value) for value in args),
+            {name: argument_key(value) for name, value in kwargs.items()},
+        )
+
+    def _canonical_cache_key(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Hashable:
+        """Canonical cache key of the call arguments.
+
+        Positional, keyword and omitted default arguments of the same call
+        map to the same key. Arguments that are not passed and have no default,
+        like composed flow arguments taken from the flow context,
+        are marked with `inspect.Parameter.empty`.
+        """
+        if not kwargs and len(args) == self._positional_cache_key_length:
+            return args
+        cache_key_defaults = self._cache_key_defaults
+        if (
+            cache_key_defaults is not None
+            and len(args) <= self._positional_parameters_count
+        ):
+            keyword_values = []
+            used_kwargs = 0
+            for name, default in cache_key_defaults[len(args) :]:
+                if name is not None and name in kwargs:
+                    keyword_values.append(kwargs[name])
+                    used_kwargs += 1
+                else:
+                    keyword_values.append(default)
+            # calls with unknown keyword arguments fail, so they must not hit the cache
+            if used_kwargs == len(kwargs):
+                return args + tuple(keyword_values)
+        bound_arguments = self._cache_key_signature.bind_partial(*args, **kwargs)
+        bound_arguments.apply_defaults()
+        arguments = bound_arguments.arguments
+        return tuple(
+            frozenset(arguments[parameter.name].items())
+            if parameter.kind is inspect.Parameter.VAR_KEYWORD
+            else arguments.get(parameter.name, inspect.Parameter.empty)
+            for parameter in self._parameters
+        )
+
+    def bind(self, flow_context: "FlowContext") -> Callable[..., ReturnType]:
+        """Bind flow function arguments to the invokers from the flow context.
+
+        Called once per flow function per flow invocation;
+        the returned callable takes only non-flow-function arguments.
+        """
+        if not self._flow_functions_arguments:
+            return self._flow_function
+
+        flow_functions_arguments: list[Any] = []
+        missing_flow_function_configurations: list[str] = []
+        for flow_function_name, default_flow_function in self._flow_functions_arguments:
+            if flow_function_name == self._flow_context_parameter_name:
+                flow_functions_arguments.append(flow_context)
+                continue
+            if default_flow_function is not None:
+                flow_functions_arguments.append(
+                    flow_context.create_flow_function_invoker(default_flow_function)
+                )
+                continue
+            try:
+                flow_functions_arguments.append(flow_context[flow_function_name])
+            except KeyError:
+                missing_flow_function_configurations.append(flow_function_name)
+
+        if len(missing_flow_function_configurations) > 0:
+            raise AssertionError(
+                f"`{'`, `'.join(missing_flow_function_configurations)}`"
+                f" {'FlowFunction is' if len(missing_flow_function_configurations) == 1 else 'FlowFunctions are'}"
+                f" required by `{self.name}` FlowFunction"
+                f" but {'is' if len(missing_flow_function_configurations) == 1 else 'are'}"
+                f" missing in the flow context."
+            )
+
+        if self._positional_flow_functions_arguments:
+            return functools.partial(self._flow_function, *flow_functions_arguments)
+
+        return functools.partial(
+            self._flow_function,
+            **{
+                flow_function_name: flow_function_argument
+                for (flow_function_name, _), flow_function_argument in zip(
+                    self._flow_functions_arguments, flow_functions_arguments
+                )
+            },
+        )
 
 
 FlowFunctionT = TypeVar("FlowFunctionT", bound=FlowFunction)  # type:ignore[type-arg]
@@ -0,0 +1,139 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+
+class FlowFunctionBatchInfo(NamedTuple):
+    batches: int
+    keys: int
+
+
+class FlowFunctionBatch:
+    """Calls of a batched flow function collected in one event loop iteration.
+
+    The first call schedules the dispatch; the keys of all calls made before it
+    runs are passed to the flow function in a single call,
+    which returns the results in the order of the keys.
+    """
+
+    __slots__ = ("_name", "_pending_calls", "_batch_calls", "batches", "keys")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        # (key, future of the result) of the calls waiting for the dispatch
+        self._pending_calls: list[tuple[Any, asyncio.Future[Any]]] | None = None
+        # the dispatched batch calls in progress, referenced until they finish
+        self._batch_calls: set[asyncio.Task[None]] = set()
+        self.batches = 0
+        self.keys = 0
+
+    def call(
+        self,
+        batched_flow_function: Callable[[list[Any]], Awaitable[Any]],
+        key: Any,
+    ) -> asyncio.Future[Any]:
+        loop = asyncio.get_running_loop()
+        if self._pending_calls is None:
+            self._pending_calls = []
+            loop.call_soon(self._dispatch, batched_flow_function)
+        result = loop.create_future()
+        self._pending_calls.append((key, result))
+        return result
+
+    def _dispatch(
+        self, batched_flow_function: Callable[[list[Any]], Awaitable[Any]]
+    ) -> None:
+        pending_calls, self._pending_calls = self._pending_calls or [], None
+        self.batches += 1
+        self.keys += len(pending_calls)
+        batch_call = asyncio.get_running_loop().create_task(
+            self._call(batched_flow_function, pending_calls)
+        )
+        self._batch_calls.add(batch_call)
+        batch_call.add_done_callback(self._batch_calls.discard)
+
+    async def _call(
+        self,
+        batched_flow_function: Callable[[list[Any]], Awaitable[Any]],
+        pending_calls: list[tuple[Any, asyncio.Future[Any]]],
+    ) -> None:
+        try:
+            results = await batched_flow_function([key for key, _ in pending_calls])
+            if len(results) != len(pending_calls):
+                raise AssertionError(
+                    f"`{self._name}` batched FlowFunction returned {len(results)}"
+                    f" results for {len(pending_calls)} keys."
+                )
+        except Exception as exception:
+            for _, result in pending_calls:
+                if not result.done():
+                    result.set_exception(exception)
+            return
+        except BaseException:
+            for _, result in pending_calls:
+                result.cancel()
+            raise
+        for (_, result), value in zip(pending_calls, results):
+            if not result.done():
+                result.set_result(value)
+
+    def info(self) -> FlowFunctionBatchInfo:
+        return FlowFunctionBatchInfo(batches=self.batches, keys=self.keys)
+
+
+class FlowFunctionBatches:
+    """Batches of a flow function shared by all flow invocations, one per event loop."""
+
+    __slots__ = ("_name", "_batches_by_loop", "_lock")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._batches_by_loop: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, FlowFunctionBatch
+        ] = weakref.WeakKeyDictionary()
+        # event loops of different threads share the loop map
+        self._lock = threading.Lock()
+
+    def batch(self) -> FlowFunctionBatch:
+        """The batch of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            batch = self._batches_by_loop.get(loop)
+            if batch is None:
+                batch = self._batches_by_loop[loop] = FlowFunctionBatch(self._name)
+            return batch
+
+    def info(self) -> FlowFunctionBatchInfo:
+        with self._lock:
+            batches = list(self._batches_by_loop.values())
+        return FlowFunctionBatchInfo(
+            batches=sum(batch.batches for batch in batches),
+            keys=sum(batch.keys for batch in batches),
+        )
+
+
+class FlowFunctionWriteBatch:
+    """Calls of a write batched flow function buffered during a flow invocation.
+
+    The buffered values are passed to the flow function in a single call
+    when the flow returns or when the flow context is flushed.
+    """
+
+    __slots__ = ("bulk_flow_function", "values")
+
+    def __init__(self, bulk_flow_function: Callable[[list[Any]], Any]) -> None:
+        self.bulk_flow_function = bulk_flow_function
+        self.values: list[Any] = []
+
+    def write(self, value: Any) -> None:
+        self.values.append(value)
+
+    def take(self) -> list[Any]:
+        """The buffered values; the buffer is emptied."""
+        values, self.values = self.values, []
+        return values
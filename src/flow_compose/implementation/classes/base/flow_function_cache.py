@@ -0,0 +1,162 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Generic, NamedTuple
+
+from flow_compose.types import ReturnType
+
+
+class FlowFunctionCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    maxbytes: int | None
+    currbytes: int
+
+
+class FlowFunctionCoalesceInfo(NamedTuple):
+    executed: int
+    coalesced: int
+
+
+class FlowFunctionCache(Generic[ReturnType]):
+    """A thread-safe cache store with LRU eviction and expiry.
+
+    Shared by all invocations of a flow function cached with the "process" scope,
+    and created per invocation for a flow function with a bounded cache.
+    The size of a result is approximated by `sys.getsizeof`,
+    which does not include the objects the result references.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_lock",
+        "currbytes",
+        "hits",
+        "maxbytes",
+        "maxsize",
+        "misses",
+        "ttl",
+    )
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        maxbytes: int | None = None,
+    ) -> None:
+        assert maxsize is None or maxsize > 0, "`maxsize` must be a positive integer."
+        assert ttl is None or ttl > 0, "`ttl` must be a positive number of seconds."
+        assert maxbytes is None or maxbytes > 0, (
+            "`maxbytes` must be a positive integer."
+        )
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.currbytes = 0
+        # cache key -> (expiry time or None, size in bytes, result),
+        #  in the least recently used order
+        self._entries: OrderedDict[Hashable, tuple[float | None, int, ReturnType]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: Hashable, default: Any = None) -> ReturnType | Any:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                expires_at, size, result = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(cache_key)
+                    self.hits += 1
+                    return result
+                del self._entries[cache_key]
+                self.currbytes -= size
+            self.misses += 1
+            return default
+
+    def __setitem__(self, cache_key: Hashable, result: ReturnType) -> None:
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        size = 0 if self.maxbytes is None else sys.getsizeof(result)
+        with self._lock:
+            replaced_entry = self._entries.pop(cache_key, None)
+            if replaced_entry is not None:
+                self.currbytes -= replaced_entry[1]
+            self._entries[cache_key] = (expires_at, size, result)
+            self.currbytes += size
+            while (
+                self.maxsize is not None
+                and len(self._entries) > self.maxsize
+                or self.maxbytes is not None
+                and self.currbytes > self.maxbytes
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.currbytes -= evicted_size
+
+    def info(self) -> FlowFunctionCacheInfo:
+        with self._lock:
+            return FlowFunctionCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+                maxbytes=self.maxbytes,
+                currbytes=self.currbytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.currbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+class FlowFunctionCoalescedCalls:
+    """Calls in progress of a flow function shared by all flow invocations.
+
+    Futures belong to an event loop, so the calls in progress are kept per loop.
+    """
+
+    __slots__ = ("_lock", "_pending_calls_by_loop", "coalesced", "executed")
+
+    def __init__(self) -> None:
+        self.executed = 0
+        self.coalesced = 0
+        self._pending_calls_by_loop: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[Hashable, asyncio.Future[Any]]
+        ] = weakref.WeakKeyDictionary()
+        # event loops of different threads share the counters and the loop map
+        self._lock = threading.Lock()
+
+    def pending_calls(self) -> dict[Hashable, asyncio.Future[Any]]:
+        """Futures of the calls in progress in the running event loop by cache key."""
+        with self._lock:
+            return self._pending_calls_by_loop.setdefault(
+                asyncio.get_running_loop(), {}
+            )
+
+    def add_executed(self) -> None:
+        with self._lock:
+            self.executed += 1
+
+    def add_coalesced(self) -> None:
+        with self._lock:
+            self.coalesced += 1
+
+    def info(self) -> FlowFunctionCoalesceInfo:
+        with self._lock:
+            return FlowFunctionCoalesceInfo(
+                executed=self.executed,
+                coalesced=self.coalesced,
+            )
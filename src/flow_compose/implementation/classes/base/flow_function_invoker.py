@@ -1,23 +1,281 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
-from typing import Generic, TypeVar, Any
+import abc
+import asyncio
+from concurrent import futures
+from collections.abc import Callable, Container, Hashable, Mapping, Sequence
+from typing import ClassVar, Generic, TypeVar, Any, TYPE_CHECKING, cast
 
 from flow_compose.types import ReturnType
 from flow_compose.implementation.classes.base.flow_function import FlowFunction
+from flow_compose.implementation.classes.base.flow_function_cache import (
+    FlowFunctionCache,
+)
+from flow_compose.implementation.classes.base.flow_function_batch import (
+    FlowFunctionWriteBatch,
+)
+from flow_compose.implementation.classes.base.flow_profile import FlowProfile
+
+if TYPE_CHECKING:
+    from flow_compose.implementation.classes.base.flow_columns import FlowColumns
+    from flow_compose.implementation.classes.a import (
+        flow_function_invoker as async_flow_function_invoker,
+    )
+
+# marks a cache miss, cached flow functions may return None
+CACHE_MISS: Any = object()
+
+# a prefetched call running in the background
+BackgroundCall = asyncio.Future[Any] | futures.Future[Any]
 
 
 class FlowContext(dict[str, "FlowFunctionInvoker[FlowFunction[Any], Any]"]):
-    pass
+    """Flow function invokers of a single flow invocation by alias.
+
+    Invokers of the configured flow functions are created on the first lookup
+    of their alias, so aliases that the invocation never uses cost nothing.
+    Invokers and the context reference each other; `close` breaks those
+    reference cycles when the flow invocation exits, so the invocation state
+    is freed by reference counting instead of the cyclic garbage collector.
+    """
+
+    __slots__ = (
+        "_flow_functions_configuration",
+        "_flow_function_invoker_class",
+        "_background_calls",
+        "_flow_profile",
+        "_speculated_aliases",
+        "write_batches",
+        "flow_arguments",
+        "executor",
+        "columns",
+    )
+
+    def __init__(
+        self,
+        flow_functions_configuration: Mapping[str, FlowFunction[Any]] | None = None,
+        flow_function_invoker_class: type["FlowFunctionInvoker[Any, Any]"]
+        | None = None,
+        flow_profile: FlowProfile | None = None,
+        executor: futures.Executor | None = None,
+    ) -> None:
+        super().__init__()
+        self._flow_functions_configuration = flow_functions_configuration or {}
+        self._flow_function_invoker_class = flow_function_invoker_class
+        self._background_calls: list[BackgroundCall] | None = None
+        self._flow_profile = flow_profile
+        self._speculated_aliases: tuple[str, ...] = ()
+        # buffers of the write batched flow functions in the order of their first call
+        self.write_batches: list[FlowFunctionWriteBatch] | None = None
+        # flow argument values of the flow invocation by name
+        self.flow_arguments: dict[str, Any] | None = None
+        # the executor of the flow that calls independent I/O-bound flow functions
+        self.executor = executor
+        # the state of a flow invocation with columns of flow argument values
+        self.columns: "FlowColumns | None" = None
+
+    def __missing__(
+        self, flow_function_name: str
+    ) -> "FlowFunctionInvoker[FlowFunction[Any], Any]":
+        # prefetched calls look up aliases from other threads,
+        #  so the invoker created first is kept
+        return self.setdefault(
+            flow_function_name,
+            self.create_flow_function_invoker(
+                self._flow_functions_configuration[flow_function_name]
+            ),
+        )
+
+    def create_flow_function_invoker(
+        self, flow_function: FlowFunction[Any]
+    ) -> "FlowFunctionInvoker[FlowFunction[Any], Any]":
+        if self._flow_function_invoker_class is None:
+            # outside a flow invocation flow functions are called directly
+            return flow_function  # type: ignore[return-value]
+        return self._flow_function_invoker_class(
+            flow_function=flow_function,
+            flow_context=self,
+        )
+
+    def prefetch(
+        self,
+        *flow_function_names: str,
+        executor: futures.Executor | None = None,
+    ) -> None:
+        """Start the calls of cached flow functions ahead of their use.
+
+        Later calls of the flow functions without arguments return the cached
+        result or wait for the prefetched call in progress.
+        In `flow_compose.a` the calls are started as tasks.
+        Otherwise they are submitted to the `executor`,
+        or executed immediately without it.
+        Prefetched calls still in progress are cancelled when the flow returns.
+        """
+        for flow_function_name in flow_function_names:
+            flow_function_invoker = self[flow_function_name]
+            flow_function = flow_function_invoker._flow_function
+            assert flow_function.cached and flow_function.callable_without_arguments, (
+                f"`{flow_function_name}` FlowFunction has to be cached"
+                f" and callable without arguments to be prefetched."
+            )
+            self.add_background_call(flow_function_invoker.prefetch(executor))
+
+    def speculate(self) -> None:
+        """Start the calls of the flow functions that the flow profile expects.
+
+        The calls are made by separate invokers that share the cache
+        and the calls in progress with the invokers in the flow context,
+        so the flow profile records only the calls made by the flow.
+        """
+        assert self._flow_profile is not None
+        self._speculated_aliases = self._flow_profile.speculated_aliases
+        for flow_function_name in self._speculated_aliases:
+            # only flows of `flow_compose.a` speculate
+            flow_function_invoker = cast(
+                "async_flow_function_invoker.FlowFunctionInvoker[Any]",
+                self[flow_function_name],
+            )
+            self.add_background_call(flow_function_invoker.speculate())
+
+    def add_write_batch(
+        self, bulk_flow_function: Callable[[list[Any]], Any]
+    ) -> FlowFunctionWriteBatch:
+        write_batch = FlowFunctionWriteBatch(bulk_flow_function)
+        if self.write_batches is None:
+            self.write_batches = []
+        self.write_batches.append(write_batch)
+        return write_batch
+
+    def flush(self) -> Any:
+        """Call the write batched flow functions with the values buffered so far.
+
+        The flow functions are called in the order of their first call.
+        When one raises, the exception is raised and the values buffered
+        for the rest stay buffered.
+        In `flow_compose.a` the returned awaitable has to be awaited.
+        """
+        assert self._flow_function_invoker_class is not None
+        return self._flow_function_invoker_class.flush_write_batches(
+            self.write_batches or ()
+        )
+
+    def add_background_call(self, background_call: BackgroundCall | None) -> None:
+        """Track a prefetched call, which is cancelled when the flow returns."""
+        if background_call is not None:
+            if self._background_calls is None:
+                self._background_calls = []
+            self._background_calls.append(background_call)
 
+    def recycle(self, shared_flow_function_names: Container[str]) -> None:
+        """Reset the state of the flow invocation for the next invocation.
 
-EMPTY_FLOW_CONTEXT = FlowContext()
+        The invokers are kept, so the next invocation does not create them again;
+        the invokers of the shared flow functions also keep their cached results.
+        """
+        if self._background_calls is not None:
+            for background_call in self._background_calls:
+                background_call.cancel()
+            self._background_calls = None
+        self.write_batches = None
+        self.flow_arguments = None
+        for flow_function_name, flow_function_invoker in self.items():
+            if flow_function_name not in shared_flow_function_names:
+                flow_function_invoker.reset()
+
+    def close(self) -> None:
+        if self._flow_profile is not None:
+            # invokers are bound on their first call
+            self._flow_profile.record(
+                called_aliases=(
+                    flow_function_name
+                    for flow_function_name, flow_function_invoker in self.items()
+                    if flow_function_invoker._bound_flow_function is not None
+                ),
+                speculated_aliases=self._speculated_aliases,
+            )
+        if self._background_calls is not None:
+            for background_call in self._background_calls:
+                background_call.cancel()
+            self._background_calls = None
+        # values buffered by a flow that raised are discarded
+        self.write_batches = None
+        if self.columns is not None:
+            self.columns.close()
+            self.columns = None
+        for flow_function_invoker in self.values():
+            flow_function_invoker._bound_flow_function = None
+        self.clear()
+
+    @property
+    def concurrent(self) -> bool:
+        """Whether independent dependencies are resolved concurrently."""
+        return (
+            self._flow_function_invoker_class is not None
+            and self._flow_function_invoker_class.concurrent
+        )
+
+    def flow_function(self, flow_function_name: str) -> FlowFunction[Any] | None:
+        """The flow function of the alias, without creating its invoker."""
+        flow_function_invoker = self.get(flow_function_name)
+        if flow_function_invoker is not None:
+            return flow_function_invoker._flow_function
+        return self._flow_functions_configuration.get(flow_function_name)
+
+    def has_flow_function(self, flow_function_name: str) -> bool:
+        """Whether the alias has an invoker or is in the flow configuration.
+
+        The mapping itself, `in` included, lists only the invokers created so far.
+        """
+        return (
+            flow_function_name in self
+            or flow_function_name in self._flow_functions_configuration
+        )
+
+
+class EmptyFlowContext(FlowContext):
+    """The flow context of flow functions called outside a flow invocation.
+
+    It is shared by all threads, so it cannot be changed.
+    """
+
+    __slots__ = ()
+
+    def __setitem__(
+        self,
+        flow_function_name: str,
+        flow_function_invoker: "FlowFunctionInvoker[FlowFunction[Any], Any]",
+    ) -> None:
+        raise AssertionError(
+            "The flow context of flow functions called outside a flow"
+            " cannot be changed."
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, name):
+            raise AssertionError(
+                "The flow context of flow functions called outside a flow"
+                " cannot be changed."
+            )
+        super().__setattr__(name, value)
+
+
+EMPTY_FLOW_CONTEXT = EmptyFlowContext()
 
 
 FlowFunctionT = TypeVar("FlowFunctionT", bound=FlowFunction)  # type:ignore[type-arg]
 
 
-class FlowFunctionInvoker(Generic[FlowFunctionT, ReturnType]):
+class FlowFunctionInvoker(Generic[FlowFunctionT, ReturnType], metaclass=abc.ABCMeta):
+    __slots__ = (
+        "_flow_function",
+        "_flow_context",
+        "_flow_function_cache",
+        "_bound_flow_function",
+    )
+
+    concurrent: ClassVar[bool] = False
+
     def __init__(
         self,
         flow_function: FlowFunctionT,
@@ -25,7 +283,30 @@ class FlowFunctionInvoker(Generic[FlowFunctionT, ReturnType]):
     ) -> None:
         self._flow_function = flow_function
         self._flow_context = flow_context
-        self._flow_function_cache: dict[int, ReturnType] = {}
+        # only invokers of cached flow functions have a cache
+        self._flow_function_cache: (
+            dict[Hashable, ReturnType] | FlowFunctionCache[ReturnType] | None
+        ) = flow_function.create_cache() if flow_function.cached else None
+        self._bound_flow_function: Callable[..., Any] | None = None
+
+    def _bind(self) -> Callable[..., Any]:
+        self._bound_flow_function = self._flow_function.bind(self._flow_context)
+        return self._bound_flow_function
+
+    def reset(self) -> None:
+        """Drop the bound flow function and the cached results of the invocation."""
+        self._bound_flow_function = None
+        if self._flow_function_cache is not None:
+            self._flow_function_cache = self._flow_function.create_cache()
+
+    @abc.abstractmethod
+    def prefetch(self, executor: futures.Executor | None) -> BackgroundCall | None:
+        """Start the call without arguments; see `FlowContext.prefetch`."""
+
+    @staticmethod
+    @abc.abstractmethod
+    def flush_write_batches(write_batches: Sequence[FlowFunctionWriteBatch]) -> Any:
+        """Call the flow functions with their buffered values; see `FlowContext.flush`."""
 
 
 FlowFunctionInvokerT = TypeVar("FlowFunctionInvokerT", bound=FlowFunctionInvoker)  # type:ignore[type-arg]
@@ -0,0 +1,72 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import functools
+import inspect
+import threading
+from collections.abc import Callable
+from concurrent import futures
+from typing import Any
+
+_process_pool: futures.ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def process_pool() -> futures.ProcessPoolExecutor:
+    """The process pool shared by the flow functions executed in a process.
+
+    It is created on the first call and shut down when the interpreter exits.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = futures.ProcessPoolExecutor()
+        return _process_pool
+
+
+class FlowFunctionValue:
+    """The value of a flow function dependency resolved in the parent process."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __call__(self) -> Any:
+        return self.value
+
+
+class AwaitableFlowFunctionValue:
+    """The value of an async flow function dependency resolved in the parent process."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    async def __call__(self) -> Any:
+        return self.value
+
+
+def dependencies(
+    bound_flow_function: Callable[..., Any],
+) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    """The positional and keyword flow function arguments bound by `bind`."""
+    if isinstance(bound_flow_function, functools.partial):
+        return bound_flow_function.args, bound_flow_function.keywords
+    return (), {}
+
+
+def call_in_process(
+    flow_function: Any,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Call the flow function in a worker process of the process pool.
+
+    The flow function is pickled by reference,
+    and async flow functions run in a new event loop of the worker.
+    """
+    result = flow_function._flow_function(*args, **kwargs)
+    return asyncio.run(result) if inspect.iscoroutine(result) else result
@@ -0,0 +1,110 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import threading
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple
+
+from flow_compose.implementation.classes.base.flow_function import FlowFunction
+
+
+class FlowSpeculationInfo(NamedTuple):
+    invocations: int
+    speculated_aliases: tuple[str, ...]
+    speculated: int
+    hits: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of the speculative calls that the flow used."""
+        return self.hits / self.speculated if self.speculated else 0.0
+
+
+class FlowProfile:
+    """The aliases called by the invocations of a flow.
+
+    After `min_invocations` invocations, the cached flow functions callable
+    without arguments that were called in at least `threshold` of the invocations
+    are started speculatively when the flow is entered,
+    at most `max_speculative_calls` of them, the most frequently called first.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_alias_calls",
+        "_candidate_aliases",
+        "hits",
+        "invocations",
+        "max_speculative_calls",
+        "min_invocations",
+        "speculated",
+        "speculated_aliases",
+        "threshold",
+    )
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_speculative_calls: int = 4,
+        min_invocations: int = 20,
+    ) -> None:
+        assert 0 < threshold <= 1, "`threshold` must be in the (0, 1] interval."
+        assert max_speculative_calls > 0, (
+            "`max_speculative_calls` must be a positive integer."
+        )
+        assert min_invocations > 0, "`min_invocations` must be a positive integer."
+        self.threshold = threshold
+        self.max_speculative_calls = max_speculative_calls
+        self.min_invocations = min_invocations
+        self.invocations = 0
+        self.speculated = 0
+        self.hits = 0
+        self.speculated_aliases: tuple[str, ...] = ()
+        self._alias_calls: Counter[str] = Counter()
+        self._candidate_aliases: frozenset[str] | None = None
+        self._lock = threading.Lock()
+
+    def track(
+        self, flow_functions_configuration: Mapping[str, FlowFunction[Any]]
+    ) -> None:
+        """Profile the flow with the configuration; called when it is decorated."""
+        assert self._candidate_aliases is None, "FlowProfile can profile only one flow."
+        self._candidate_aliases = frozenset(
+            flow_function_name
+            for flow_function_name, flow_function in flow_functions_configuration.items()
+            if flow_function.cached and flow_function.callable_without_arguments
+        )
+
+    def record(
+        self, called_aliases: Iterable[str], speculated_aliases: tuple[str, ...]
+    ) -> None:
+        """Record the aliases called by an invocation that speculated on others."""
+        candidate_aliases = self._candidate_aliases or frozenset()
+        called_candidate_aliases = candidate_aliases.intersection(called_aliases)
+        with self._lock:
+            self.invocations += 1
+            self.speculated += len(speculated_aliases)
+            self.hits += sum(
+                alias in called_candidate_aliases for alias in speculated_aliases
+            )
+            self._alias_calls.update(called_candidate_aliases)
+            if self.invocations < self.min_invocations:
+                return
+            min_calls = self.threshold * self.invocations
+            self.speculated_aliases = tuple(
+                alias
+                for alias, calls in self._alias_calls.most_common(
+                    self.max_speculative_calls
+                )
+                if calls >= min_calls
+            )
+
+    def info(self) -> FlowSpeculationInfo:
+        with self._lock:
+            return FlowSpeculationInfo(
+                invocations=self.invocations,
+                speculated_aliases=self.speculated_aliases,
+                speculated=self.speculated,
+                hits=self.hits,
+            )
@@ -4,14 +4,18 @@
 import inspect
 from typing import Generic, Callable, Any
 
+from flow_compose.implementation.classes import base
 from flow_compose.implementation.classes.flow_function import FlowFunction
 from flow_compose.implementation.classes.flow_function_invoker import (
     FlowFunctionInvoker,
+    prefetch_flow_function_invokers,
 )
 from flow_compose.types import ReturnType
 
 
 class Flow(FlowFunction[ReturnType], Generic[ReturnType]):
+    __slots__ = ()
+
     def __init__(
         self,
         flow: Callable[..., ReturnType],
@@ -22,20 +26,37 @@ class Flow(FlowFunction[ReturnType], Generic[ReturnType]):
             cached=cached,
         )
 
-    def __call__(self, *args: Any, **kwargs: Any) -> ReturnType:
-        flow_context = kwargs["__flow_context"]
-        for parameter in self.parameters:
-            if parameter.name not in kwargs and (
-                parameter.name in flow_context
-                or parameter.default is not inspect.Parameter.empty
-            ):
-                if parameter.name in flow_context:
-                    kwarg = flow_context[parameter.name]
-                else:
-                    kwarg = parameter.default
-                kwargs[parameter.name] = (
-                    kwarg() if isinstance(kwarg, FlowFunctionInvoker) else kwarg
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by reference to the flow."""
+        return type(self), (self._flow_function, self.cached)
+
+    def bind(self, flow_context: base.FlowContext) -> Callable[..., ReturnType]:
+        context_parameters = [
+            (
+                parameter.name,
+                flow_context[parameter.name]
+                if flow_context.has_flow_function(parameter.name)
+                else parameter.default,
+            )
+            for parameter in self.parameters
+            if flow_context.has_flow_function(parameter.name)
+            or parameter.default is not inspect.Parameter.empty
+        ]
+
+        concurrent = flow_context.concurrent
+
+        def flow_with_flow_context(*args: Any, **kwargs: Any) -> ReturnType:
+            if concurrent:
+                prefetch_flow_function_invokers(
+                    kwarg
+                    for parameter_name, kwarg in context_parameters
+                    if parameter_name not in kwargs
                 )
+            for parameter_name, kwarg in context_parameters:
+                if parameter_name not in kwargs:
+                    kwargs[parameter_name] = (
+                        kwarg() if isinstance(kwarg, FlowFunctionInvoker) else kwarg
+                    )
+            return self._flow_function(*args, **kwargs)
 
-        del kwargs["__flow_context"]
-        return super().__call__(*args, **kwargs)
+        return flow_with_flow_context
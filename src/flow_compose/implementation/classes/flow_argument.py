@@ -1,7 +1,7 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
-from typing import Generic
+from typing import Generic, Callable
 
 from flow_compose.implementation.classes import base
 from flow_compose.implementation.classes.flow_function import FlowFunction
@@ -11,5 +11,11 @@ from flow_compose.types import ReturnType
 class FlowArgument(
     base.FlowArgument[ReturnType], FlowFunction[ReturnType], Generic[ReturnType]
 ):
+    __slots__ = ()
+
     def __call__(self) -> ReturnType:
         return self.value
+
+    def bind(self, flow_context: base.FlowContext) -> Callable[[], ReturnType]:
+        value = self.invocation_value(flow_context)
+        return lambda: value
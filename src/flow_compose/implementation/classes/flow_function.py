@@ -1,12 +1,163 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
-from typing import Generic, Any
+import functools
+from typing import Generic, Any, Callable
 
 from flow_compose.implementation.classes import base
+from flow_compose.implementation.classes.base.flow_columns import (
+    depends_on_flow_arguments,
+    repeated_column,
+)
+from flow_compose.implementation.classes.base.flow_function_invoker import (
+    EMPTY_FLOW_CONTEXT,
+)
+from flow_compose.implementation.classes.base.flow_function_process import (
+    FlowFunctionValue,
+    call_in_process,
+    dependencies,
+    process_pool,
+)
 from flow_compose.types import ReturnType
 
 
 class FlowFunction(base.FlowFunction[ReturnType], Generic[ReturnType]):
+    __slots__ = ()
+
     def __call__(self, *args: Any, **kwargs: Any) -> ReturnType:
-        return self._flow_function(*args, **kwargs)
+        return self.bind(EMPTY_FLOW_CONTEXT)(*args, **kwargs)
+
+    def bind(self, flow_context: base.FlowContext) -> Callable[..., ReturnType]:
+        bound_flow_function = super().bind(flow_context)
+        # vectorized flow functions called with single values, and not with
+        #  the columns of `map_columns`, get and return columns of one value
+        single_values = (
+            self.vectorized
+            and flow_context.columns is None
+            and bool(self._parameters or self._flow_functions_arguments)
+        )
+        if single_values:
+            bound_flow_function = self._bind_column_dependencies(
+                bound_flow_function, flow_context
+            )
+        if self.executor == "process":
+            bound_flow_function = functools.partial(
+                self._call_in_process, bound_flow_function
+            )
+        if single_values:
+            assert self.column_parameters is not None
+            return functools.partial(
+                _call_with_single_values, bound_flow_function, *self.column_parameters
+            )
+        if not self.write_batched:
+            return bound_flow_function
+        if flow_context is EMPTY_FLOW_CONTEXT:
+            # outside a flow invocation values are written one by one
+            return lambda value: bound_flow_function([value])
+        return flow_context.add_write_batch(bound_flow_function).write
+
+    def _bind_column_dependencies(
+        self,
+        bound_flow_function: Callable[..., ReturnType],
+        flow_context: base.FlowContext,
+    ) -> Callable[..., ReturnType]:
+        """Bind the dependencies on flow arguments to return columns of one value.
+
+        They are the dependencies that are columns in `map_columns`.
+        """
+        if not isinstance(bound_flow_function, functools.partial):
+            return bound_flow_function
+        flow_functions_dependence: dict[base.FlowFunction[Any], bool] = {}
+        column_dependency_names = {
+            flow_function_name
+            for flow_function_name, default_flow_function in (
+                self._flow_functions_arguments
+            )
+            if flow_function_name != self._flow_context_parameter_name
+            and depends_on_flow_arguments(
+                default_flow_function
+                if default_flow_function is not None
+                else flow_context[flow_function_name]._flow_function,
+                flow_context.flow_function,
+                flow_functions_dependence,
+            )
+        }
+        if not column_dependency_names:
+            return bound_flow_function
+        dependency_args, dependency_kwargs = dependencies(bound_flow_function)
+        return functools.partial(
+            bound_flow_function.func,
+            *(
+                _column_dependency(dependency)
+                if flow_function_name in column_dependency_names
+                else dependency
+                for (flow_function_name, _), dependency in zip(
+                    self._flow_functions_arguments, dependency_args
+                )
+            ),
+            **{
+                flow_function_name: _column_dependency(dependency)
+                if flow_function_name in column_dependency_names
+                else dependency
+                for flow_function_name, dependency in dependency_kwargs.items()
+            },
+        )
+
+    def _call_in_process(
+        self, bound_flow_function: Callable[..., ReturnType], *args: Any, **kwargs: Any
+    ) -> ReturnType:
+        """Call the flow function in the process pool with its dependency values.
+
+        The dependencies are resolved in this process, so the worker process
+        does not need the flow context.
+        """
+        dependency_args, dependency_kwargs = dependencies(bound_flow_function)
+        dependency_values = tuple(
+            FlowFunctionValue(dependency()) for dependency in dependency_args
+        )
+        dependency_keyword_values = {
+            name: FlowFunctionValue(dependency())
+            for name, dependency in dependency_kwargs.items()
+        }
+        result: ReturnType = (
+            process_pool()
+            .submit(
+                call_in_process,
+                self,
+                dependency_values + args,
+                {**dependency_keyword_values, **kwargs},
+            )
+            .result()
+        )
+        return result
+
+
+def _column_dependency(dependency: Callable[..., Any]) -> Callable[..., Any]:
+    return lambda *args, **kwargs: repeated_column(dependency(*args, **kwargs), 1)
+
+
+def _call_with_single_values(
+    vectorized_flow_function: Callable[..., Any],
+    positional_columns: tuple[bool, ...],
+    keyword_columns: frozenset[str],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Call the vectorized flow function with columns of the single values.
+
+    Arguments of the parameters without defaults, positional or keyword,
+    are passed as columns of one value; arguments of the parameters
+    with defaults as they are. Returns the value of the returned column.
+    """
+    return vectorized_flow_function(
+        *(
+            repeated_column(arg, 1)
+            if index >= len(positional_columns) or positional_columns[index]
+            else arg
+            for index, arg in enumerate(args)
+        ),
+        **{
+            name: repeated_column(kwarg, 1) if name in keyword_columns else kwarg
+            for name, kwarg in kwargs.items()
+        },
+    )[0]
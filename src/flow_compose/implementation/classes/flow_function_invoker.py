@@ -1,32 +1,219 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import functools
+import threading
+from concurrent import futures
+from collections.abc import Callable, Hashable, Iterable, Sequence
 from typing import Generic, Any
 
 from flow_compose.implementation.classes.flow_function import FlowFunction
 from flow_compose.implementation.classes import base
-from flow_compose.implementation.classes.flow_argument import FlowArgument
+from flow_compose.implementation.classes.base.flow_columns import FlowColumns
+from flow_compose.implementation.classes.base.flow_function_batch import (
+    FlowFunctionWriteBatch,
+)
+from flow_compose.implementation.classes.base.flow_function_invoker import CACHE_MISS
 from flow_compose.types import ReturnType
 
+# marks the threads executing prefetched calls; a prefetched call waiting in
+#  an executor thread for calls queued behind it could exhaust the executor
+_prefetched_call_thread = threading.local()
+
 
 class FlowFunctionInvoker(
     base.FlowFunctionInvoker[FlowFunction[ReturnType], ReturnType], Generic[ReturnType]
 ):
+    __slots__ = ("_pending_calls",)
+
+    def __init__(
+        self,
+        flow_function: FlowFunction[ReturnType],
+        flow_context: base.FlowContext,
+    ) -> None:
+        super().__init__(flow_function, flow_context)
+        # futures of the prefetched calls by cache key, created on the first prefetch
+        self._pending_calls: dict[Hashable, futures.Future[ReturnType]] | None = None
+
+    def reset(self) -> None:
+        super().reset()
+        self._pending_calls = None
+
     def __call__(self, *args: Any, **kwargs: Any) -> ReturnType:
-        if not self._flow_function.cached:
-            if not isinstance(self._flow_function, FlowArgument):
-                kwargs["__flow_context"] = self._flow_context
-            return self._flow_function(*args, **kwargs)
+        bound_flow_function = self._bound_flow_function or self._bind()
+        flow_function = self._flow_function
+        if not flow_function.cached:
+            return bound_flow_function(*args, **kwargs)
+
+        cache_key = (
+            flow_function.cache_key(args, kwargs)
+            if args or kwargs
+            else flow_function.empty_call_cache_key
+        )
+        result = self._flow_function_cache.get(cache_key, CACHE_MISS)
+        if result is not CACHE_MISS:
+            return result
+
+        if self._pending_calls is not None:
+            pending_call = self._pending_calls.get(cache_key)
+            if pending_call is not None:
+                return pending_call.result()
+
+        result = bound_flow_function(*args, **kwargs)
+
+        self._flow_function_cache[cache_key] = result
 
-        values_for_hash = tuple(v for v in args + tuple(kwargs.values()))
-        cache_hash = hash(values_for_hash)
-        if cache_hash in self._flow_function_cache:
-            return self._flow_function_cache[cache_hash]
+        return result
 
-        kwargs["__flow_context"] = self._flow_context
+    def prefetch(
+        self, executor: futures.Executor | None
+    ) -> futures.Future[ReturnType] | None:
+        if executor is None:
+            self()
+            return None
 
-        result = self._flow_function(*args, **kwargs)
+        cache_key = self._flow_function.empty_call_cache_key
+        if self._pending_calls is None:
+            self._pending_calls = {}
+        elif cache_key in self._pending_calls:
+            return None
+        if self._flow_function_cache.get(cache_key, CACHE_MISS) is not CACHE_MISS:
+            return None
 
-        self._flow_function_cache[cache_hash] = result
+        pending_call = self._pending_calls[cache_key] = executor.submit(
+            self._call_prefetched,
+            self._bound_flow_function or self._bind(),
+            cache_key,
+        )
+        return pending_call
 
+    def _call_prefetched(
+        self, bound_flow_function: Callable[..., ReturnType], cache_key: Hashable
+    ) -> ReturnType:
+        _prefetched_call_thread.active = True
+        try:
+            result = bound_flow_function()
+        except BaseException:
+            # failed calls are not cached, later calls execute the flow function
+            self._pending_calls.pop(cache_key, None)
+            raise
+        finally:
+            _prefetched_call_thread.active = False
+        self._flow_function_cache[cache_key] = result
         return result
+
+    @staticmethod
+    def flush_write_batches(write_batches: Sequence[FlowFunctionWriteBatch]) -> None:
+        for write_batch in write_batches:
+            values = write_batch.take()
+            if values:
+                write_batch.bulk_flow_function(values)
+
+
+def prefetch_flow_function_invokers(flow_function_invokers: Iterable[Any]) -> None:
+    """Submit the independent I/O-bound flow functions to the flow executor.
+
+    Their results are cached, so the later calls from the function body
+    return them or wait for them. A single candidate is left to the body.
+    Prefetched calls do not prefetch their own dependencies.
+    """
+    if getattr(_prefetched_call_thread, "active", False):
+        return
+    prefetched_invokers = [
+        flow_function_invoker
+        for flow_function_invoker in flow_function_invokers
+        if isinstance(flow_function_invoker, FlowFunctionInvoker)
+        and flow_function_invoker._flow_function.io_bound
+        and flow_function_invoker._flow_function.callable_without_arguments
+    ]
+    if len(prefetched_invokers) > 1:
+        for flow_function_invoker in prefetched_invokers:
+            flow_context = flow_function_invoker._flow_context
+            flow_context.add_background_call(
+                flow_function_invoker.prefetch(flow_context.executor)
+            )
+
+
+class ConcurrentFlowFunctionInvoker(FlowFunctionInvoker[ReturnType]):
+    """Calls independent I/O-bound dependencies of a flow function concurrently.
+
+    When the flow function is bound, before its first call in a flow invocation,
+    its I/O-bound dependencies callable without arguments are submitted
+    to the executor of the flow.
+    """
+
+    __slots__ = ()
+
+    concurrent = True
+
+    def _bind(self) -> Callable[..., Any]:
+        bound_flow_function = super()._bind()
+        if isinstance(bound_flow_function, functools.partial):
+            # `bind` binds the dependency invokers with a partial
+            prefetch_flow_function_invokers(
+                (*bound_flow_function.args, *bound_flow_function.keywords.values())
+            )
+        return bound_flow_function
+
+
+class ColumnFlowFunctionInvoker(FlowFunctionInvoker[ReturnType]):
+    """Invokes flow functions in a flow invocation with columns of values.
+
+    Vectorized flow functions and flow arguments are called with the columns,
+    flow functions that depend on the columns are called once per row;
+    see `FlowColumns`.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> ReturnType:
+        flow_function = self._flow_function
+        columns = self._flow_context.columns
+        assert columns is not None
+        if flow_function.vectorized:
+            if args or kwargs:
+                return columns.add_column(super().__call__(*args, **kwargs))
+            return columns.vectorized_column(self, super().__call__)
+        if isinstance(flow_function, base.FlowArgument) or not (
+            columns.depends_on_columns(flow_function)
+            or any(columns.is_column(arg) for arg in args)
+            or any(columns.is_column(kwarg) for kwarg in kwargs.values())
+        ):
+            return super().__call__(*args, **kwargs)
+        return columns.call_rows(self, args, kwargs)  # type: ignore[return-value]
+
+
+class RowValueInvoker(FlowFunctionInvoker[Any]):
+    """Invokes a vectorized flow function in the flow context of a row.
+
+    Called without arguments, it returns the value of the row in the column
+    of the vectorized flow function; otherwise it calls the flow function
+    with the single values.
+    """
+
+    __slots__ = ("_columns", "_column_invoker", "_row", "_row_invoker")
+
+    def __init__(
+        self,
+        flow_function: FlowFunction[Any],
+        flow_context: base.FlowContext,
+        columns: FlowColumns,
+        column_invoker: FlowFunctionInvoker[Any],
+        row: int,
+    ) -> None:
+        super().__init__(flow_function, flow_context)
+        self._columns = columns
+        self._column_invoker = column_invoker
+        self._row = row
+        self._row_invoker: Any = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if args or kwargs:
+            if self._row_invoker is None:
+                self._row_invoker = self._flow_context.create_flow_function_invoker(
+                    self._flow_function
+                )
+            return self._row_invoker(*args, **kwargs)
+        return self._columns.vectorized_column(
+            self._column_invoker, self._column_invoker
+        )[self._row]
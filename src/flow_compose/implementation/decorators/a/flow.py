@@ -1,19 +1,29 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import functools
 import inspect
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
 from typing import Any, Awaitable
 
 from flow_compose.extensions.makefun_extension import with_signature
 from flow_compose.implementation.classes.a.flow_argument import FlowArgument
 from flow_compose.implementation.classes.a.flow_function import FlowFunction
 from flow_compose.implementation.classes.a.flow_function_invoker import (
+    ConcurrentFlowFunctionInvoker,
     FlowFunctionInvoker,
+    prefetch_flow_function_invokers,
 )
+from flow_compose.implementation.classes.base.flow_profile import FlowProfile
 from flow_compose.implementation.decorators.base.flow import (
     get_flow_parameters,
+    get_flow_execution_plan,
     flow_invoker_common,
+    compile_flow_invoker,
+    check_flow_option,
+    FlowExecutionPlan,
+    FlowMap,
+    FlowParameters,
 )
 from flow_compose.types import (
     ReturnType,
@@ -21,34 +31,160 @@ from flow_compose.types import (
 
 
 def decorator(
+    *,
+    # flow options also accept FlowFunction so that configurations spread
+    #  from a dictionary type-check; see `check_flow_option`
+    compile: bool | FlowFunction[Any] = False,
+    concurrent: bool | FlowFunction[Any] = False,
+    speculate: bool | FlowProfile | FlowFunction[Any] = False,
     **flow_functions_configuration: FlowFunction[Any],
 ) -> Callable[
     [Callable[..., Awaitable[ReturnType]]], Callable[..., Awaitable[ReturnType]]
 ]:
+    check_flow_option(name="compile", value=compile, option_type=bool)
+    check_flow_option(name="concurrent", value=concurrent, option_type=bool)
+    check_flow_option(
+        name="speculate", value=speculate, option_type=(bool, FlowProfile)
+    )
+    flow_profile = (
+        speculate
+        if isinstance(speculate, FlowProfile)
+        else FlowProfile()
+        if speculate
+        else None
+    )
+    flow_function_invoker_class = (
+        ConcurrentFlowFunctionInvoker if concurrent else FlowFunctionInvoker
+    )
+
     def wrapper(
         wrapped_flow: Callable[..., Awaitable[ReturnType]],
     ) -> Callable[..., Awaitable[ReturnType]]:
+        if concurrent:
+            wrapped_flow = concurrent_flow(wrapped_flow)
+
         flow_parameters = get_flow_parameters(
             flow_functions_configuration=flow_functions_configuration,
             wrapped_flow=wrapped_flow,
         )
-
-        @with_signature(
-            func_name=wrapped_flow.__name__,
-            func_signature=inspect.Signature(flow_parameters.flow_signature_parameters),
+        execution_plan = get_flow_execution_plan(
+            flow_functions_configuration=flow_functions_configuration,
+            flow_parameters=flow_parameters,
+            wrapped_flow=wrapped_flow,
+            flow_argument_class=FlowArgument,
         )
-        async def flow_invoker(**kwargs: Any) -> ReturnType:
-            flow_invoker_common(
-                flow_functions_configuration=flow_functions_configuration,
+        if flow_profile is not None:
+            flow_profile.track(execution_plan.configured_flow_functions)
+
+        if compile:
+            flow_invoker = compile_flow_invoker(
+                execution_plan=execution_plan,
                 flow_parameters=flow_parameters,
                 wrapped_flow=wrapped_flow,
-                flow_function_invoker_class=FlowFunctionInvoker,
-                flow_argument_class=FlowArgument,
-                kwargs=kwargs,
+                flow_function_invoker_class=flow_function_invoker_class,
+                is_async=True,
+                flow_profile=flow_profile,
             )
+        else:
+            flow_invoker = interpreted_flow_invoker(
+                execution_plan=execution_plan,
+                flow_parameters=flow_parameters,
+                wrapped_flow=wrapped_flow,
+                flow_function_invoker_class=flow_function_invoker_class,
+                flow_profile=flow_profile,
+            )
+
+        if flow_profile is not None:
+            flow_invoker.speculation_info = flow_profile.info  # type: ignore[attr-defined]
 
-            return await wrapped_flow(**kwargs)
+        def flow_map(
+            items: Iterable[Mapping[str, Any]], shared: Iterable[str] = ()
+        ) -> AsyncIterator[ReturnType]:
+            """Invoke the flow with the keyword arguments of each item.
+
+            The results are generated in the order of the items.
+            The cached results of the `shared` flow function aliases
+            are shared by all items.
+            """
+            return map_flow(
+                flow_map=FlowMap(
+                    execution_plan=execution_plan,
+                    flow_parameters=flow_parameters,
+                    flow_function_invoker_class=flow_function_invoker_class,
+                    shared=shared,
+                ),
+                wrapped_flow=wrapped_flow,
+                items=items,
+            )
+
+        flow_invoker.amap = flow_map  # type: ignore[attr-defined]
 
         return flow_invoker
 
     return wrapper
+
+
+def interpreted_flow_invoker(
+    execution_plan: FlowExecutionPlan,
+    flow_parameters: FlowParameters,
+    wrapped_flow: Callable[..., Awaitable[ReturnType]],
+    flow_function_invoker_class: type[FlowFunctionInvoker[Any]],
+    flow_profile: FlowProfile | None,
+) -> Callable[..., Awaitable[ReturnType]]:
+    @with_signature(
+        func_name=wrapped_flow.__name__,
+        qualname=wrapped_flow.__qualname__,
+        module_name=wrapped_flow.__module__,
+        func_signature=inspect.Signature(flow_parameters.flow_signature_parameters),
+    )
+    async def flow_invoker(**kwargs: Any) -> ReturnType:
+        flow_context = flow_invoker_common(
+            execution_plan=execution_plan,
+            flow_function_invoker_class=flow_function_invoker_class,
+            kwargs=kwargs,
+            flow_profile=flow_profile,
+        )
+
+        try:
+            result = await wrapped_flow(**kwargs)
+            if flow_context.write_batches is not None:
+                await flow_context.flush()
+            return result
+        finally:
+            flow_context.close()
+
+    return flow_invoker
+
+
+async def map_flow(
+    flow_map: FlowMap,
+    wrapped_flow: Callable[..., Awaitable[ReturnType]],
+    items: Iterable[Mapping[str, Any]],
+) -> AsyncIterator[ReturnType]:
+    flow_context = flow_map.flow_context
+    try:
+        for item in items:
+            kwargs = flow_map.kwargs(item)
+            try:
+                result = await wrapped_flow(**kwargs)
+                if flow_context.write_batches is not None:
+                    await flow_context.flush()
+            finally:
+                flow_map.recycle()
+            yield result
+    finally:
+        flow_context.close()
+
+
+def concurrent_flow(
+    wrapped_flow: Callable[..., Awaitable[ReturnType]],
+) -> Callable[..., Awaitable[ReturnType]]:
+    """Resolve the flow functions passed to the flow body concurrently."""
+
+    @functools.wraps(wrapped_flow)
+    async def flow_body(*args: Any, **kwargs: Any) -> ReturnType:
+        # compiled flows pass positional-only and variadic arguments positionally
+        await prefetch_flow_function_invokers((*args, *kwargs.values()))
+        return await wrapped_flow(*args, **kwargs)
+
+    return flow_body
@@ -2,9 +2,14 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import inspect
+from collections.abc import Iterable, Mapping
+from concurrent import futures
 from dataclasses import dataclass
 from typing import Any, Callable, get_args
 
+from flow_compose.implementation.classes.base.flow_columns import (
+    depends_on_flow_arguments,
+)
 from flow_compose.implementation.classes.base.flow_function_invoker import (
     FlowFunctionInvokerT,
     FlowFunctionT,
@@ -15,6 +20,7 @@ from flow_compose.implementation.classes.base import (
     FlowArgument,
     FlowContext,
 )
+from flow_compose.implementation.classes.base.flow_profile import FlowProfile
 from flow_compose.implementation.helpers import is_parameter_subclass_type
 
 
@@ -22,7 +28,22 @@ from flow_compose.implementation.helpers import is_parameter_subclass_type
 class FlowParameters:
     flow_signature_parameters: list[inspect.Parameter]
     flow_functions_parameters: list[inspect.Parameter]
-    non_flow_function_arguments: list[FlowFunction[Any]]
+    non_flow_function_arguments: list[FlowArgument[Any]]
+    flow_context_parameter_name: str | None
+
+
+def check_flow_option(
+    name: str, value: Any, option_type: type[Any] | tuple[type[Any], ...]
+) -> None:
+    if isinstance(value, FlowFunction):
+        raise AssertionError(
+            f"`{name}` is a flow option and cannot be used as a flow function alias."
+        )
+    option_types = option_type if isinstance(option_type, tuple) else (option_type,)
+    assert isinstance(value, option_types), (
+        f"Flow option `{name}` has to be"
+        f" `{'` or `'.join(option_type.__name__ for option_type in option_types)}`."
+    )
 
 
 def get_flow_parameters(
@@ -33,10 +54,20 @@ def get_flow_parameters(
     flow_functions_parameters: list[inspect.Parameter] = []
     non_flow_functions_parameters: list[inspect.Parameter] = []
     flow_function_arguments: set[str] = set()
+    flow_context_parameter_name = None
 
     # the next flag tells us when we are in flow_function arguments
     flow_functions_argument_found = False
     for parameter in all_parameters:
+        if is_parameter_subclass_type(parameter, FlowContext):
+            # the flow context is passed to the flow body, it is not a flow argument
+            assert flow_context_parameter_name is None, (
+                "flow can have only one FlowContext argument."
+            )
+            flow_context_parameter_name = parameter.name
+            flow_functions_argument_found = True
+            continue
+
         if not is_parameter_subclass_type(parameter, FlowFunction):
             if flow_functions_argument_found:
                 raise AssertionError(
@@ -65,7 +96,7 @@ def get_flow_parameters(
     flow_functions_argument_parameters_without_default: list[inspect.Parameter] = []
     flow_functions_argument_parameters_with_default: list[inspect.Parameter] = []
     non_flow_function_arguments: list[
-        FlowFunction[Any]
+        FlowArgument[Any]
     ] = []  # Argument in configuration that are not flow argument
     for (
         flow_function_name,
@@ -95,8 +126,7 @@ def get_flow_parameters(
             )
             continue
 
-        if isinstance(flow_function_configuration, FlowFunction):
-            non_flow_function_arguments.append(flow_function_configuration)
+        non_flow_function_arguments.append(flow_function_configuration)
         new_parameter = inspect.Parameter(
             name=flow_function_name,
             kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -108,85 +138,467 @@ def get_flow_parameters(
         else:
             flow_functions_argument_parameters_with_default.append(new_parameter)
 
+    # flow arguments with a default go before `**kwargs` of the flow body,
+    #  and after `*args` they can only be passed by keyword
+    var_keyword_parameters = [
+        parameter
+        for parameter in non_flow_functions_parameters
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD
+    ]
+    if any(
+        parameter.kind is inspect.Parameter.VAR_POSITIONAL
+        for parameter in non_flow_functions_parameters
+    ):
+        flow_functions_argument_parameters_with_default = [
+            parameter.replace(kind=inspect.Parameter.KEYWORD_ONLY)
+            for parameter in flow_functions_argument_parameters_with_default
+        ]
+
     return FlowParameters(
         flow_signature_parameters=flow_functions_argument_parameters_without_default
-        + non_flow_functions_parameters
-        + flow_functions_argument_parameters_with_default,
+        + [
+            parameter
+            for parameter in non_flow_functions_parameters
+            if parameter.kind is not inspect.Parameter.VAR_KEYWORD
+        ]
+        + flow_functions_argument_parameters_with_default
+        + var_keyword_parameters,
         flow_functions_parameters=flow_functions_parameters,
         non_flow_function_arguments=non_flow_function_arguments,
+        flow_context_parameter_name=flow_context_parameter_name,
     )
 
 
-def flow_invoker_common(
+@dataclass(frozen=True)
+class FlowExecutionPlan:
+    """Per-flow invocation steps resolved once, when the flow is decorated."""
+
+    # configured aliases that are not flow arguments
+    configured_flow_functions: dict[str, FlowFunction[Any]]
+    # flow functions of all aliases available to the flow functions,
+    #  flow arguments included
+    flow_functions: dict[str, FlowFunction[Any]]
+    # flow arguments in the configuration that are not flow body arguments
+    configured_flow_arguments: tuple[FlowArgument[Any], ...]
+    # flow body arguments annotated with FlowArgument
+    #  with the flow argument that reads their value from the flow context
+    flow_argument_parameters: tuple[tuple[str, FlowArgument[Any]], ...]
+    # flow body arguments with a default FlowFunction and not in the configuration
+    default_parameters: tuple[tuple[str, FlowFunction[Any]], ...]
+    # flow body arguments with a default FlowFunction overriding the configuration
+    overriding_default_parameters: tuple[tuple[str, FlowFunction[Any]], ...]
+    # flow body arguments taken from the configuration
+    configured_parameters: tuple[str, ...]
+    # flow body argument annotated with FlowContext
+    flow_context_parameter_name: str | None
+    missing_flow_functions_message: str | None
+
+
+def get_flow_execution_plan(
     flow_functions_configuration: dict[str, FlowFunctionT],
     flow_parameters: FlowParameters,
     wrapped_flow: Callable[..., ReturnType],
-    flow_function_invoker_class: type[FlowFunctionInvokerT],
     flow_argument_class: type[FlowArgument[Any]],
+) -> FlowExecutionPlan:
+    flow_argument_parameters: list[tuple[str, FlowArgument[Any]]] = []
+    default_parameters: list[tuple[str, FlowFunction[Any]]] = []
+    overriding_default_parameters: list[tuple[str, FlowFunction[Any]]] = []
+    configured_parameters: list[str] = []
+    missing_flow_arguments: list[str] = []
+    flow_argument_names = {
+        parameter.name for parameter in flow_parameters.flow_signature_parameters
+    }
+    flow_function_parameter_names = {
+        parameter.name for parameter in flow_parameters.flow_functions_parameters
+    }
+    for flow_function_parameter in flow_parameters.flow_functions_parameters:
+        if flow_function_parameter.name in flow_argument_names:
+            argument_types = get_args(flow_function_parameter.annotation)
+            argument_type: Any = argument_types[0] if len(argument_types) > 0 else Any
+            flow_argument = flow_argument_class(argument_type)
+            flow_argument.name = flow_function_parameter.name
+            flow_argument_parameters.append(
+                (flow_function_parameter.name, flow_argument)
+            )
+        elif flow_function_parameter.default is not inspect.Parameter.empty:
+            if flow_function_parameter.name in flow_functions_configuration:
+                overriding_default_parameters.append(
+                    (flow_function_parameter.name, flow_function_parameter.default)
+                )
+            else:
+                default_parameters.append(
+                    (flow_function_parameter.name, flow_function_parameter.default)
+                )
+        elif flow_function_parameter.name in flow_functions_configuration:
+            configured_parameters.append(flow_function_parameter.name)
+        else:
+            missing_flow_arguments.append(flow_function_parameter.name)
+
+    flow_functions: dict[str, FlowFunction[Any]] = {
+        **flow_functions_configuration,
+        **dict(default_parameters),
+        **dict(flow_argument_parameters),
+    }
+    for flow_function in (
+        *flow_functions.values(),
+        *(flow_function for _, flow_function in overriding_default_parameters),
+    ):
+        flow_function.check_dependencies(flow_functions)
+
+    missing_flow_functions_message = (
+        f"`{'`, `'.join(missing_flow_arguments)}`"
+        f" {'FlowFunction is' if len(missing_flow_arguments) == 1 else 'FlowFunctions are'}"
+        f" required by the flow `{wrapped_flow.__name__}`"
+        f" but {'is' if len(missing_flow_arguments) == 1 else 'are'}"
+        f" missing in the flow context."
+        if len(missing_flow_arguments) > 0
+        else None
+    )
+
+    return FlowExecutionPlan(
+        flow_functions=flow_functions,
+        configured_flow_functions={
+            flow_function_name: flow_function
+            for flow_function_name, flow_function in flow_functions_configuration.items()
+            if not isinstance(flow_function, FlowArgument)
+        },
+        configured_flow_arguments=tuple(
+            flow_argument
+            for flow_argument in flow_parameters.non_flow_function_arguments
+            if flow_argument.name not in flow_function_parameter_names
+        ),
+        flow_argument_parameters=tuple(flow_argument_parameters),
+        default_parameters=tuple(default_parameters),
+        overriding_default_parameters=tuple(overriding_default_parameters),
+        configured_parameters=tuple(configured_parameters),
+        flow_context_parameter_name=flow_parameters.flow_context_parameter_name,
+        missing_flow_functions_message=missing_flow_functions_message,
+    )
+
+
+def flow_invoker_common(
+    execution_plan: FlowExecutionPlan,
+    flow_function_invoker_class: type[FlowFunctionInvokerT],
     kwargs: dict[str, Any],
-) -> None:
-    flow_context = FlowContext()
+    flow_profile: FlowProfile | None = None,
+    executor: futures.Executor | None = None,
+    flow_context: FlowContext | None = None,
+) -> FlowContext:
+    if execution_plan.missing_flow_functions_message is not None:
+        raise AssertionError(execution_plan.missing_flow_functions_message)
 
-    for configured_flow_function in flow_functions_configuration:
-        flow_context[configured_flow_function] = flow_function_invoker_class(
-            flow_function=flow_functions_configuration[configured_flow_function],
-            flow_context=flow_context,
+    if flow_context is None:
+        flow_context = FlowContext(
+            flow_functions_configuration=execution_plan.configured_flow_functions,
+            flow_function_invoker_class=flow_function_invoker_class,
+            flow_profile=flow_profile,
+            executor=executor,
         )
 
-    missing_flow_arguments: list[str] = []
-    for flow_function_parameter in flow_parameters.flow_functions_parameters:
-        if (
-            flow_function_parameter.name not in flow_context
-            and flow_function_parameter.default is inspect.Parameter.empty
-            and flow_function_parameter.name not in kwargs
-        ):
-            missing_flow_arguments.append(flow_function_parameter.name)
-            continue
+    # flow argument values are kept in the flow context, flow arguments are shared
+    #  by concurrent flow invocations
+    if execution_plan.configured_flow_arguments:
+        flow_context.flow_arguments = {}
+        for flow_argument in execution_plan.configured_flow_arguments:
+            flow_context.flow_arguments[flow_argument.name] = kwargs.pop(
+                flow_argument.name
+            )
+            flow_context[flow_argument.name] = flow_function_invoker_class(
+                flow_function=flow_argument,
+                flow_context=flow_context,
+            )
 
-        if flow_function_parameter.name in kwargs:
-            if not isinstance(kwargs[flow_function_parameter.name], FlowFunction):
-                kwargs[flow_function_parameter.name] = flow_argument_class(
-                    get_args(flow_function_parameter.annotation)[0],
-                    default=kwargs[flow_function_parameter.name],
-                )
-            flow_context[flow_function_parameter.name] = flow_function_invoker_class(
-                flow_function=kwargs[flow_function_parameter.name],
+    for flow_argument_name, flow_argument in execution_plan.flow_argument_parameters:
+        flow_argument_value = kwargs[flow_argument_name]
+        if not isinstance(flow_argument_value, FlowFunction):
+            if flow_context.flow_arguments is None:
+                flow_context.flow_arguments = {}
+            flow_context.flow_arguments[flow_argument_name] = flow_argument_value
+            flow_argument_value = flow_argument
+        kwargs[flow_argument_name] = flow_context[flow_argument_name] = (
+            flow_function_invoker_class(
+                flow_function=flow_argument_value,
                 flow_context=flow_context,
             )
-            kwargs[flow_function_parameter.name] = flow_context[
-                flow_function_parameter.name
-            ]
+        )
+
+    for flow_function_name, flow_function in execution_plan.default_parameters:
+        kwargs[flow_function_name] = flow_context[flow_function_name] = (
+            flow_function_invoker_class(
+                flow_function=flow_function,
+                flow_context=flow_context,
+            )
+        )
+
+    for (
+        flow_function_name,
+        flow_function,
+    ) in execution_plan.overriding_default_parameters:
+        kwargs[flow_function_name] = flow_function_invoker_class(
+            flow_function=flow_function,
+            flow_context=flow_context,
+        )
+
+    for flow_function_name in execution_plan.configured_parameters:
+        kwargs[flow_function_name] = flow_context[flow_function_name]
+
+    if execution_plan.flow_context_parameter_name is not None:
+        kwargs[execution_plan.flow_context_parameter_name] = flow_context
+
+    if flow_profile is not None:
+        flow_context.speculate()
+
+    return flow_context
+
+
+class FlowMap:
+    """The flow invocations of the items of `flow.map`.
+
+    The flow context and its flow function invokers are created once and
+    recycled between the items; the cached results of the shared flow functions
+    are kept, so they are computed by the first item that calls them.
+    """
+
+    __slots__ = (
+        "_execution_plan",
+        "_flow_function_invoker_class",
+        "_flow_signature",
+        "_parameter_names",
+        "_required_parameter_names",
+        "_default_arguments",
+        "_shared_flow_function_names",
+        "flow_context",
+    )
+
+    def __init__(
+        self,
+        execution_plan: FlowExecutionPlan,
+        flow_parameters: FlowParameters,
+        flow_function_invoker_class: type[FlowFunctionInvokerT],
+        shared: Iterable[str] = (),
+        executor: futures.Executor | None = None,
+    ) -> None:
+        self._shared_flow_function_names = frozenset(shared)
+        for flow_function_name in self._shared_flow_function_names:
+            flow_function = execution_plan.configured_flow_functions.get(
+                flow_function_name
+            )
+            assert flow_function is not None and flow_function.cached, (
+                f"`{flow_function_name}` has to be a cached FlowFunction"
+                f" in the flow configuration to be shared by the items of `map`."
+            )
+            # the result of the first item would be returned to the others
+            assert not depends_on_flow_arguments(
+                flow_function, execution_plan.flow_functions.get, {}
+            ), (
+                f"`{flow_function_name}` depends on flow arguments"
+                f" and cannot be shared by the items of `map`."
+            )
+        self._execution_plan = execution_plan
+        self._flow_function_invoker_class = flow_function_invoker_class
+        self._flow_signature = inspect.Signature(
+            flow_parameters.flow_signature_parameters
+        )
+        self._parameter_names = frozenset(self._flow_signature.parameters)
+        self._required_parameter_names = frozenset(
+            parameter.name
+            for parameter in flow_parameters.flow_signature_parameters
+            if parameter.default is inspect.Parameter.empty
+        )
+        self._default_arguments = {
+            parameter.name: parameter.default
+            for parameter in flow_parameters.flow_signature_parameters
+            if parameter.default is not inspect.Parameter.empty
+        }
+        self.flow_context = FlowContext(
+            flow_functions_configuration=execution_plan.configured_flow_functions,
+            flow_function_invoker_class=flow_function_invoker_class,
+            executor=executor,
+        )
+
+    def kwargs(self, item: Mapping[str, Any]) -> dict[str, Any]:
+        """The arguments of the flow body for the invocation of the item."""
+        item_names = item.keys()
+        if not (
+            item_names <= self._parameter_names
+            and self._required_parameter_names <= item_names
+        ):
+            # raises the TypeError of a call with the same arguments
+            self._flow_signature.bind(**item)
+        kwargs = {**self._default_arguments, **item}
+        flow_invoker_common(
+            execution_plan=self._execution_plan,
+            flow_function_invoker_class=self._flow_function_invoker_class,
+            kwargs=kwargs,
+            flow_context=self.flow_context,
+        )
+        return kwargs
+
+    def recycle(self) -> None:
+        self.flow_context.recycle(self._shared_flow_function_names)
+
+
+def compile_flow_invoker(
+    execution_plan: FlowExecutionPlan,
+    flow_parameters: FlowParameters,
+    wrapped_flow: Callable[..., ReturnType],
+    flow_function_invoker_class: type[FlowFunctionInvokerT],
+    is_async: bool,
+    flow_profile: FlowProfile | None = None,
+    executor: futures.Executor | None = None,
+) -> Callable[..., Any]:
+    """Generate the flow invoker as straight-line source specialized to the flow.
+
+    The generated function has the flow signature and executes the steps of
+    the execution plan with alias names as constants and without loops.
+    """
+    namespace: dict[str, Any] = {
+        "__name__": __name__,
+        "__FlowContext": FlowContext,
+        "__FlowFunction": FlowFunction,
+        "__FlowFunctionInvoker": flow_function_invoker_class,
+        "__configured_flow_functions": execution_plan.configured_flow_functions,
+        "__wrapped_flow": wrapped_flow,
+        "__flow_profile": flow_profile,
+        "__executor": executor,
+    }
 
+    signature_source: list[str] = []
+    for index, parameter in enumerate(flow_parameters.flow_signature_parameters):
+        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            signature_source.append(f"*{parameter.name}")
+        elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            signature_source.append(f"**{parameter.name}")
+        elif parameter.default is inspect.Parameter.empty:
+            signature_source.append(parameter.name)
         else:
-            if flow_function_parameter.default is not inspect.Parameter.empty:
-                default_parameter_invoker = flow_function_invoker_class(
-                    flow_function=flow_function_parameter.default,
-                    flow_context=flow_context,
-                )
-                if flow_function_parameter.name not in flow_context:
-                    flow_context[flow_function_parameter.name] = (
-                        default_parameter_invoker
-                    )
-                kwargs[flow_function_parameter.name] = default_parameter_invoker
-            else:
-                kwargs[flow_function_parameter.name] = flow_context[
-                    flow_function_parameter.name
-                ]
+            namespace[f"__default_{index}"] = parameter.default
+            signature_source.append(f"{parameter.name}=__default_{index}")
 
-    if len(missing_flow_arguments) > 0:
-        raise AssertionError(
-            f"`{'`, `'.join(missing_flow_arguments)}`"
-            f" {'FlowFunction is' if len(missing_flow_arguments) == 1 else 'FlowFunctions are'}"
-            f" required by the flow `{wrapped_flow.__name__}`"
-            f" but {'is' if len(missing_flow_arguments) == 1 else 'are'}"
-            f" missing in the flow context."
-        )
-
-    for non_flow_function_argument in flow_parameters.non_flow_function_arguments:
-        if non_flow_function_argument.name in kwargs:
-            non_flow_function_argument.value = kwargs[non_flow_function_argument.name]
-            flow_context[non_flow_function_argument.name] = flow_function_invoker_class(
-                flow_function=non_flow_function_argument,
-                flow_context=flow_context,
+    body_source: list[str] = []
+    if execution_plan.missing_flow_functions_message is not None:
+        namespace["__missing_flow_functions_message"] = (
+            execution_plan.missing_flow_functions_message
+        )
+        body_source.append("raise AssertionError(__missing_flow_functions_message)")
+    else:
+        body_source.append(
+            "__flow_context = __FlowContext("
+            "__configured_flow_functions, __FlowFunctionInvoker,"
+            " __flow_profile, __executor)"
+        )
+        if execution_plan.configured_flow_arguments:
+            body_source.append(
+                "__flow_context.flow_arguments = {"
+                + ", ".join(
+                    f"{flow_argument.name!r}: {flow_argument.name}"
+                    for flow_argument in execution_plan.configured_flow_arguments
+                )
+                + "}"
+            )
+        for index, flow_argument in enumerate(execution_plan.configured_flow_arguments):
+            namespace[f"__configured_flow_argument_{index}"] = flow_argument
+            body_source.append(
+                f"__flow_context[{flow_argument.name!r}] = __FlowFunctionInvoker("
+                f"__configured_flow_argument_{index}, __flow_context)"
+            )
+        for index, (flow_argument_name, flow_argument) in enumerate(
+            execution_plan.flow_argument_parameters
+        ):
+            namespace[f"__flow_argument_{index}"] = flow_argument
+            body_source.append(f"if isinstance({flow_argument_name}, __FlowFunction):")
+            body_source.append(
+                f"    {flow_argument_name} = __flow_context[{flow_argument_name!r}]"
+                f" = __FlowFunctionInvoker({flow_argument_name}, __flow_context)"
+            )
+            body_source.append("else:")
+            body_source.append("    if __flow_context.flow_arguments is None:")
+            body_source.append("        __flow_context.flow_arguments = {}")
+            body_source.append(
+                f"    __flow_context.flow_arguments[{flow_argument_name!r}]"
+                f" = {flow_argument_name}"
+            )
+            body_source.append(
+                f"    {flow_argument_name} = __flow_context[{flow_argument_name!r}]"
+                f" = __FlowFunctionInvoker(__flow_argument_{index}, __flow_context)"
+            )
+        for index, (flow_function_name, flow_function) in enumerate(
+            execution_plan.default_parameters
+        ):
+            namespace[f"__default_flow_function_{index}"] = flow_function
+            body_source.append(
+                f"{flow_function_name} = __flow_context[{flow_function_name!r}]"
+                f" = __FlowFunctionInvoker("
+                f"__default_flow_function_{index}, __flow_context)"
+            )
+        for index, (flow_function_name, flow_function) in enumerate(
+            execution_plan.overriding_default_parameters
+        ):
+            namespace[f"__overriding_flow_function_{index}"] = flow_function
+            body_source.append(
+                f"{flow_function_name} = __FlowFunctionInvoker("
+                f"__overriding_flow_function_{index}, __flow_context)"
+            )
+        for flow_function_name in execution_plan.configured_parameters:
+            body_source.append(
+                f"{flow_function_name} = __flow_context[{flow_function_name!r}]"
             )
-            del kwargs[non_flow_function_argument.name]
+        if execution_plan.flow_context_parameter_name is not None:
+            body_source.append(
+                f"{execution_plan.flow_context_parameter_name} = __flow_context"
+            )
+        if flow_profile is not None:
+            body_source.append("__flow_context.speculate()")
+        wrapped_flow_parameters = inspect.signature(wrapped_flow).parameters.values()
+        # arguments before `*args` of the flow body can only be passed positionally
+        has_var_positional = any(
+            parameter.kind is inspect.Parameter.VAR_POSITIONAL
+            for parameter in wrapped_flow_parameters
+        )
+        wrapped_flow_arguments = ", ".join(
+            f"*{parameter.name}"
+            if parameter.kind is inspect.Parameter.VAR_POSITIONAL
+            else f"**{parameter.name}"
+            if parameter.kind is inspect.Parameter.VAR_KEYWORD
+            else parameter.name
+            if parameter.kind is inspect.Parameter.POSITIONAL_ONLY
+            or parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            and has_var_positional
+            else f"{parameter.name}={parameter.name}"
+            for parameter in wrapped_flow_parameters
+        )
+        body_source.append("try:")
+        body_source.append(
+            f"    __result = {'await ' if is_async else ''}"
+            f"__wrapped_flow({wrapped_flow_arguments})"
+        )
+        body_source.append("    if __flow_context.write_batches is not None:")
+        body_source.append(
+            f"        {'await ' if is_async else ''}__flow_context.flush()"
+        )
+        body_source.append("    return __result")
+        body_source.append("finally:")
+        body_source.append("    __flow_context.close()")
+
+    # the name of the flow is not an identifier for lambdas
+    source = (
+        f"{'async ' if is_async else ''}def flow_invoker"
+        f"({', '.join(signature_source)}):\n"
+        + "".join(f"    {line}\n" for line in body_source)
+    )
+    exec(compile(source, f"<flow {wrapped_flow.__name__}>", "exec"), namespace)
+
+    flow_invoker: Callable[..., Any] = namespace["flow_invoker"]
+    flow_invoker.__name__ = wrapped_flow.__name__
+    # flows decorated at the module level pickle by reference
+    flow_invoker.__module__ = wrapped_flow.__module__
+    flow_invoker.__qualname__ = wrapped_flow.__qualname__
+    flow_invoker.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        flow_parameters.flow_signature_parameters
+    )
+    flow_invoker.__annotations__ = {
+        parameter.name: parameter.annotation
+        for parameter in flow_parameters.flow_signature_parameters
+        if parameter.annotation is not inspect.Parameter.empty
+    }
+    return flow_invoker
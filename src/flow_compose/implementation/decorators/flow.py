@@ -1,19 +1,38 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import collections
+import functools
 import inspect
-from collections.abc import Callable
+import itertools
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent import futures
 from typing import Any
 
 from flow_compose.extensions.makefun_extension import with_signature
+from flow_compose.implementation.classes.base.flow_columns import (
+    FlowColumns,
+    column_length,
+)
 from flow_compose.implementation.classes.flow_argument import FlowArgument
 from flow_compose.implementation.classes.flow_function import FlowFunction
 from flow_compose.implementation.classes.flow_function_invoker import (
+    ColumnFlowFunctionInvoker,
+    ConcurrentFlowFunctionInvoker,
     FlowFunctionInvoker,
+    RowValueInvoker,
+    prefetch_flow_function_invokers,
 )
 from flow_compose.implementation.decorators.base.flow import (
     get_flow_parameters,
+    get_flow_execution_plan,
     flow_invoker_common,
+    compile_flow_invoker,
+    check_flow_option,
+    FlowExecutionPlan,
+    FlowMap,
+    FlowParameters,
 )
 from flow_compose.types import (
     ReturnType,
@@ -21,30 +40,333 @@ from flow_compose.types import (
 
 
 def decorator(
+    *,
+    # flow options also accept FlowFunction so that configurations spread
+    #  from a dictionary type-check; see `check_flow_option`
+    compile: bool | FlowFunction[Any] = False,
+    executor: futures.Executor | FlowFunction[Any] | None = None,
     **flow_functions_configuration: FlowFunction[Any],
 ) -> Callable[[Callable[..., ReturnType]], Callable[..., ReturnType]]:
+    check_flow_option(name="compile", value=compile, option_type=bool)
+    if executor is not None:
+        check_flow_option(name="executor", value=executor, option_type=futures.Executor)
+    flow_executor = executor if isinstance(executor, futures.Executor) else None
+    flow_function_invoker_class = (
+        FlowFunctionInvoker if flow_executor is None else ConcurrentFlowFunctionInvoker
+    )
+
     def wrapper(wrapped_flow: Callable[..., ReturnType]) -> Callable[..., ReturnType]:
+        if flow_executor is not None:
+            wrapped_flow = concurrent_flow(wrapped_flow)
+
         flow_parameters = get_flow_parameters(
             flow_functions_configuration=flow_functions_configuration,
             wrapped_flow=wrapped_flow,
         )
-
-        @with_signature(
-            func_name=wrapped_flow.__name__,
-            func_signature=inspect.Signature(flow_parameters.flow_signature_parameters),
+        execution_plan = get_flow_execution_plan(
+            flow_functions_configuration=flow_functions_configuration,
+            flow_parameters=flow_parameters,
+            wrapped_flow=wrapped_flow,
+            flow_argument_class=FlowArgument,
         )
-        def flow_invoker(**kwargs: Any) -> ReturnType:
-            flow_invoker_common(
-                flow_functions_configuration=flow_functions_configuration,
+
+        def create_flow_map(shared: Iterable[str] = ()) -> FlowMap:
+            return FlowMap(
+                execution_plan=execution_plan,
                 flow_parameters=flow_parameters,
+                flow_function_invoker_class=flow_function_invoker_class,
+                shared=shared,
+                executor=flow_executor,
+            )
+
+        def flow_map(
+            items: Iterable[Mapping[str, Any]], shared: Iterable[str] = ()
+        ) -> Iterator[ReturnType]:
+            """Invoke the flow with the keyword arguments of each item.
+
+            The results are generated in the order of the items.
+            The cached results of the `shared` flow function aliases
+            are shared by all items.
+            """
+            return map_flow(
+                flow_map=create_flow_map(shared),
+                wrapped_flow=wrapped_flow,
+                items=items,
+            )
+
+        def flow_map_columns(
+            columns: Mapping[str, Any], /, **arguments: Any
+        ) -> ReturnType:
+            """Invoke the flow once with columns of flow argument values.
+
+            `columns` maps flow argument names to their columns; `arguments`
+            are single values shared by all rows, even when they are sequences.
+            Vectorized flow functions are called once with the whole columns;
+            flow functions that are not vectorized and depend on the columns
+            are called once per row and return the list of the results.
+            """
+            return map_columns(
+                flow_map=FlowMap(
+                    execution_plan=execution_plan,
+                    flow_parameters=flow_parameters,
+                    flow_function_invoker_class=ColumnFlowFunctionInvoker,
+                ),
                 wrapped_flow=wrapped_flow,
-                flow_function_invoker_class=FlowFunctionInvoker,
-                flow_argument_class=FlowArgument,
-                kwargs=kwargs,
+                columns=columns,
+                arguments=arguments,
             )
 
-            return wrapped_flow(**kwargs)
+        if compile:
+            flow_invoker = compile_flow_invoker(
+                execution_plan=execution_plan,
+                flow_parameters=flow_parameters,
+                wrapped_flow=wrapped_flow,
+                flow_function_invoker_class=flow_function_invoker_class,
+                is_async=False,
+                executor=flow_executor,
+            )
+        else:
+            flow_invoker = interpreted_flow_invoker(
+                execution_plan=execution_plan,
+                flow_parameters=flow_parameters,
+                wrapped_flow=wrapped_flow,
+                flow_function_invoker_class=flow_function_invoker_class,
+                executor=flow_executor,
+            )
 
+        flow_invoker.map = flow_map  # type: ignore[attr-defined]
+        flow_invoker.map_columns = flow_map_columns  # type: ignore[attr-defined]
+        flow_invoker.map_parallel = functools.partial(  # type: ignore[attr-defined]
+            map_parallel, flow_invoker
+        )
+        # worker processes of `map_parallel` create their flow maps with it
+        flow_invoker._create_flow_map = create_flow_map  # type: ignore[attr-defined]
+        flow_invoker._wrapped_flow = wrapped_flow  # type: ignore[attr-defined]
         return flow_invoker
 
     return wrapper
+
+
+def interpreted_flow_invoker(
+    execution_plan: FlowExecutionPlan,
+    flow_parameters: FlowParameters,
+    wrapped_flow: Callable[..., ReturnType],
+    flow_function_invoker_class: type[FlowFunctionInvoker[Any]],
+    executor: futures.Executor | None,
+) -> Callable[..., ReturnType]:
+    @with_signature(
+        func_name=wrapped_flow.__name__,
+        qualname=wrapped_flow.__qualname__,
+        module_name=wrapped_flow.__module__,
+        func_signature=inspect.Signature(flow_parameters.flow_signature_parameters),
+    )
+    def flow_invoker(**kwargs: Any) -> ReturnType:
+        flow_context = flow_invoker_common(
+            execution_plan=execution_plan,
+            flow_function_invoker_class=flow_function_invoker_class,
+            kwargs=kwargs,
+            executor=executor,
+        )
+
+        try:
+            result = wrapped_flow(**kwargs)
+            if flow_context.write_batches is not None:
+                flow_context.flush()
+            return result
+        finally:
+            flow_context.close()
+
+    return flow_invoker
+
+
+def map_flow(
+    flow_map: FlowMap,
+    wrapped_flow: Callable[..., ReturnType],
+    items: Iterable[Mapping[str, Any]],
+    close: bool = True,
+) -> Iterator[ReturnType]:
+    flow_context = flow_map.flow_context
+    try:
+        for item in items:
+            kwargs = flow_map.kwargs(item)
+            try:
+                result = wrapped_flow(**kwargs)
+                if flow_context.write_batches is not None:
+                    flow_context.flush()
+            finally:
+                flow_map.recycle()
+            yield result
+    finally:
+        if close:
+            flow_context.close()
+
+
+def map_columns(
+    flow_map: FlowMap,
+    wrapped_flow: Callable[..., ReturnType],
+    columns: Mapping[str, Any],
+    arguments: Mapping[str, Any],
+) -> ReturnType:
+    assert columns, "`map_columns` requires at least one flow argument column."
+    column_lengths = {name: column_length(value) for name, value in columns.items()}
+    for name, length in column_lengths.items():
+        assert length is not None, (
+            f"Flow argument column `{name}` of `map_columns` has to be"
+            f" a sequence or a NumPy array."
+        )
+        assert name not in arguments, (
+            f"Flow argument `{name}` is passed to `map_columns`"
+            f" both as a column and as a single value."
+        )
+    assert len(set(column_lengths.values())) == 1, (
+        "Flow argument columns of `map_columns` have to have the same length."
+    )
+    flow_context = flow_map.flow_context
+    try:
+        kwargs = flow_map.kwargs({**arguments, **columns})
+        flow_context.columns = FlowColumns(
+            flow_context=flow_context,
+            columns=columns,
+            length=next(iter(column_lengths.values())),
+            row_flow_function_invoker_class=FlowFunctionInvoker,
+            row_value_invoker_class=RowValueInvoker,
+        )
+        result = wrapped_flow(**kwargs)
+        flow_context.columns.flush()
+        if flow_context.write_batches is not None:
+            flow_context.flush()
+        return result
+    finally:
+        flow_context.close()
+
+
+def map_parallel(
+    flow_invoker: Callable[..., ReturnType],
+    items: Iterable[Mapping[str, Any]],
+    workers: int | None = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+    shared: Iterable[str] = (),
+) -> Iterator[ReturnType]:
+    """Invoke the flow with the keyword arguments of each item in worker processes.
+
+    The items are sent to the workers in chunks of `chunksize` items.
+    Each worker keeps its flow map between the chunks, so the results of
+    the `shared` flow function aliases and of the flow functions cached
+    with the "process" scope stay cached in the worker.
+    The results are generated in the order of the items, or in the order
+    of the completed chunks when `ordered` is false.
+    """
+    assert workers is None or workers > 0, "`workers` must be a positive integer."
+    assert chunksize > 0, "`chunksize` must be a positive integer."
+    shared_flow_function_names = frozenset(shared)
+    # fail in the caller when the shared aliases are invalid
+    flow_invoker._create_flow_map(  # type: ignore[attr-defined]
+        shared_flow_function_names
+    ).flow_context.close()
+    return map_parallel_chunks(
+        flow_invoker=flow_invoker,
+        items=items,
+        workers=workers,
+        chunksize=chunksize,
+        ordered=ordered,
+        shared_flow_function_names=shared_flow_function_names,
+    )
+
+
+def map_parallel_chunks(
+    flow_invoker: Callable[..., ReturnType],
+    items: Iterable[Mapping[str, Any]],
+    workers: int | None,
+    chunksize: int,
+    ordered: bool,
+    shared_flow_function_names: frozenset[str],
+) -> Iterator[ReturnType]:
+    max_workers = workers or os.cpu_count() or 1
+    process_pool = futures.ProcessPoolExecutor(max_workers=max_workers)
+    # two chunks per worker are submitted ahead, so items are read as they are needed
+    max_pending_chunks = 2 * max_workers
+    item_iterator = iter(items)
+    pending_chunks: collections.deque[
+        futures.Future[tuple[list[ReturnType], BaseException | None]]
+    ] = collections.deque()
+
+    def submit_chunks() -> None:
+        while len(pending_chunks) < max_pending_chunks:
+            chunk = list(itertools.islice(item_iterator, chunksize))
+            if not chunk:
+                return
+            pending_chunks.append(
+                process_pool.submit(
+                    map_chunk, flow_invoker, shared_flow_function_names, chunk
+                )
+            )
+
+    try:
+        submit_chunks()
+        while pending_chunks:
+            if ordered:
+                pending_chunk = pending_chunks.popleft()
+            else:
+                done_chunks, _ = futures.wait(
+                    pending_chunks, return_when=futures.FIRST_COMPLETED
+                )
+                pending_chunk = next(
+                    chunk for chunk in pending_chunks if chunk in done_chunks
+                )
+                pending_chunks.remove(pending_chunk)
+            results, exception = pending_chunk.result()
+            submit_chunks()
+            yield from results
+            if exception is not None:
+                raise exception
+    finally:
+        process_pool.shutdown(cancel_futures=True)
+
+
+# flow maps of a worker process by flow and shared aliases, kept between chunks
+_worker_flow_maps: dict[tuple[Callable[..., Any], frozenset[str]], FlowMap] = {}
+
+
+def map_chunk(
+    flow_invoker: Callable[..., ReturnType],
+    shared_flow_function_names: frozenset[str],
+    chunk: list[Mapping[str, Any]],
+) -> tuple[list[ReturnType], BaseException | None]:
+    """Invoke the flow for the items of a chunk in a worker process.
+
+    Returns the results of the items invoked before an item raised,
+    and its exception.
+    """
+    flow_map_key = (flow_invoker, shared_flow_function_names)
+    flow_map = _worker_flow_maps.get(flow_map_key)
+    if flow_map is None:
+        flow_map = _worker_flow_maps[flow_map_key] = flow_invoker._create_flow_map(  # type: ignore[attr-defined]
+            shared_flow_function_names
+        )
+    results: list[ReturnType] = []
+    try:
+        for result in map_flow(
+            flow_map=flow_map,
+            wrapped_flow=flow_invoker._wrapped_flow,  # type: ignore[attr-defined]
+            items=chunk,
+            close=False,
+        ):
+            results.append(result)
+    except Exception as exception:
+        return results, exception
+    return results, None
+
+
+def concurrent_flow(
+    wrapped_flow: Callable[..., ReturnType],
+) -> Callable[..., ReturnType]:
+    """Call the I/O-bound flow functions passed to the flow body concurrently."""
+
+    @functools.wraps(wrapped_flow)
+    def flow_body(*args: Any, **kwargs: Any) -> ReturnType:
+        # compiled flows pass positional-only and variadic arguments positionally
+        prefetch_flow_function_invokers((*args, *kwargs.values()))
+        return wrapped_flow(*args, **kwargs)
+
+    return flow_body
@@ -1,7 +1,10 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import importlib
 import inspect
+from collections.abc import Awaitable
 from typing import get_origin, Any
 
 
@@ -21,3 +24,26 @@ def is_parameter_subclass_type(
         if str(err) == "issubclass() arg 1 must be a class":
             return False
         raise err
+
+
+async def gather_fail_fast(*awaitables: Awaitable[Any]) -> list[Any]:
+    """`asyncio.gather` that cancels the remaining awaitables on the first failure.
+
+    Behaves like `asyncio.TaskGroup`, which is not available in Python 3.10.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def import_qualified_name(module_name: str, qualified_name: str) -> Any:
+    """The object with the qualified name in the module; unpickles by reference."""
+    imported_object: Any = importlib.import_module(module_name)
+    for name in qualified_name.split("."):
+        imported_object = getattr(imported_object, name)
+    return imported_object
@@ -0,0 +1,37 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+
+from flow_compose.a import flow_function, FlowFunction
+
+
+@flow_function()
+async def greeting_hello_world() -> str:
+    return "Hello, World!"
+
+
+@flow_function()
+async def greet_using_greeting(
+    index: int, greeting: FlowFunction[str] = greeting_hello_world
+) -> str:
+    return f"{await greeting()} - {index}"
+
+
+@flow_function()
+async def greet_using_configured_greeting(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+class TestFlowFunctionInvokedOutsideFlow(unittest.IsolatedAsyncioTestCase):
+    async def test_flow_function_invoked_outside_flow(self):
+        self.assertEqual(await greet_using_greeting(11), "Hello, World! - 11")
+        self.assertEqual(await greet_using_greeting(index=13), "Hello, World! - 13")
+
+    async def test_flow_function_invoked_outside_flow_without_configuration(self):
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`greeting` FlowFunction is required by `greet_using_configured_greeting`"
+            " FlowFunction but is missing in the flow context.",
+        ):
+            await greet_using_configured_greeting()
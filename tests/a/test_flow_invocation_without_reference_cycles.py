@@ -0,0 +1,51 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import gc
+import unittest
+
+from flow_compose.a import flow, flow_function, FlowFunction, FlowArgument, Flow
+
+
+@flow_function(cached=True)
+async def user__using_user_name(user_name: FlowFunction[str]) -> str:
+    return (await user_name()).capitalize()
+
+
+@flow_function()
+async def greeting__using_user(user: FlowFunction[str]) -> str:
+    return f"Hello, {await user()}!"
+
+
+@flow_function()
+async def greet_using_greeting(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+@flow(
+    user_name=FlowArgument(str),
+    user=user__using_user_name,
+)
+async def hello_user(user: FlowFunction[str]) -> str:
+    return await user()
+
+
+@flow(
+    user_name=FlowArgument(str),
+    user=Flow(hello_user, cached=True),
+    greeting=greeting__using_user,
+)
+async def hello_world(greet: FlowFunction[str] = greet_using_greeting) -> str:
+    return await greet()
+
+
+class TestFlowInvocationWithoutReferenceCycles(unittest.IsolatedAsyncioTestCase):
+    async def test_flow_invocation_without_reference_cycles(self):
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(10):
+                self.assertEqual(await hello_world(user_name="vinko"), "Hello, Vinko!")
+            self.assertEqual(gc.collect(), 0)
+        finally:
+            gc.enable()
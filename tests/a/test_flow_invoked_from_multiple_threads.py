@@ -0,0 +1,74 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import random
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from flow_compose.a import flow, flow_function, FlowFunction, FlowArgument
+
+THREADS = 16
+INVOCATIONS = 500
+
+
+@flow_function()
+async def greeting(
+    greeting_word: FlowFunction[str], user_name: FlowFunction[str]
+) -> str:
+    # lets the other threads run between reading the flow arguments
+    time.sleep(0)
+    return f"{await greeting_word()}, {await user_name()}!"
+
+
+@flow(
+    greeting_word=FlowArgument(str),
+    greeting=greeting,
+)
+async def greet(user_name: FlowArgument[str], greeting: FlowFunction[str]) -> str:
+    time.sleep(0)
+    return f"{await greeting()} ({await user_name()})"
+
+
+@flow(
+    greeting_word=FlowArgument(str),
+    greeting=greeting,
+    compile=True,
+)
+async def greet_compiled(
+    user_name: FlowArgument[str], greeting: FlowFunction[str]
+) -> str:
+    time.sleep(0)
+    return f"{await greeting()} ({await user_name()})"
+
+
+class TestFlowInvokedFromMultipleThreads(unittest.TestCase):
+    def test_flow_arguments_are_isolated_between_threads(self) -> None:
+        for greet_flow in (greet, greet_compiled):
+            with self.subTest(greet_flow=greet_flow.__name__):
+                start = threading.Barrier(THREADS)
+
+                def invoke(seed: int) -> tuple[str, str]:
+                    if seed < THREADS:
+                        start.wait()
+                    arguments = random.Random(seed)
+                    greeting_word = arguments.choice(["Hello", "Hi", "Bok", "Ciao"])
+                    user_name = f"user {arguments.randrange(1_000_000)}"
+
+                    async def invoke_flow() -> str:
+                        return await greet_flow(
+                            greeting_word=greeting_word, user_name=user_name
+                        )
+
+                    return (
+                        asyncio.run(invoke_flow()),
+                        f"{greeting_word}, {user_name}! ({user_name})",
+                    )
+
+                with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                    for greeting_text, expected_greeting_text in executor.map(
+                        invoke, range(INVOCATIONS)
+                    ):
+                        self.assertEqual(greeting_text, expected_greeting_text)
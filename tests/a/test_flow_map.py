@@ -0,0 +1,158 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+from typing import Any
+from unittest.mock import AsyncMock, call
+
+from flow_compose.a import flow, flow_function, FlowArgument, FlowFunction
+
+lookups_mock = AsyncMock()
+
+
+@flow_function(cached=True)
+async def tax_rates() -> dict[str, float]:
+    await lookups_mock.tax_rates()
+    return {"HR": 0.25, "DE": 0.5}
+
+
+@flow_function(cached=True)
+async def tax_rate(
+    country: FlowFunction[str], tax_rates: FlowFunction[dict[str, float]]
+) -> float:
+    await lookups_mock.tax_rate(await country())
+    return (await tax_rates())[await country()]
+
+
+@flow_function()
+async def price_with_tax(
+    price: FlowFunction[float], tax_rate: FlowFunction[float]
+) -> float:
+    return await price() * (1 + await tax_rate())
+
+
+@flow_function(write_batched=True)
+async def audit_log(rows: list[str]) -> None:
+    await lookups_mock.audit_log(rows)
+
+
+@flow_function()
+async def failing_price_with_tax(price: FlowFunction[float]) -> float:
+    if await price() < 0:
+        raise ValueError(f"Price {await price()} is negative.")
+    return await price()
+
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "price": FlowArgument(float),
+    "country": FlowArgument(str, default="HR"),
+    "tax_rates": tax_rates,
+    "tax_rate": tax_rate,
+    "price_with_tax": price_with_tax,
+    "audit_log": audit_log,
+}
+
+
+@flow(**configuration)
+async def price_record(
+    currency: str,
+    price_with_tax: FlowFunction[float],
+    audit_log: FlowFunction[None],
+) -> str:
+    await audit_log(f"priced {await price_with_tax()}")
+    return f"{await price_with_tax()} {currency}"
+
+
+@flow(concurrent=True, **configuration)
+async def price_record_concurrently(
+    currency: str,
+    price_with_tax: FlowFunction[float],
+    audit_log: FlowFunction[None],
+) -> str:
+    await audit_log(f"priced {await price_with_tax()}")
+    return f"{await price_with_tax()} {currency}"
+
+
+@flow(price=FlowArgument(float), failing_price_with_tax=failing_price_with_tax)
+async def failing_price_record(failing_price_with_tax: FlowFunction[float]) -> float:
+    return await failing_price_with_tax()
+
+
+records = [
+    {"currency": "EUR", "price": 10.0, "country": "HR"},
+    {"currency": "EUR", "price": 20.0, "country": "DE"},
+    {"currency": "USD", "price": 30.0},
+]
+
+
+class TestFlowMap(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        lookups_mock.reset_mock()
+
+    async def test_amap_returns_the_results_of_the_invocations_in_order(
+        self,
+    ) -> None:
+        for mapped_flow in (price_record, price_record_concurrently):
+            with self.subTest(flow=mapped_flow.__name__):
+                self.assertEqual(
+                    [result async for result in mapped_flow.amap(records)],  # type: ignore[attr-defined]
+                    [await mapped_flow(**record) for record in records],
+                )
+
+    async def test_amap_caches_results_per_item(self) -> None:
+        [result async for result in price_record.amap(records)]  # type: ignore[attr-defined]
+
+        self.assertEqual(lookups_mock.tax_rates.await_count, 3)
+        self.assertEqual(
+            lookups_mock.tax_rate.await_args_list,
+            [call("HR"), call("DE"), call("HR")],
+        )
+
+    async def test_amap_shares_results_of_shared_flow_functions(self) -> None:
+        self.assertEqual(
+            [
+                result
+                async for result in price_record.amap(  # type: ignore[attr-defined]
+                    records, shared=["tax_rates"]
+                )
+            ],
+            ["12.5 EUR", "30.0 EUR", "37.5 USD"],
+        )
+
+        lookups_mock.tax_rates.assert_awaited_once()
+        self.assertEqual(lookups_mock.tax_rate.await_count, 3)
+
+    async def test_amap_writes_write_batches_per_item(self) -> None:
+        [result async for result in price_record.amap(records)]  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            lookups_mock.audit_log.await_args_list,
+            [call(["priced 12.5"]), call(["priced 30.0"]), call(["priced 37.5"])],
+        )
+
+    async def test_amap_raises_the_exception_of_an_item(self) -> None:
+        results = failing_price_record.amap(  # type: ignore[attr-defined]
+            [{"price": 1.0}, {"price": -1.0}, {"price": 2.0}]
+        )
+
+        self.assertEqual(await results.__anext__(), 1.0)
+        with self.assertRaises(ValueError) as error:
+            await results.__anext__()
+        self.assertEqual(str(error.exception), "Price -1.0 is negative.")
+        with self.assertRaises(StopAsyncIteration):
+            await results.__anext__()
+
+    def test_shared_flow_function_cannot_depend_on_flow_arguments(self) -> None:
+        # `tax_rate` depends on the `country` of each item
+        with self.assertRaises(AssertionError) as error:
+            price_record.amap(records, shared=["tax_rate"])  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            str(error.exception),
+            "`tax_rate` depends on flow arguments"
+            " and cannot be shared by the items of `map`.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from flow_compose.a import (
+    flow,
+    flow_function,
+    identity_key,
+    Flow,
+    FlowArgument,
+    FlowContext,
+    FlowFunction,
+    FlowProfile,
+)
+
+
+@flow_function()
+async def user() -> str:
+    return "Vinko"
+
+
+@flow_function(cached=True)
+async def cached_user() -> str:
+    return "Vinko"
+
+
+@flow_function(cached="process", coalesce=True)
+async def process_cached_user() -> str:
+    return "Vinko"
+
+
+@flow_function(cached=True, key=identity_key)
+async def user_by_id(user_id: int) -> str:
+    return f"user {user_id}"
+
+
+@flow_function(batched="process")
+async def users(user_ids: list[int]) -> list[str]:
+    return [f"user {user_id}" for user_id in user_ids]
+
+
+@flow_function(write_batched=True)
+async def audit_log(rows: list[str]) -> None:
+    pass
+
+
+@flow_function(executor="process")
+async def process_user() -> str:
+    return "Vinko"
+
+
+@flow_function()
+async def greeting(
+    greeting_format: FlowFunction[str],
+    user: FlowFunction[str] = cached_user,
+) -> str:
+    return (await greeting_format()).format(await user())
+
+
+@flow_function()
+async def greeting_with_flow_context(
+    flow_context: FlowContext, user: FlowFunction[str]
+) -> str:
+    return f"Hello, {await user()}!"
+
+
+greeting_format = FlowArgument(str, default="Hello, {}!")
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "greeting_format": greeting_format,
+    "user": user,
+    "greeting": greeting,
+}
+
+
+@flow(**configuration)
+async def greet(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+@flow(compile=True, **configuration)
+async def greet_compiled(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+@flow(concurrent=True, **configuration)
+async def greet_concurrently(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+@flow(speculate=FlowProfile(), **configuration)
+async def greet_speculatively(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+@flow(greet=Flow(greet, cached=True))
+async def greet_composed(greet: FlowFunction[str]) -> str:
+    return await greet()
+
+
+def invoke_greet(greeting_format: str) -> str:
+    return asyncio.run(
+        pickle.loads(pickle.dumps(greet))(greeting_format=greeting_format)
+    )
+
+
+class TestFlowPickling(unittest.TestCase):
+    def test_flow_functions_are_pickled_by_reference(self) -> None:
+        for pickled_flow_function in (
+            user,
+            cached_user,
+            process_cached_user,
+            user_by_id,
+            users,
+            audit_log,
+            process_user,
+            greeting,
+            greeting_with_flow_context,
+        ):
+            with self.subTest(flow_function=pickled_flow_function.name):
+                self.assertIs(
+                    pickle.loads(pickle.dumps(pickled_flow_function)),
+                    pickled_flow_function,
+                )
+
+    def test_flows_are_pickled_by_reference(self) -> None:
+        for pickled_flow in (
+            greet,
+            greet_compiled,
+            greet_concurrently,
+            greet_speculatively,
+            greet_composed,
+        ):
+            with self.subTest(flow=pickled_flow.__qualname__):
+                self.assertIs(pickle.loads(pickle.dumps(pickled_flow)), pickled_flow)
+
+    def test_composed_flow_is_pickled_by_reference_to_its_flow(self) -> None:
+        composed_flow = Flow(greet, cached=True)
+
+        unpickled_flow = pickle.loads(pickle.dumps(composed_flow))
+
+        self.assertIsInstance(unpickled_flow, Flow)
+        self.assertIs(unpickled_flow._flow_function, greet)
+        self.assertTrue(unpickled_flow.cached)
+
+    def test_flow_arguments_are_pickled_by_value(self) -> None:
+        flow_argument = greeting_format
+
+        unpickled_flow_argument = pickle.loads(pickle.dumps(flow_argument))
+
+        self.assertIsInstance(unpickled_flow_argument, FlowArgument)
+        self.assertEqual(unpickled_flow_argument.argument_type, str)
+        self.assertEqual(unpickled_flow_argument.value_or_empty, "Hello, {}!")
+        self.assertEqual(unpickled_flow_argument.name, "greeting_format")
+
+    def test_flow_is_invoked_in_a_worker_process(self) -> None:
+        with ProcessPoolExecutor(max_workers=1) as process_pool:
+            self.assertEqual(
+                process_pool.submit(invoke_greet, "Hi, {}!").result(), "Hi, Vinko!"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+users_by_id = {1: "Vinko", 2: "Ana", 3: "Ivan"}
+query_mock = AsyncMock()
+
+
+@flow_function(cached=True)
+async def database() -> dict[int, str]:
+    return users_by_id
+
+
+@flow_function(batched=True)
+async def user__using_user_id(
+    user_ids: list[int], database: FlowFunction[dict[int, str]]
+) -> list[str]:
+    await query_mock(user_ids)
+    users = await database()
+    return [users[user_id] for user_id in user_ids]
+
+
+@flow_function(batched=True, cached=True)
+async def cached_user__using_user_id(user_ids: list[int]) -> list[str]:
+    await query_mock(user_ids)
+    return [users_by_id[user_id] for user_id in user_ids]
+
+
+@flow_function(batched="process")
+async def shared_user__using_user_id(user_ids: list[int]) -> list[str]:
+    await query_mock(user_ids)
+    return [users_by_id[user_id] for user_id in user_ids]
+
+
+@flow_function(batched=True)
+async def failing_user__using_user_id(user_ids: list[int]) -> list[str]:
+    raise LookupError("Users not found.")
+
+
+@flow_function(batched=True)
+async def incomplete_user__using_user_id(user_ids: list[int]) -> list[str]:
+    return [users_by_id[user_id] for user_id in user_ids[1:]]
+
+
+@flow_function()
+async def greeting(user_id: int, user: FlowFunction[str]) -> str:
+    return f"Hello, {await user(user_id)}!"
+
+
+@flow(
+    database=database,
+    user=user__using_user_id,
+    greeting=greeting,
+)
+async def greet_users(user_ids: list[int], greeting: FlowFunction[str]) -> list[str]:
+    return list(await asyncio.gather(*(greeting(user_id) for user_id in user_ids)))
+
+
+@flow(
+    database=database,
+    user=user__using_user_id,
+    greeting=greeting,
+)
+async def greet_users_one_by_one(
+    user_ids: list[int], greeting: FlowFunction[str]
+) -> list[str]:
+    return [await greeting(user_id) for user_id in user_ids]
+
+
+@flow(
+    user=cached_user__using_user_id,
+    greeting=greeting,
+)
+async def greet_users_twice(
+    user_ids: list[int], greeting: FlowFunction[str]
+) -> list[str]:
+    first = await asyncio.gather(*(greeting(user_id) for user_id in user_ids))
+    second = await asyncio.gather(*(greeting(user_id) for user_id in user_ids))
+    return [*first, *second]
+
+
+@flow(
+    user=shared_user__using_user_id,
+    greeting=greeting,
+)
+async def greet_shared_user(user_id: int, greeting: FlowFunction[str]) -> str:
+    return await greeting(user_id)
+
+
+@flow(
+    user=failing_user__using_user_id,
+    greeting=greeting,
+)
+async def greet_missing_users(
+    user_ids: list[int], greeting: FlowFunction[str]
+) -> list[str]:
+    return list(await asyncio.gather(*(greeting(user_id) for user_id in user_ids)))
+
+
+@flow(
+    user=incomplete_user__using_user_id,
+    greeting=greeting,
+)
+async def greet_incomplete_users(
+    user_ids: list[int], greeting: FlowFunction[str]
+) -> list[str]:
+    return list(await asyncio.gather(*(greeting(user_id) for user_id in user_ids)))
+
+
+class TestFlowWithBatchedFlowFunction(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        query_mock.reset_mock()
+
+    async def test_calls_in_one_event_loop_iteration_are_batched(self) -> None:
+        self.assertEqual(
+            await greet_users(user_ids=[1, 2, 3]),
+            ["Hello, Vinko!", "Hello, Ana!", "Hello, Ivan!"],
+        )
+        query_mock.assert_awaited_once_with([1, 2, 3])
+
+    async def test_sequential_calls_are_not_batched(self) -> None:
+        self.assertEqual(
+            await greet_users_one_by_one(user_ids=[1, 2]),
+            ["Hello, Vinko!", "Hello, Ana!"],
+        )
+        self.assertEqual(query_mock.await_count, 2)
+
+    async def test_cached_keys_are_batched_once(self) -> None:
+        self.assertEqual(
+            await greet_users_twice(user_ids=[1, 2, 1]),
+            ["Hello, Vinko!", "Hello, Ana!", "Hello, Vinko!"] * 2,
+        )
+        query_mock.assert_awaited_once_with([1, 2])
+
+    async def test_process_batches_are_shared_by_flow_invocations(self) -> None:
+        batch_info = shared_user__using_user_id.batch_info()
+        self.assertEqual(
+            await asyncio.gather(
+                greet_shared_user(user_id=1), greet_shared_user(user_id=3)
+            ),
+            ["Hello, Vinko!", "Hello, Ivan!"],
+        )
+        query_mock.assert_awaited_once_with([1, 3])
+        self.assertEqual(
+            shared_user__using_user_id.batch_info(),
+            (batch_info.batches + 1, batch_info.keys + 2),
+        )
+
+    async def test_batch_exception_is_raised_by_all_calls(self) -> None:
+        with self.assertRaisesRegex(LookupError, "Users not found."):
+            await greet_missing_users(user_ids=[1, 2])
+
+    async def test_batch_has_to_return_result_for_every_key(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`incomplete_user__using_user_id` batched FlowFunction"
+            " returned 1 results for 2 keys.",
+        ):
+            await greet_incomplete_users(user_ids=[1, 2])
+
+    async def test_batched_flow_function_outside_flow(self) -> None:
+        self.assertEqual(await cached_user__using_user_id(2), "Ana")
+        query_mock.assert_awaited_once_with([2])
+
+    def test_batched_flow_function_has_one_argument_for_keys(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`users` batched FlowFunction has to have one argument"
+            " that is not FlowFunction, the list of keys.",
+        ):
+
+            @flow_function(batched=True)
+            async def users(user_ids: list[int], active: bool) -> list[str]:
+                return []
+
+    def test_process_batch_info_requires_process_scope(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`user__using_user_id` FlowFunction is not batched"
+            " with the 'process' scope.",
+        ):
+            user__using_user_id.batch_info()
@@ -0,0 +1,72 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import sys
+import unittest
+from unittest import mock
+from unittest.mock import AsyncMock
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+price_mock = AsyncMock()
+payload_mock = AsyncMock()
+
+
+@flow_function(cached=True, maxsize=2)
+async def price(index: int) -> int:
+    await price_mock(index)
+    return index * 100
+
+
+@flow_function(cached=True, maxbytes=2 * sys.getsizeof(b"x" * 100))
+async def payload(index: int) -> bytes:
+    await payload_mock(index)
+    return bytes([index]) * 100
+
+
+@flow(
+    price=price,
+)
+async def basket_total(indexes: list[int], price: FlowFunction[int]) -> int:
+    return sum([await price(index) for index in indexes])
+
+
+@flow(
+    payload=payload,
+)
+async def payloads_length(indexes: list[int], payload: FlowFunction[bytes]) -> int:
+    return sum([len(await payload(index)) for index in indexes])
+
+
+class TestFlowWithBoundedCachedFlowFunction(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        price_mock.reset_mock()
+        payload_mock.reset_mock()
+
+    async def test_least_recently_used_result_is_evicted_beyond_maxsize(self) -> None:
+        self.assertEqual(await basket_total(indexes=[1, 2, 1, 3, 1, 2]), 1000)
+        price_mock.assert_has_awaits(
+            [mock.call(1), mock.call(2), mock.call(3), mock.call(2)]
+        )
+        self.assertEqual(price_mock.await_count, 4)
+
+    async def test_least_recently_used_result_is_evicted_beyond_maxbytes(self) -> None:
+        self.assertEqual(await payloads_length(indexes=[1, 2, 1, 3, 1, 2]), 600)
+        payload_mock.assert_has_awaits(
+            [mock.call(1), mock.call(2), mock.call(3), mock.call(2)]
+        )
+        self.assertEqual(payload_mock.await_count, 4)
+
+    async def test_cache_is_not_shared_by_flow_invocations(self) -> None:
+        await basket_total(indexes=[1])
+        await basket_total(indexes=[1])
+        price_mock.assert_has_awaits([mock.call(1), mock.call(1)])
+
+    def test_cache_limits_require_cached(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError, "`maxsize` and `maxbytes` require `cached`."
+        ):
+
+            @flow_function(maxsize=2)
+            async def greeting_hello_world() -> str:
+                return "Hello World!"
@@ -0,0 +1,83 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+from unittest import mock
+from unittest.mock import AsyncMock
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+greeting_mock = AsyncMock()
+greet_using_greeting_mock = AsyncMock()
+
+
+@flow_function(cached=True)
+async def greeting_with_punctuation(index: int, punctuation: str = "!") -> str:
+    await greeting_mock(index, punctuation)
+    return f"Hello World{punctuation} - {index}"
+
+
+@flow_function()
+async def greet_using_greeting_1(greeting: FlowFunction[str]) -> None:
+    await greet_using_greeting_mock(await greeting(11))
+    await greet_using_greeting_mock(await greeting(11, "!"))
+    await greet_using_greeting_mock(await greeting(index=11))
+    await greet_using_greeting_mock(await greeting(punctuation="!", index=11))
+    await greet_using_greeting_mock(await greeting(11, punctuation="!"))
+
+
+@flow(
+    greeting=greeting_with_punctuation,
+)
+async def hello_world_1(greet: FlowFunction[None] = greet_using_greeting_1) -> None:
+    await greet()
+
+
+@flow_function()
+async def greet_using_greeting_2(greeting: FlowFunction[str]) -> None:
+    # hash(-1) == hash(-2)
+    await greet_using_greeting_mock(await greeting(-1))
+    await greet_using_greeting_mock(await greeting(-2))
+    await greet_using_greeting_mock(await greeting(index=1, punctuation="?"))
+    await greet_using_greeting_mock(await greeting(punctuation=1, index="?"))
+
+
+@flow(
+    greeting=greeting_with_punctuation,
+)
+async def hello_world_2(greet: FlowFunction[None] = greet_using_greeting_2) -> None:
+    await greet()
+
+
+class TestFlowWithCachedFlowFunctionWithCanonicalArguments(
+    unittest.IsolatedAsyncioTestCase
+):
+    def setUp(self):
+        greeting_mock.reset_mock()
+        greet_using_greeting_mock.reset_mock()
+
+    async def test_equivalent_calls_are_executed_once(self):
+        await hello_world_1()
+        greeting_mock.assert_awaited_once_with(11, "!")
+        greet_using_greeting_mock.assert_has_awaits(
+            [mock.call("Hello World! - 11")] * 5
+        )
+
+    async def test_different_calls_with_equal_hashes_are_not_conflated(self):
+        await hello_world_2()
+        greeting_mock.assert_has_awaits(
+            [
+                mock.call(-1, "!"),
+                mock.call(-2, "!"),
+                mock.call(1, "?"),
+                mock.call("?", 1),
+            ]
+        )
+        greet_using_greeting_mock.assert_has_awaits(
+            [
+                mock.call("Hello World! - -1"),
+                mock.call("Hello World! - -2"),
+                mock.call("Hello World? - 1"),
+                mock.call("Hello World1 - ?"),
+            ]
+        )
@@ -0,0 +1,135 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from flow_compose.a import flow, flow_function, FlowArgument, FlowContext, FlowFunction
+
+tenant_settings_mock = AsyncMock()
+
+
+@flow_function(cached="process", coalesce=True)
+async def tenant_settings(tenant_id: int) -> dict[str, str]:
+    await tenant_settings_mock(tenant_id)
+    await asyncio.sleep(0.01)
+    return {"language": "en"}
+
+
+@flow_function(cached=True, coalesce=True)
+async def tenant_name(tenant_id: int) -> str:
+    await tenant_settings_mock(tenant_id)
+    await asyncio.sleep(0.01)
+    return f"Tenant {tenant_id}"
+
+
+@flow(
+    settings=tenant_settings,
+)
+async def tenant_language(
+    tenant_id: int, settings: FlowFunction[dict[str, str]]
+) -> str:
+    return (await settings(tenant_id))["language"]
+
+
+@flow(
+    name=tenant_name,
+)
+async def tenant_greeting(tenant_id: int, name: FlowFunction[str]) -> str:
+    return f"Hello, {await name(tenant_id)} - {await name(tenant_id)}!"
+
+
+@flow_function(cached="process")
+async def tenant_names() -> dict[int, str]:
+    await asyncio.sleep(0.01)
+    return {1: "Tenant 1", 2: "Tenant 2"}
+
+
+@flow_function(cached=True, coalesce=True)
+async def tenant_name_in_catalog(
+    tenant_id: int, tenant_names: FlowFunction[dict[int, str]]
+) -> str:
+    await tenant_settings_mock(tenant_id)
+    return (await tenant_names())[tenant_id]
+
+
+@flow(
+    tenant_names=tenant_names,
+    name=tenant_name_in_catalog,
+    tenant_id=FlowArgument(int),
+)
+async def tenant_name_from_catalog(
+    tenant_id: FlowFunction[int], name: FlowFunction[str]
+) -> str:
+    return await name(await tenant_id())
+
+
+class TestFlowWithCoalescedCachedFlowFunction(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        tenant_settings.cache_clear()
+        tenant_settings_mock.reset_mock()
+
+    async def test_concurrent_flow_invocations_share_one_call(self) -> None:
+        languages = await asyncio.gather(
+            *(tenant_language(tenant_id=1) for _ in range(100)),
+            tenant_language(tenant_id=2),
+        )
+        self.assertEqual(languages, ["en"] * 101)
+        self.assertEqual(tenant_settings_mock.await_count, 2)
+        coalesce_info = tenant_settings.coalesce_info()
+        self.assertEqual(coalesce_info.executed, 2)
+        self.assertEqual(coalesce_info.coalesced, 99)
+
+    async def test_coalesced_result_is_cached_in_each_flow_invocation(self) -> None:
+        greetings = await asyncio.gather(
+            *(tenant_greeting(tenant_id=1) for _ in range(10))
+        )
+        self.assertEqual(greetings, ["Hello, Tenant 1 - Tenant 1!"] * 10)
+        tenant_settings_mock.assert_awaited_once_with(1)
+
+    def test_coalesce_requires_cached(self) -> None:
+        with self.assertRaisesRegex(AssertionError, "`coalesce` requires `cached`."):
+
+            @flow_function(coalesce=True)
+            async def greeting_hello_world() -> str:
+                return "Hello World!"
+
+    async def test_concurrent_flow_invocations_with_different_flow_arguments(
+        self,
+    ) -> None:
+        tenant_names.cache_clear()
+        names = await asyncio.gather(
+            tenant_name_from_catalog(tenant_id=1),
+            tenant_name_from_catalog(tenant_id=2),
+        )
+        self.assertEqual(names, ["Tenant 1", "Tenant 2"])
+
+    def test_coalesce_with_dependency_on_flow_argument(self) -> None:
+        # the call in progress of the first flow invocation would be shared
+        #  with the invocations of other flow arguments
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`user` FlowFunction coalesced"
+            " can depend only on flow functions cached with the 'process' scope,"
+            " but `user_id` is not.",
+        ):
+
+            @flow_function(cached=True, coalesce=True)
+            async def user(user_id: FlowFunction[int]) -> str:
+                return f"user-{await user_id()}"
+
+            @flow(user_id=FlowArgument(int), user=user)
+            async def user_flow(user: FlowFunction[str]) -> str:
+                return await user()
+
+    def test_coalesce_with_flow_context(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`user_settings` FlowFunction coalesced"
+            " cannot have a FlowContext argument.",
+        ):
+
+            @flow_function(cached=True, coalesce=True)
+            async def user_settings(flow_context: FlowContext) -> dict[str, str]:
+                return {}
@@ -0,0 +1,184 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import unittest
+
+from flow_compose.a import flow, flow_function, Flow, FlowFunction
+
+
+class Lookups:
+    running = 0
+    max_running = 0
+    cancelled = 0
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.running = cls.max_running = cls.cancelled = 0
+
+
+async def lookup(value: str, delay: float = 0.01) -> str:
+    Lookups.running += 1
+    Lookups.max_running = max(Lookups.max_running, Lookups.running)
+    try:
+        await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+        Lookups.cancelled += 1
+        raise
+    finally:
+        Lookups.running -= 1
+    return value
+
+
+@flow_function(cached=True)
+async def user() -> str:
+    return await lookup("Vinko")
+
+
+@flow_function(cached=True)
+async def user_language() -> str:
+    return await lookup("en")
+
+
+@flow_function(cached=True)
+async def user_timezone() -> str:
+    return await lookup("Europe/Zagreb")
+
+
+@flow_function(cached=True)
+async def slow_user() -> str:
+    return await lookup("Vinko", delay=10)
+
+
+@flow_function(cached=True)
+async def slow_user_language() -> str:
+    return await lookup("en", delay=10)
+
+
+@flow_function(cached=True)
+async def failing_user_timezone() -> str:
+    raise ValueError("Timezone not found.")
+
+
+@flow_function()
+async def greeting(
+    user: FlowFunction[str],
+    user_language: FlowFunction[str],
+    user_timezone: FlowFunction[str],
+) -> str:
+    return f"{await user()} {await user_language()} {await user_timezone()}"
+
+
+configuration = {
+    "user": user,
+    "user_language": user_language,
+    "user_timezone": user_timezone,
+}
+
+
+@flow(**configuration, concurrent=True)
+async def greet_in_body(
+    user: FlowFunction[str],
+    user_language: FlowFunction[str],
+    user_timezone: FlowFunction[str],
+) -> str:
+    return f"{await user()} {await user_language()} {await user_timezone()}"
+
+
+@flow(**configuration, concurrent=True, compile=True)
+async def greet_in_compiled_body_positionally(
+    user: FlowFunction[str],
+    user_language: FlowFunction[str],
+    user_timezone: FlowFunction[str],
+    /,
+) -> str:
+    return f"{await user()} {await user_language()} {await user_timezone()}"
+
+
+@flow(**configuration)
+async def greet_in_body_sequentially(
+    user: FlowFunction[str],
+    user_language: FlowFunction[str],
+    user_timezone: FlowFunction[str],
+) -> str:
+    return f"{await user()} {await user_language()} {await user_timezone()}"
+
+
+@flow(**configuration, greeting=greeting, concurrent=True)
+async def greet_in_flow_function(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+@flow(**configuration, greeting=greeting, concurrent=True, compile=True)
+async def greet_in_compiled_flow(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+@flow(
+    user=slow_user,
+    user_language=slow_user_language,
+    user_timezone=failing_user_timezone,
+    greeting=greeting,
+    concurrent=True,
+)
+async def greet_with_failing_dependency(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+@flow()
+async def composed_greeting(user: str, user_language: str, user_timezone: str) -> str:
+    return f"{user} {user_language} {user_timezone}"
+
+
+@flow(**configuration, greeting=Flow(composed_greeting), concurrent=True)
+async def greet_in_composed_flow(greeting: FlowFunction[str]) -> str:
+    return await greeting()
+
+
+class TestFlowWithConcurrentDependencies(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        Lookups.reset()
+
+    async def test_flow_body_dependencies_are_resolved_concurrently(self) -> None:
+        self.assertEqual(await greet_in_body(), "Vinko en Europe/Zagreb")
+        self.assertEqual(Lookups.max_running, 3)
+
+    async def test_positional_flow_body_dependencies_are_resolved_concurrently(
+        self,
+    ) -> None:
+        self.assertEqual(
+            await greet_in_compiled_body_positionally(), "Vinko en Europe/Zagreb"
+        )
+        self.assertEqual(Lookups.max_running, 3)
+
+    async def test_dependencies_are_resolved_sequentially_by_default(self) -> None:
+        self.assertEqual(await greet_in_body_sequentially(), "Vinko en Europe/Zagreb")
+        self.assertEqual(Lookups.max_running, 1)
+
+    async def test_flow_function_dependencies_are_resolved_concurrently(self) -> None:
+        self.assertEqual(await greet_in_flow_function(), "Vinko en Europe/Zagreb")
+        self.assertEqual(Lookups.max_running, 3)
+
+    async def test_compiled_flow_dependencies_are_resolved_concurrently(self) -> None:
+        self.assertEqual(await greet_in_compiled_flow(), "Vinko en Europe/Zagreb")
+        self.assertEqual(Lookups.max_running, 3)
+
+    async def test_failing_dependency_cancels_its_siblings(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Timezone not found."):
+            await greet_with_failing_dependency()
+        self.assertEqual(Lookups.cancelled, 2)
+        self.assertEqual(Lookups.running, 0)
+
+    async def test_composed_flow_arguments_are_resolved_concurrently(self) -> None:
+        self.assertEqual(await greet_in_composed_flow(), "Vinko en Europe/Zagreb")
+        self.assertEqual(Lookups.max_running, 3)
+
+    def test_concurrent_flow_option_cannot_be_flow_function_alias(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`concurrent` is a flow option and cannot be used as a flow function alias.",
+        ):
+
+            @flow(concurrent=user)
+            async def hello_world() -> None:
+                pass
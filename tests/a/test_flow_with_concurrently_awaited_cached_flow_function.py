@@ -0,0 +1,124 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from flow_compose.a import flow, flow_function, FlowFunction
+
+user_mock = AsyncMock()
+
+
+@flow_function(cached=True)
+async def user() -> str:
+    await user_mock()
+    await asyncio.sleep(0.01)
+    return "Vinko"
+
+
+@flow_function(cached=True)
+async def failing_user() -> str:
+    await user_mock()
+    await asyncio.sleep(0.01)
+    raise ValueError("User not found.")
+
+
+@flow_function()
+async def greeting(user: FlowFunction[str]) -> str:
+    return f"Hello, {await user()}!"
+
+
+@flow_function()
+async def farewell(user: FlowFunction[str]) -> str:
+    return f"Goodbye, {await user()}!"
+
+
+@flow(
+    user=user,
+    greeting=greeting,
+    farewell=farewell,
+)
+async def greet_and_say_farewell(
+    greeting: FlowFunction[str], farewell: FlowFunction[str]
+) -> list[str]:
+    return list(await asyncio.gather(greeting(), farewell()))
+
+
+@flow(
+    user=failing_user,
+    greeting=greeting,
+    farewell=farewell,
+)
+async def greet_and_say_farewell_to_missing_user(
+    user: FlowFunction[str], greeting: FlowFunction[str], farewell: FlowFunction[str]
+) -> list[BaseException | str]:
+    results = list(await asyncio.gather(greeting(), farewell(), return_exceptions=True))
+    try:
+        await user()
+    except ValueError as exception:
+        results.append(exception)
+    return results
+
+
+@flow(
+    user=user,
+    greeting=greeting,
+    farewell=farewell,
+)
+async def greet_with_cancelled_farewell(
+    greeting: FlowFunction[str], farewell: FlowFunction[str]
+) -> str:
+    farewell_task = asyncio.create_task(farewell())
+    greeting_task = asyncio.create_task(greeting())
+    await asyncio.sleep(0)
+    farewell_task.cancel()
+    return await greeting_task
+
+
+@flow(
+    user=user,
+    greeting=greeting,
+    farewell=farewell,
+)
+async def say_farewell_with_cancelled_greeting(
+    greeting: FlowFunction[str], farewell: FlowFunction[str]
+) -> str:
+    farewell_task = asyncio.create_task(farewell())
+    greeting_task = asyncio.create_task(greeting())
+    await asyncio.sleep(0)
+    greeting_task.cancel()
+    return await farewell_task
+
+
+class TestFlowWithConcurrentlyAwaitedCachedFlowFunction(
+    unittest.IsolatedAsyncioTestCase
+):
+    def setUp(self) -> None:
+        user_mock.reset_mock()
+
+    async def test_concurrent_calls_are_executed_once(self) -> None:
+        self.assertEqual(
+            await greet_and_say_farewell(), ["Hello, Vinko!", "Goodbye, Vinko!"]
+        )
+        user_mock.assert_awaited_once_with()
+
+    async def test_exception_is_propagated_to_concurrent_callers(self) -> None:
+        results = await greet_and_say_farewell_to_missing_user()
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+        self.assertIs(results[0], results[1])
+        # failed calls are not cached
+        self.assertIsNot(results[0], results[2])
+        self.assertEqual(user_mock.await_count, 2)
+
+    async def test_cancelled_leading_caller_is_taken_over(self) -> None:
+        self.assertEqual(await greet_with_cancelled_farewell(), "Hello, Vinko!")
+        self.assertEqual(user_mock.await_count, 2)
+
+    async def test_cancelled_waiting_caller_does_not_cancel_the_call(self) -> None:
+        self.assertEqual(
+            await say_farewell_with_cancelled_greeting(), "Goodbye, Vinko!"
+        )
+        user_mock.assert_awaited_once_with()
@@ -0,0 +1,162 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock
+
+from flow_compose.a import flow, flow_function, FlowContext, FlowFunction
+
+user_mock = AsyncMock()
+permissions_mock = AsyncMock()
+catalog_cancelled = asyncio.Event()
+
+
+class Started:
+    permissions = asyncio.Event()
+
+
+@flow_function(cached=True)
+async def user() -> str:
+    await user_mock()
+    # waits for permissions, so both are executed concurrently
+    await asyncio.wait_for(Started.permissions.wait(), timeout=5)
+    return "Vinko"
+
+
+@flow_function(cached=True)
+async def permissions() -> list[str]:
+    await permissions_mock()
+    Started.permissions.set()
+    return ["greet"]
+
+
+@flow_function(cached=True)
+async def failing_permissions() -> list[str]:
+    await permissions_mock()
+    Started.permissions.set()
+    raise PermissionError("Permissions not found.")
+
+
+@flow_function(cached=True)
+async def catalog() -> list[str]:
+    try:
+        await asyncio.sleep(10)
+    except asyncio.CancelledError:
+        catalog_cancelled.set()
+        raise
+    return []
+
+
+@flow_function()
+async def greeting(
+    user: FlowFunction[str], permissions: FlowFunction[list[str]]
+) -> str:
+    return f"Hello, {await user()}!" if "greet" in await permissions() else ""
+
+
+@flow_function()
+async def greeting_with_prefetch(
+    flow_context: FlowContext,
+    greeting: FlowFunction[str],
+) -> str:
+    flow_context.prefetch("user", "permissions")
+    return await greeting()
+
+
+@flow(
+    user=user,
+    permissions=permissions,
+    greeting=greeting,
+)
+async def greet(flow_context: FlowContext, greeting: FlowFunction[str]) -> str:
+    flow_context.prefetch("user", "permissions")
+    return await greeting()
+
+
+@flow(
+    user=user,
+    permissions=permissions,
+    greeting=greeting,
+    compile=True,
+)
+async def greet_compiled(flow_context: FlowContext, greeting: FlowFunction[str]) -> str:
+    flow_context.prefetch("user", "permissions")
+    return await greeting()
+
+
+@flow(
+    user=user,
+    permissions=permissions,
+    greeting=greeting,
+)
+async def greet_in_flow_function(
+    greet: FlowFunction[str] = greeting_with_prefetch,
+) -> str:
+    return await greet()
+
+
+@flow(
+    user=user,
+    permissions=failing_permissions,
+    greeting=greeting,
+)
+async def greet_without_permissions(
+    flow_context: FlowContext, greeting: FlowFunction[str]
+) -> str:
+    flow_context.prefetch("user", "permissions")
+    return await greeting()
+
+
+@flow(
+    catalog=catalog,
+)
+async def greet_without_catalog(flow_context: FlowContext) -> str:
+    flow_context.prefetch("catalog")
+    await asyncio.sleep(0)
+    return "Hello!"
+
+
+@flow(
+    user=user,
+)
+async def greet_with_executor(flow_context: FlowContext) -> None:
+    with ThreadPoolExecutor() as executor:
+        flow_context.prefetch("user", executor=executor)
+
+
+class TestFlowWithPrefetchedFlowFunctions(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        user_mock.reset_mock()
+        permissions_mock.reset_mock()
+        catalog_cancelled.clear()
+        # events are bound to the event loop of the test that waits for them
+        Started.permissions = asyncio.Event()
+
+    async def test_prefetched_flow_functions_are_executed_once_concurrently(
+        self,
+    ) -> None:
+        for greet_flow in (greet, greet_compiled, greet_in_flow_function):
+            with self.subTest(greet_flow=greet_flow.__name__):
+                self.setUp()
+                self.assertEqual(await greet_flow(), "Hello, Vinko!")
+                user_mock.assert_awaited_once_with()
+                permissions_mock.assert_awaited_once_with()
+
+    async def test_prefetched_exception_is_raised_by_later_call(self) -> None:
+        with self.assertRaisesRegex(PermissionError, "Permissions not found."):
+            await greet_without_permissions()
+
+    async def test_unused_prefetched_call_is_cancelled_when_flow_returns(
+        self,
+    ) -> None:
+        self.assertEqual(await greet_without_catalog(), "Hello!")
+        await asyncio.wait_for(catalog_cancelled.wait(), timeout=1)
+
+    async def test_async_prefetch_does_not_use_executor(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "Async flow functions are prefetched as tasks and do not use an executor.",
+        ):
+            await greet_with_executor()
@@ -0,0 +1,157 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import os
+import time
+import unittest
+from unittest.mock import AsyncMock
+
+from flow_compose.a import flow, flow_function, FlowArgument, FlowFunction
+
+price_mock = AsyncMock()
+discount_mock = AsyncMock()
+
+
+@flow_function(cached=True)
+async def price() -> int:
+    await price_mock()
+    return 100
+
+
+@flow_function(cached=True, executor="process")
+async def score(
+    multiplier: int, price: FlowFunction[int], currency: FlowFunction[str]
+) -> tuple[int, str, int, int]:
+    return (
+        await price() * multiplier,
+        await currency(),
+        os.getpid(),
+        time.perf_counter_ns(),
+    )
+
+
+@flow_function(executor="process")
+async def failing_score(price: FlowFunction[int]) -> int:
+    raise ValueError(f"Price {await price()} cannot be scored.")
+
+
+@flow_function(executor="process")
+async def process_id() -> int:
+    return os.getpid()
+
+
+@flow_function(cached=True)
+async def discount() -> int:
+    await discount_mock()
+    return 10
+
+
+@flow_function(executor="process")
+async def undiscounted_price(
+    price: FlowFunction[int], discount: FlowFunction[int]
+) -> int:
+    return await price()
+
+
+@flow_function()
+async def tax(rate: float) -> float:
+    return rate
+
+
+@flow_function(executor="process")
+async def taxed_price(price: FlowFunction[int], tax: FlowFunction[float]) -> float:
+    return await price() * (1 + await tax(0.25))
+
+
+@flow(
+    price=price,
+    discount=discount,
+    undiscounted_price=undiscounted_price,
+)
+async def undiscounted_prices(undiscounted_price: FlowFunction[int]) -> int:
+    return await undiscounted_price()
+
+
+@flow(
+    currency=FlowArgument(str),
+    price=price,
+    score=score,
+)
+async def scores(
+    multiplier: int, score: FlowFunction[tuple[int, str, int, int]]
+) -> list[tuple[int, str, int, int]]:
+    return [await score(multiplier), await score(multiplier=multiplier)]
+
+
+@flow(
+    price=price,
+    failing_score=failing_score,
+)
+async def failing_scores(failing_score: FlowFunction[int]) -> int:
+    return await failing_score()
+
+
+class TestFlowWithProcessExecutedFlowFunction(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        price_mock.reset_mock()
+        discount_mock.reset_mock()
+
+    async def test_flow_function_is_executed_in_a_process_with_dependency_values(
+        self,
+    ) -> None:
+        first_score, second_score = await scores(multiplier=3, currency="EUR")
+
+        self.assertEqual(first_score[:2], (300, "EUR"))
+        self.assertNotEqual(first_score[2], os.getpid())
+        self.assertEqual(first_score, second_score)
+        price_mock.assert_awaited_once()
+
+    async def test_exception_is_raised_in_the_flow(self) -> None:
+        with self.assertRaises(ValueError) as error:
+            await failing_scores()
+
+        self.assertEqual(str(error.exception), "Price 100 cannot be scored.")
+
+    async def test_dependencies_are_called_before_the_process_is_submitted(
+        self,
+    ) -> None:
+        self.assertEqual(await undiscounted_prices(), 100)
+
+        # the flow function does not call `discount`, but it is resolved eagerly
+        discount_mock.assert_called_once_with()
+
+    def test_dependencies_have_to_be_callable_without_arguments(self) -> None:
+        with self.assertRaises(AssertionError) as error:
+
+            @flow(price=price, tax=tax, taxed_price=taxed_price)
+            async def taxed_prices(taxed_price: FlowFunction[float]) -> float:
+                return await taxed_price()
+
+        self.assertEqual(
+            str(error.exception),
+            "`taxed_price` FlowFunction executed in a process"
+            " can depend only on flow functions callable without arguments,"
+            " but `tax` is not.",
+        )
+
+    async def test_flow_function_executed_in_a_process_outside_flow(self) -> None:
+        self.assertNotEqual(await process_id(), os.getpid())
+
+    def test_flow_function_executed_in_a_process_has_to_be_module_level(
+        self,
+    ) -> None:
+        with self.assertRaises(AssertionError) as error:
+
+            @flow_function(executor="process")
+            async def local_score() -> int:
+                return 1
+
+        self.assertEqual(
+            str(error.exception),
+            "`local_score` FlowFunction executed in a process"
+            " has to be defined at the module level.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
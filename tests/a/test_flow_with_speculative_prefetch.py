@@ -0,0 +1,147 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import unittest
+from typing import Any
+
+from flow_compose.a import flow, flow_function, FlowFunction, FlowProfile
+
+
+class Lookups:
+    running = 0
+    max_running = 0
+    cancelled = 0
+    audit_log_delay = 0.0
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.running = cls.max_running = cls.cancelled = 0
+        cls.audit_log_delay = 0.0
+
+
+async def lookup(value: str, delay: float = 0.01) -> str:
+    Lookups.running += 1
+    Lookups.max_running = max(Lookups.max_running, Lookups.running)
+    try:
+        await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+        Lookups.cancelled += 1
+        raise
+    finally:
+        Lookups.running -= 1
+    return value
+
+
+@flow_function(cached=True)
+async def user() -> str:
+    return await lookup("Vinko")
+
+
+@flow_function(cached=True)
+async def user_language() -> str:
+    return await lookup("en")
+
+
+@flow_function(cached=True)
+async def audit_log() -> str:
+    return await lookup("audited", delay=Lookups.audit_log_delay)
+
+
+async def greeting(
+    audited: bool,
+    user: FlowFunction[str],
+    user_language: FlowFunction[str],
+    audit_log: FlowFunction[str],
+) -> str:
+    if audited:
+        await audit_log()
+    # the speculative calls run while the flow is busy
+    await asyncio.sleep(0.01)
+    return f"Hello, {await user()} ({await user_language()})!"
+
+
+def greet_flow(**flow_options: Any) -> Any:
+    return flow(
+        user=user,
+        user_language=user_language,
+        audit_log=audit_log,
+        speculate=FlowProfile(min_invocations=3, **flow_options.pop("profile", {})),
+        **flow_options,
+    )(greeting)
+
+
+class TestFlowWithSpeculativePrefetch(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        Lookups.reset()
+
+    async def test_frequently_called_flow_functions_are_speculated(self) -> None:
+        for flow_options in ({}, {"compile": True}):
+            with self.subTest(**flow_options):
+                Lookups.reset()
+                greet = greet_flow(**flow_options)
+                for _ in range(3):
+                    self.assertEqual(await greet(audited=False), "Hello, Vinko (en)!")
+                self.assertEqual(Lookups.max_running, 1)
+                self.assertEqual(greet.speculation_info().speculated, 0)
+                self.assertEqual(
+                    set(greet.speculation_info().speculated_aliases),
+                    {"user", "user_language"},
+                )
+
+                Lookups.reset()
+                self.assertEqual(await greet(audited=False), "Hello, Vinko (en)!")
+                self.assertEqual(Lookups.max_running, 2)
+                speculation_info = greet.speculation_info()
+                self.assertEqual(speculation_info.invocations, 4)
+                self.assertEqual(speculation_info.speculated, 2)
+                self.assertEqual(speculation_info.hits, 2)
+                self.assertEqual(speculation_info.hit_rate, 1.0)
+
+    async def test_unused_speculative_call_is_cancelled_when_flow_returns(
+        self,
+    ) -> None:
+        greet = greet_flow()
+        for _ in range(3):
+            await greet(audited=True)
+        self.assertIn("audit_log", greet.speculation_info().speculated_aliases)
+
+        Lookups.audit_log_delay = 10
+        self.assertEqual(await greet(audited=False), "Hello, Vinko (en)!")
+        await asyncio.sleep(0)
+        self.assertEqual(Lookups.cancelled, 1)
+        speculation_info = greet.speculation_info()
+        self.assertEqual(speculation_info.speculated, 3)
+        self.assertEqual(speculation_info.hits, 2)
+        self.assertAlmostEqual(speculation_info.hit_rate, 2 / 3)
+
+    async def test_occasionally_called_flow_function_is_not_speculated(
+        self,
+    ) -> None:
+        greet = greet_flow()
+        for audited in (True, False, False, False):
+            await greet(audited=audited)
+        self.assertNotIn("audit_log", greet.speculation_info().speculated_aliases)
+
+    async def test_speculative_calls_are_bounded(self) -> None:
+        greet = greet_flow(profile={"max_speculative_calls": 1})
+        for _ in range(4):
+            await greet(audited=True)
+        speculation_info = greet.speculation_info()
+        self.assertEqual(len(speculation_info.speculated_aliases), 1)
+        self.assertEqual(speculation_info.speculated, 1)
+
+    async def test_speculate_has_to_be_bool_or_flow_profile(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "Flow option `speculate` has to be `bool` or `FlowProfile`.",
+        ):
+            flow(user=user, speculate="always")  # type: ignore[arg-type]
+
+    async def test_flow_profile_profiles_only_one_flow(self) -> None:
+        flow_profile = FlowProfile()
+        flow(user=user, speculate=flow_profile)(greeting)
+        with self.assertRaisesRegex(
+            AssertionError, "FlowProfile can profile only one flow."
+        ):
+            flow(user=user, speculate=flow_profile)(greeting)
@@ -0,0 +1,170 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+from unittest.mock import AsyncMock, call
+
+from flow_compose.a import flow, flow_function, FlowContext, FlowFunction
+
+writes_mock = AsyncMock()
+
+
+@flow_function(write_batched=True)
+async def audit_log(rows: list[str]) -> None:
+    await writes_mock.audit_log(rows)
+
+
+@flow_function(write_batched=True)
+async def counter(names: list[str]) -> None:
+    await writes_mock.counter(names)
+
+
+@flow_function(write_batched=True)
+async def failing_audit_log(rows: list[str]) -> None:
+    raise ConnectionError("Audit log is not available.")
+
+
+@flow_function()
+async def greeting(
+    name: str, audit_log: FlowFunction[None], counter: FlowFunction[None]
+) -> str:
+    await counter("greetings")
+    await audit_log(f"greeted {name}")
+    await writes_mock.greeting(name)
+    return f"Hello, {name}!"
+
+
+@flow(
+    audit_log=audit_log,
+    counter=counter,
+    greeting=greeting,
+)
+async def greet(names: list[str], greeting: FlowFunction[str]) -> list[str]:
+    return [await greeting(name) for name in names]
+
+
+@flow(
+    audit_log=audit_log,
+    counter=counter,
+    greeting=greeting,
+    compile=True,
+)
+async def greet_compiled(names: list[str], greeting: FlowFunction[str]) -> list[str]:
+    return [await greeting(name) for name in names]
+
+
+@flow(
+    audit_log=audit_log,
+    counter=counter,
+    greeting=greeting,
+)
+async def greet_and_fail(names: list[str], greeting: FlowFunction[str]) -> list[str]:
+    for name in names:
+        await greeting(name)
+    raise ValueError("Greeting failed.")
+
+
+@flow(
+    audit_log=audit_log,
+    counter=counter,
+    greeting=greeting,
+)
+async def greet_with_flush(
+    names: list[str], flow_context: FlowContext, greeting: FlowFunction[str]
+) -> list[str]:
+    greetings = []
+    for name in names:
+        greetings.append(await greeting(name))
+        await flow_context.flush()
+    return greetings
+
+
+@flow(
+    audit_log=failing_audit_log,
+    counter=counter,
+    greeting=greeting,
+)
+async def greet_without_audit_log(
+    names: list[str], greeting: FlowFunction[str]
+) -> list[str]:
+    return [await greeting(name) for name in names]
+
+
+class TestFlowWithWriteBatchedFlowFunction(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        writes_mock.reset_mock()
+
+    async def test_writes_are_flushed_in_one_call_when_flow_returns(self) -> None:
+        for greet_flow in (greet, greet_compiled):
+            with self.subTest(greet_flow=greet_flow.__name__):
+                self.setUp()
+                self.assertEqual(
+                    await greet_flow(names=["Vinko", "Ana"]),
+                    ["Hello, Vinko!", "Hello, Ana!"],
+                )
+                self.assertEqual(
+                    writes_mock.mock_calls,
+                    [
+                        call.greeting("Vinko"),
+                        call.greeting("Ana"),
+                        call.counter(["greetings", "greetings"]),
+                        call.audit_log(["greeted Vinko", "greeted Ana"]),
+                    ],
+                )
+
+    async def test_writes_are_discarded_when_flow_raises(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Greeting failed."):
+            await greet_and_fail(names=["Vinko"])
+        self.assertEqual(writes_mock.mock_calls, [call.greeting("Vinko")])
+
+    async def test_writes_are_flushed_at_flush_point(self) -> None:
+        self.assertEqual(
+            await greet_with_flush(names=["Vinko", "Ana"]),
+            ["Hello, Vinko!", "Hello, Ana!"],
+        )
+        self.assertEqual(
+            writes_mock.mock_calls,
+            [
+                call.greeting("Vinko"),
+                call.counter(["greetings"]),
+                call.audit_log(["greeted Vinko"]),
+                call.greeting("Ana"),
+                call.counter(["greetings"]),
+                call.audit_log(["greeted Ana"]),
+            ],
+        )
+
+    async def test_flush_exception_is_raised_by_flow(self) -> None:
+        with self.assertRaisesRegex(ConnectionError, "Audit log is not available."):
+            await greet_without_audit_log(names=["Vinko"])
+        self.assertEqual(
+            writes_mock.mock_calls,
+            [call.greeting("Vinko"), call.counter(["greetings"])],
+        )
+
+    async def test_write_batched_flow_function_outside_flow(self) -> None:
+        await audit_log("greeted Vinko")
+        writes_mock.audit_log.assert_awaited_once_with(["greeted Vinko"])
+
+    async def test_write_batched_flow_function_is_not_cached(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`write_batched` cannot be combined with `cached` or `batched`.",
+        ):
+
+            @flow_function(cached=True, write_batched=True)
+            async def cached_audit_log(rows: list[str]) -> None:
+                pass
+
+    async def test_write_batched_flow_function_has_one_argument_for_values(
+        self,
+    ) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`audit_log_with_level` write batched FlowFunction has to have"
+            " one argument that is not FlowFunction, the list of values.",
+        ):
+
+            @flow_function(write_batched=True)
+            async def audit_log_with_level(rows: list[str], level: str) -> None:
+                pass
@@ -0,0 +1,60 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import gc
+import unittest
+
+from flow_compose import flow, flow_function, FlowFunction, FlowArgument, Flow
+
+
+@flow_function(cached=True)
+def user__using_user_name(user_name: FlowFunction[str]) -> str:
+    return user_name().capitalize()
+
+
+@flow_function()
+def greeting__using_user(user: FlowFunction[str]) -> str:
+    return f"Hello, {user()}!"
+
+
+@flow_function()
+def greet_using_greeting(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(
+    user_name=FlowArgument(str),
+    user=user__using_user_name,
+)
+def hello_user(user: FlowFunction[str]) -> str:
+    return user()
+
+
+hello_world_configuration = {
+    "user_name": FlowArgument(str),
+    "user": Flow(hello_user, cached=True),
+    "greeting": greeting__using_user,
+}
+
+
+def hello_world_body(greet: FlowFunction[str] = greet_using_greeting) -> str:
+    return greet()
+
+
+hello_world = flow(**hello_world_configuration)(hello_world_body)
+compiled_hello_world = flow(compile=True, **hello_world_configuration)(hello_world_body)
+
+
+class TestFlowInvocationWithoutReferenceCycles(unittest.TestCase):
+    def test_flow_invocation_without_reference_cycles(self):
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(10):
+                self.assertEqual(hello_world(user_name="vinko"), "Hello, Vinko!")
+                self.assertEqual(
+                    compiled_hello_world(user_name="vinko"), "Hello, Vinko!"
+                )
+            self.assertEqual(gc.collect(), 0)
+        finally:
+            gc.enable()
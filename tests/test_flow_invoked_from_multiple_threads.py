@@ -0,0 +1,116 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import random
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from flow_compose import flow, flow_function, FlowFunction, FlowArgument
+from flow_compose.implementation.classes.base.flow_function_invoker import (
+    EMPTY_FLOW_CONTEXT,
+)
+
+THREADS = 16
+INVOCATIONS = 2000
+
+
+@flow_function()
+def greeting(greeting_word: FlowFunction[str], user_name: FlowFunction[str]) -> str:
+    # lets the other threads run between reading the flow arguments
+    time.sleep(0)
+    return f"{greeting_word()}, {user_name()}!"
+
+
+@flow(
+    greeting_word=FlowArgument(str),
+    greeting=greeting,
+)
+def greet(user_name: FlowArgument[str], greeting: FlowFunction[str]) -> str:
+    time.sleep(0)
+    return f"{greeting()} ({user_name()})"
+
+
+@flow(
+    greeting_word=FlowArgument(str),
+    greeting=greeting,
+    compile=True,
+)
+def greet_compiled(user_name: FlowArgument[str], greeting: FlowFunction[str]) -> str:
+    time.sleep(0)
+    return f"{greeting()} ({user_name()})"
+
+
+@flow_function(cached="process")
+def user_language(user_name: str) -> str:
+    time.sleep(0)
+    return "en"
+
+
+@flow(
+    user_language=user_language,
+)
+def user_language_flow(user_name: str, user_language: FlowFunction[str]) -> str:
+    return user_language(user_name)
+
+
+@flow_function()
+def greeting_without_flow(
+    greeting_word: FlowFunction[str] = FlowArgument(str, default="Hello"),
+    user_name: FlowFunction[str] = FlowArgument(str, default="Vinko"),
+) -> str:
+    return f"{greeting_word()}, {user_name()}!"
+
+
+class TestFlowInvokedFromMultipleThreads(unittest.TestCase):
+    def test_flow_arguments_are_isolated_between_threads(self) -> None:
+        for greet_flow in (greet, greet_compiled):
+            with self.subTest(greet_flow=greet_flow.__name__):
+                start = threading.Barrier(THREADS)
+
+                def invoke(seed: int) -> tuple[str, str]:
+                    if seed < THREADS:
+                        start.wait()
+                    arguments = random.Random(seed)
+                    greeting_word = arguments.choice(["Hello", "Hi", "Bok", "Ciao"])
+                    user_name = f"user {arguments.randrange(1_000_000)}"
+                    return (
+                        greet_flow(greeting_word=greeting_word, user_name=user_name),
+                        f"{greeting_word}, {user_name}! ({user_name})",
+                    )
+
+                with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                    for greeting_text, expected_greeting_text in executor.map(
+                        invoke, range(INVOCATIONS)
+                    ):
+                        self.assertEqual(greeting_text, expected_greeting_text)
+
+    def test_process_cache_counts_calls_from_all_threads(self) -> None:
+        user_language.cache_clear()
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            list(
+                executor.map(
+                    lambda index: user_language_flow(user_name=f"user {index % 10}"),
+                    range(INVOCATIONS),
+                )
+            )
+        cache_info = user_language.cache_info()
+        self.assertEqual(cache_info.hits + cache_info.misses, INVOCATIONS)
+        self.assertEqual(cache_info.currsize, 10)
+
+    def test_flow_functions_called_outside_flow_do_not_change_shared_state(
+        self,
+    ) -> None:
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            self.assertEqual(
+                set(executor.map(lambda _: greeting_without_flow(), range(100))),
+                {"Hello, Vinko!"},
+            )
+        self.assertEqual(len(EMPTY_FLOW_CONTEXT), 0)
+        with self.assertRaisesRegex(
+            AssertionError,
+            "The flow context of flow functions called outside a flow"
+            " cannot be changed.",
+        ):
+            EMPTY_FLOW_CONTEXT.flow_arguments = {"user_name": "Vinko"}
@@ -0,0 +1,181 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import Mock, call
+
+from flow_compose import flow, flow_function, FlowArgument, FlowFunction
+
+lookups_mock = Mock()
+
+
+@flow_function(cached=True)
+def tax_rates() -> dict[str, float]:
+    lookups_mock.tax_rates()
+    return {"HR": 0.25, "DE": 0.5}
+
+
+@flow_function(cached=True)
+def tax_rate(
+    country: FlowFunction[str], tax_rates: FlowFunction[dict[str, float]]
+) -> float:
+    lookups_mock.tax_rate(country())
+    return tax_rates()[country()]
+
+
+@flow_function()
+def price_with_tax(price: FlowFunction[float], tax_rate: FlowFunction[float]) -> float:
+    return price() * (1 + tax_rate())
+
+
+@flow_function(write_batched=True)
+def audit_log(rows: list[str]) -> None:
+    lookups_mock.audit_log(rows)
+
+
+@flow_function()
+def failing_price_with_tax(price: FlowFunction[float]) -> float:
+    if price() < 0:
+        raise ValueError(f"Price {price()} is negative.")
+    return price()
+
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "price": FlowArgument(float),
+    "country": FlowArgument(str, default="HR"),
+    "tax_rates": tax_rates,
+    "tax_rate": tax_rate,
+    "price_with_tax": price_with_tax,
+    "audit_log": audit_log,
+}
+
+
+@flow(**configuration)
+def price_record(
+    currency: str,
+    price_with_tax: FlowFunction[float],
+    audit_log: FlowFunction[None],
+) -> str:
+    audit_log(f"priced {price_with_tax()}")
+    return f"{price_with_tax()} {currency}"
+
+
+@flow(compile=True, **configuration)
+def price_record_compiled(
+    currency: str,
+    price_with_tax: FlowFunction[float],
+    audit_log: FlowFunction[None],
+) -> str:
+    audit_log(f"priced {price_with_tax()}")
+    return f"{price_with_tax()} {currency}"
+
+
+@flow(price=FlowArgument(float), failing_price_with_tax=failing_price_with_tax)
+def failing_price_record(failing_price_with_tax: FlowFunction[float]) -> float:
+    return failing_price_with_tax()
+
+
+records = [
+    {"currency": "EUR", "price": 10.0, "country": "HR"},
+    {"currency": "EUR", "price": 20.0, "country": "DE"},
+    {"currency": "USD", "price": 30.0},
+]
+
+
+class TestFlowMap(unittest.TestCase):
+    def setUp(self) -> None:
+        lookups_mock.reset_mock()
+
+    def test_map_returns_the_results_of_the_invocations_in_order(self) -> None:
+        for mapped_flow in (price_record, price_record_compiled):
+            with self.subTest(flow=mapped_flow.__name__):
+                self.assertEqual(
+                    list(mapped_flow.map(records)),  # type: ignore[attr-defined]
+                    [mapped_flow(**record) for record in records],
+                )
+
+    def test_map_caches_results_per_item(self) -> None:
+        list(price_record.map(records))  # type: ignore[attr-defined]
+
+        self.assertEqual(lookups_mock.tax_rates.call_count, 3)
+        self.assertEqual(
+            lookups_mock.tax_rate.call_args_list, [call("HR"), call("DE"), call("HR")]
+        )
+
+    def test_map_shares_results_of_shared_flow_functions(self) -> None:
+        self.assertEqual(
+            list(price_record.map(records, shared=["tax_rates"])),  # type: ignore[attr-defined]
+            ["12.5 EUR", "30.0 EUR", "37.5 USD"],
+        )
+
+        lookups_mock.tax_rates.assert_called_once()
+        self.assertEqual(lookups_mock.tax_rate.call_count, 3)
+
+    def test_map_writes_write_batches_per_item(self) -> None:
+        list(price_record.map(records))  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            lookups_mock.audit_log.call_args_list,
+            [call(["priced 12.5"]), call(["priced 30.0"]), call(["priced 37.5"])],
+        )
+
+    def test_map_invokes_the_flow_when_the_result_is_requested(self) -> None:
+        consumed_records = []
+
+        def generate_records() -> Iterator[dict[str, Any]]:
+            for record in records:
+                consumed_records.append(record)
+                yield record
+
+        results = price_record.map(generate_records())  # type: ignore[attr-defined]
+
+        self.assertEqual(consumed_records, [])
+        self.assertEqual(next(results), "12.5 EUR")
+        self.assertEqual(consumed_records, records[:1])
+
+    def test_map_raises_the_exception_of_an_item(self) -> None:
+        results = failing_price_record.map(  # type: ignore[attr-defined]
+            [{"price": 1.0}, {"price": -1.0}, {"price": 2.0}]
+        )
+
+        self.assertEqual(next(results), 1.0)
+        with self.assertRaises(ValueError) as error:
+            next(results)
+        self.assertEqual(str(error.exception), "Price -1.0 is negative.")
+        with self.assertRaises(StopIteration):
+            next(results)
+
+    def test_map_raises_type_error_for_invalid_arguments(self) -> None:
+        for record in ({"price": 1.0}, {"currency": "EUR", "price": 1.0, "tax": 1}):
+            with self.subTest(record=record):
+                with self.assertRaises(TypeError):
+                    list(price_record.map([record]))  # type: ignore[attr-defined]
+
+    def test_shared_flow_function_has_to_be_cached_and_configured(self) -> None:
+        for shared_flow_function_name in ("price_with_tax", "price", "discount"):
+            with self.subTest(shared=shared_flow_function_name):
+                with self.assertRaises(AssertionError) as error:
+                    price_record.map(records, shared=[shared_flow_function_name])  # type: ignore[attr-defined]
+
+                self.assertEqual(
+                    str(error.exception),
+                    f"`{shared_flow_function_name}` has to be a cached FlowFunction"
+                    f" in the flow configuration to be shared by the items of `map`.",
+                )
+
+    def test_shared_flow_function_cannot_depend_on_flow_arguments(self) -> None:
+        # `tax_rate` depends on the `country` of each item
+        with self.assertRaises(AssertionError) as error:
+            price_record.map(records, shared=["tax_rate"])  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            str(error.exception),
+            "`tax_rate` depends on flow arguments"
+            " and cannot be shared by the items of `map`.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import itertools
+import os
+import time
+import unittest
+from collections.abc import Iterator
+from typing import Any
+
+from flow_compose import flow, flow_function, FlowArgument, FlowFunction
+
+
+@flow_function(cached=True)
+def tax_rates() -> tuple[int, int]:
+    """Identifies the call that computed the result."""
+    return os.getpid(), time.perf_counter_ns()
+
+
+@flow_function(cached="process")
+def currencies() -> tuple[int, int]:
+    return os.getpid(), time.perf_counter_ns()
+
+
+@flow_function()
+def price_with_tax(price: FlowFunction[int]) -> int:
+    if price() < 0:
+        raise ValueError(f"Price {price()} is negative.")
+    return price() * 2
+
+
+@flow_function(cached=True)
+def discount(price: FlowFunction[int]) -> int:
+    return price() // 10
+
+
+@flow(
+    price=FlowArgument(int),
+    tax_rates=tax_rates,
+    currencies=currencies,
+    price_with_tax=price_with_tax,
+    discount=discount,
+)
+def price_record(
+    price_with_tax: FlowFunction[int],
+    tax_rates: FlowFunction[tuple[int, int]],
+    currencies: FlowFunction[tuple[int, int]],
+) -> tuple[int, tuple[int, int], tuple[int, int]]:
+    return price_with_tax(), tax_rates(), currencies()
+
+
+@flow(
+    price=FlowArgument(int),
+    price_with_tax=price_with_tax,
+    compile=True,
+)
+def price_record_compiled(price_with_tax: FlowFunction[int]) -> int:
+    return price_with_tax()
+
+
+def records(count: int) -> list[dict[str, Any]]:
+    return [{"price": price} for price in range(count)]
+
+
+class TestFlowMapParallel(unittest.TestCase):
+    def test_map_parallel_returns_the_results_in_the_order_of_the_items(
+        self,
+    ) -> None:
+        results = list(
+            price_record.map_parallel(records(50), workers=2, chunksize=4)  # type: ignore[attr-defined]
+        )
+
+        self.assertEqual([price for price, _, _ in results], list(range(0, 100, 2)))
+        self.assertNotIn(os.getpid(), {pid for _, (pid, _), _ in results})
+
+    def test_map_parallel_of_compiled_flow(self) -> None:
+        self.assertEqual(
+            list(price_record_compiled.map_parallel(records(10), workers=2)),  # type: ignore[attr-defined]
+            list(range(0, 20, 2)),
+        )
+
+    def test_unordered_map_parallel_returns_all_results(self) -> None:
+        results = price_record.map_parallel(  # type: ignore[attr-defined]
+            records(50), workers=2, chunksize=4, ordered=False
+        )
+
+        self.assertEqual(
+            sorted(price for price, _, _ in results), list(range(0, 100, 2))
+        )
+
+    def test_cached_results_are_per_item_unless_shared(self) -> None:
+        results = list(
+            price_record.map_parallel(records(20), workers=2, chunksize=2)  # type: ignore[attr-defined]
+        )
+
+        self.assertEqual(len({tax_rates for _, tax_rates, _ in results}), 20)
+
+    def test_worker_caches_stay_warm_between_chunks(self) -> None:
+        results = list(
+            price_record.map_parallel(  # type: ignore[attr-defined]
+                records(40), workers=2, chunksize=2, shared=["tax_rates"]
+            )
+        )
+
+        # 20 chunks are invoked by 2 workers that compute the results once each
+        self.assertLessEqual(len({tax_rates for _, tax_rates, _ in results}), 2)
+        self.assertLessEqual(len({currencies for _, _, currencies in results}), 2)
+
+    def test_items_are_read_as_results_are_requested(self) -> None:
+        def generate_records() -> Iterator[dict[str, Any]]:
+            for price in itertools.count():
+                yield {"price": price}
+
+        results = price_record_compiled.map_parallel(  # type: ignore[attr-defined]
+            generate_records(), workers=1, chunksize=3
+        )
+
+        self.assertEqual(list(itertools.islice(results, 5)), [0, 2, 4, 6, 8])
+        results.close()
+
+    def test_map_parallel_raises_the_exception_of_an_item(self) -> None:
+        results = price_record_compiled.map_parallel(  # type: ignore[attr-defined]
+            [{"price": 1}, {"price": -1}, {"price": 2}], workers=1, chunksize=3
+        )
+
+        self.assertEqual(next(results), 2)
+        with self.assertRaises(ValueError) as error:
+            next(results)
+        self.assertEqual(str(error.exception), "Price -1 is negative.")
+
+    def test_map_parallel_options_are_checked(self) -> None:
+        for options, message in (
+            ({"workers": 0}, "`workers` must be a positive integer."),
+            ({"chunksize": 0}, "`chunksize` must be a positive integer."),
+            (
+                {"shared": ["price_with_tax"]},
+                "`price_with_tax` has to be a cached FlowFunction"
+                " in the flow configuration to be shared by the items of `map`.",
+            ),
+            (
+                {"shared": ["discount"]},
+                "`discount` depends on flow arguments"
+                " and cannot be shared by the items of `map`.",
+            ),
+        ):
+            with self.subTest(options=options):
+                with self.assertRaises(AssertionError) as error:
+                    price_record.map_parallel(records(1), **options)  # type: ignore[attr-defined]
+
+                self.assertEqual(str(error.exception), message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from flow_compose import (
+    flow,
+    flow_function,
+    identity_key,
+    Flow,
+    FlowArgument,
+    FlowContext,
+    FlowFunction,
+)
+
+executor = ThreadPoolExecutor(max_workers=2)
+
+
+@flow_function()
+def user() -> str:
+    return "Vinko"
+
+
+@flow_function(cached=True)
+def cached_user() -> str:
+    return "Vinko"
+
+
+@flow_function(cached="process", maxsize=10, ttl=60)
+def process_cached_user() -> str:
+    return "Vinko"
+
+
+@flow_function(cached=True, key=identity_key)
+def user_by_id(user_id: int) -> str:
+    return f"user {user_id}"
+
+
+@flow_function(cached=True, io_bound=True)
+def io_bound_user() -> str:
+    return "Vinko"
+
+
+@flow_function(write_batched=True)
+def audit_log(rows: list[str]) -> None:
+    pass
+
+
+@flow_function(executor="process")
+def process_user() -> str:
+    return "Vinko"
+
+
+@flow_function()
+def greeting(
+    greeting_format: FlowFunction[str],
+    user: FlowFunction[str] = cached_user,
+) -> str:
+    return greeting_format().format(user())
+
+
+@flow_function()
+def greeting_with_flow_context(
+    flow_context: FlowContext, user: FlowFunction[str]
+) -> str:
+    return f"Hello, {user()}!"
+
+
+greeting_format = FlowArgument(str, default="Hello, {}!")
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "greeting_format": greeting_format,
+    "user": user,
+    "greeting": greeting,
+}
+
+
+@flow(**configuration)
+def greet(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(compile=True, **configuration)
+def greet_compiled(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(executor=executor, **configuration)
+def greet_with_executor(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(greet=Flow(greet, cached=True))
+def greet_composed(greet: FlowFunction[str]) -> str:
+    return greet()
+
+
+class Greetings:
+    @staticmethod
+    @flow(**configuration)
+    def greet(greeting: FlowFunction[str]) -> str:
+        return greeting()
+
+
+def undecorated_user() -> str:
+    return "Vinko"
+
+
+renamed_user = flow_function()(undecorated_user)
+
+
+class TestFlowPickling(unittest.TestCase):
+    def test_flow_functions_are_pickled_by_reference(self) -> None:
+        for pickled_flow_function in (
+            user,
+            cached_user,
+            process_cached_user,
+            user_by_id,
+            io_bound_user,
+            audit_log,
+            process_user,
+            greeting,
+            greeting_with_flow_context,
+        ):
+            with self.subTest(flow_function=pickled_flow_function.name):
+                self.assertIs(
+                    pickle.loads(pickle.dumps(pickled_flow_function)),
+                    pickled_flow_function,
+                )
+
+    def test_flows_are_pickled_by_reference(self) -> None:
+        for pickled_flow in (
+            greet,
+            greet_compiled,
+            greet_with_executor,
+            greet_composed,
+            Greetings.greet,
+        ):
+            with self.subTest(flow=pickled_flow.__qualname__):
+                self.assertIs(pickle.loads(pickle.dumps(pickled_flow)), pickled_flow)
+
+    def test_composed_flow_is_pickled_by_reference_to_its_flow(self) -> None:
+        composed_flow = Flow(greet, cached=True)
+
+        unpickled_flow = pickle.loads(pickle.dumps(composed_flow))
+
+        self.assertIsInstance(unpickled_flow, Flow)
+        self.assertIs(unpickled_flow._flow_function, greet)
+        self.assertTrue(unpickled_flow.cached)
+
+    def test_flow_arguments_are_pickled_by_value(self) -> None:
+        for flow_argument in (
+            FlowArgument(str),
+            FlowArgument(str, default="Hello, {}!"),
+            FlowArgument(int | None, default=None),
+            greeting_format,
+        ):
+            with self.subTest(flow_argument=flow_argument):
+                unpickled_flow_argument = pickle.loads(pickle.dumps(flow_argument))
+
+                self.assertIsInstance(unpickled_flow_argument, FlowArgument)
+                self.assertEqual(
+                    unpickled_flow_argument.argument_type, flow_argument.argument_type
+                )
+                self.assertEqual(
+                    unpickled_flow_argument.value_or_empty,
+                    flow_argument.value_or_empty,
+                )
+        self.assertEqual(
+            pickle.loads(pickle.dumps(greeting_format)).name,
+            "greeting_format",
+        )
+
+    def test_flow_is_invoked_in_a_worker_process(self) -> None:
+        with ProcessPoolExecutor(max_workers=1) as process_pool:
+            self.assertEqual(
+                list(process_pool.map(greet_compiled, ["Hi, {}!"])), ["Hi, Vinko!"]
+            )
+            self.assertEqual(
+                process_pool.submit(greet, greeting_format="Hi, {}!").result(),
+                "Hi, Vinko!",
+            )
+
+    def test_flow_function_not_referenced_by_its_name_cannot_be_pickled(
+        self,
+    ) -> None:
+        with self.assertRaises(pickle.PicklingError) as error:
+            pickle.dumps(renamed_user)
+
+        self.assertEqual(
+            str(error.exception),
+            "Can't pickle `undecorated_user` FlowFunction:"
+            f" it's not the same object as {__name__}.undecorated_user.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import dataclasses
+import unittest
+from typing import Any
+from unittest import mock
+from unittest.mock import Mock
+
+from flow_compose import (
+    flow,
+    flow_function,
+    FlowFunction,
+    attribute_key,
+    identity_key,
+    protocol_key,
+)
+
+greeting_mock = Mock()
+
+
+@dataclasses.dataclass
+class User:
+    id: int
+    name: str
+
+
+@dataclasses.dataclass
+class Account:
+    number: str
+
+    def __flow_cache_key__(self) -> str:
+        return self.number
+
+
+@flow_function(cached=True, key=lambda user: user.id)
+def greeting__using_key_function(user: User) -> str:
+    greeting_mock(user.name)
+    return f"Hello, {user.name}!"
+
+
+@flow_function(cached=True, key=attribute_key("id"))
+def greeting__using_attribute_key(user: User, punctuation: str = "!") -> str:
+    greeting_mock(user.name)
+    return f"Hello, {user.name}{punctuation}"
+
+
+@flow_function(cached=True, key=identity_key)
+def greeting__using_identity_key(preferences: dict[str, Any]) -> str:
+    greeting_mock(preferences)
+    return f"Hello, {preferences['name']}!"
+
+
+@flow_function(cached=True, key=protocol_key)
+def greeting__using_protocol_key(account: Account) -> str:
+    greeting_mock(account.number)
+    return f"Hello, {account.number}!"
+
+
+@flow(
+    greeting=greeting__using_key_function,
+)
+def greet_users__using_key_function(greeting: FlowFunction[str]) -> None:
+    greeting(User(id=1, name="Vinko"))
+    greeting(user=User(id=1, name="Vinko"))
+    greeting(User(id=2, name="Ana"))
+
+
+@flow(
+    greeting=greeting__using_attribute_key,
+)
+def greet_users__using_attribute_key(greeting: FlowFunction[str]) -> None:
+    greeting(User(id=1, name="Vinko"))
+    greeting(user=User(id=1, name="Vinko"), punctuation="!")
+    greeting(User(id=2, name="Ana"))
+
+
+@flow(
+    greeting=greeting__using_identity_key,
+)
+def greet_users__using_identity_key(greeting: FlowFunction[str]) -> None:
+    preferences = {"name": "Vinko"}
+    greeting(preferences)
+    greeting(preferences=preferences)
+    greeting({"name": "Vinko"})
+
+
+@flow(
+    greeting=greeting__using_protocol_key,
+)
+def greet_users__using_protocol_key(greeting: FlowFunction[str]) -> None:
+    greeting(Account(number="HR-1"))
+    greeting(account=Account(number="HR-1"))
+    greeting(Account(number="HR-2"))
+
+
+class TestFlowWithCachedFlowFunctionWithCacheKey(unittest.TestCase):
+    def setUp(self) -> None:
+        greeting_mock.reset_mock()
+
+    def test_key_function(self) -> None:
+        greet_users__using_key_function()
+        greeting_mock.assert_has_calls([mock.call("Vinko"), mock.call("Ana")])
+        self.assertEqual(greeting_mock.call_count, 2)
+
+    def test_attribute_key(self) -> None:
+        greet_users__using_attribute_key()
+        greeting_mock.assert_has_calls([mock.call("Vinko"), mock.call("Ana")])
+        self.assertEqual(greeting_mock.call_count, 2)
+
+    def test_identity_key(self) -> None:
+        greet_users__using_identity_key()
+        greeting_mock.assert_has_calls(
+            [mock.call({"name": "Vinko"}), mock.call({"name": "Vinko"})]
+        )
+        self.assertEqual(greeting_mock.call_count, 2)
+
+    def test_protocol_key(self) -> None:
+        greet_users__using_protocol_key()
+        greeting_mock.assert_has_calls([mock.call("HR-1"), mock.call("HR-2")])
+        self.assertEqual(greeting_mock.call_count, 2)
+
+    def test_key_requires_cached(self) -> None:
+        with self.assertRaisesRegex(AssertionError, "`key` requires `cached`."):
+
+            @flow_function(key=identity_key)
+            def greeting_hello_world() -> str:
+                return "Hello World!"
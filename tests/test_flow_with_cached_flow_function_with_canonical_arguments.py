@@ -0,0 +1,79 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+from unittest import mock
+from unittest.mock import Mock
+
+from flow_compose import flow, flow_function, FlowFunction
+
+greeting_mock = Mock()
+greet_using_greeting_mock = Mock()
+
+
+@flow_function(cached=True)
+def greeting_with_punctuation(index: int, punctuation: str = "!") -> str:
+    greeting_mock(index, punctuation)
+    return f"Hello World{punctuation} - {index}"
+
+
+@flow_function()
+def greet_using_greeting_1(greeting: FlowFunction[str]) -> None:
+    greet_using_greeting_mock(greeting(11))
+    greet_using_greeting_mock(greeting(11, "!"))
+    greet_using_greeting_mock(greeting(index=11))
+    greet_using_greeting_mock(greeting(punctuation="!", index=11))
+    greet_using_greeting_mock(greeting(11, punctuation="!"))
+
+
+@flow(
+    greeting=greeting_with_punctuation,
+)
+def hello_world_1(greet: FlowFunction[None] = greet_using_greeting_1) -> None:
+    greet()
+
+
+@flow_function()
+def greet_using_greeting_2(greeting: FlowFunction[str]) -> None:
+    # hash(-1) == hash(-2)
+    greet_using_greeting_mock(greeting(-1))
+    greet_using_greeting_mock(greeting(-2))
+    greet_using_greeting_mock(greeting(index=1, punctuation="?"))
+    greet_using_greeting_mock(greeting(punctuation=1, index="?"))
+
+
+@flow(
+    greeting=greeting_with_punctuation,
+)
+def hello_world_2(greet: FlowFunction[None] = greet_using_greeting_2) -> None:
+    greet()
+
+
+class TestFlowWithCachedFlowFunctionWithCanonicalArguments(unittest.TestCase):
+    def setUp(self):
+        greeting_mock.reset_mock()
+        greet_using_greeting_mock.reset_mock()
+
+    def test_equivalent_calls_are_executed_once(self):
+        hello_world_1()
+        greeting_mock.assert_called_once_with(11, "!")
+        greet_using_greeting_mock.assert_has_calls([mock.call("Hello World! - 11")] * 5)
+
+    def test_different_calls_with_equal_hashes_are_not_conflated(self):
+        hello_world_2()
+        greeting_mock.assert_has_calls(
+            [
+                mock.call(-1, "!"),
+                mock.call(-2, "!"),
+                mock.call(1, "?"),
+                mock.call("?", 1),
+            ]
+        )
+        greet_using_greeting_mock.assert_has_calls(
+            [
+                mock.call("Hello World! - -1"),
+                mock.call("Hello World! - -2"),
+                mock.call("Hello World? - 1"),
+                mock.call("Hello World1 - ?"),
+            ]
+        )
@@ -0,0 +1,146 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import inspect
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from flow_compose import flow, flow_function, FlowFunction, FlowArgument
+
+greet_using_greeting_mock = Mock()
+hello_world_mock = Mock()
+
+
+@flow_function(cached=True)
+def greeting__using_user_name(user_name: FlowFunction[str]) -> str:
+    return f"Hello, {user_name()}!"
+
+
+@flow_function()
+def greeting_hola_mundo() -> str:
+    return "Hola, Mundo!"
+
+
+@flow_function()
+def greet_using_greeting(index: int, greeting: FlowFunction[str]) -> None:
+    greet_using_greeting_mock(f"{greeting()} - {index}")
+
+
+hello_world_configuration = {
+    "user_name": FlowArgument(str),
+    "punctuation": FlowArgument(str, default="!"),
+    "greeting": greeting__using_user_name,
+}
+
+
+def hello_world_body(
+    index: int,
+    user_name: FlowArgument[str],
+    greeting: FlowFunction[str],
+    greet: FlowFunction[None] = greet_using_greeting,
+) -> str:
+    greet(index)
+    result = f"{greeting()} {user_name()}"
+    hello_world_mock(result)
+    return result
+
+
+hello_world = flow(compile=True, **hello_world_configuration)(hello_world_body)
+
+
+@flow(
+    compile=True,
+    greeting=greeting__using_user_name,
+    greet=greet_using_greeting,
+)
+def hola_mundo(
+    user_name: FlowArgument[str],
+    greet: FlowFunction[None],
+    greeting: FlowFunction[str] = greeting_hola_mundo,
+) -> str:
+    greet(13)
+    return greeting()
+
+
+@flow(compile=True)
+def hello_world_with_missing_greeting(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+def greeting_with_options_body(prefix: str, **options: str) -> str:
+    return f"{prefix} {options}"
+
+
+greeting_with_options = flow(compile=True, **hello_world_configuration)(
+    greeting_with_options_body
+)
+
+
+executor = ThreadPoolExecutor(max_workers=2)
+
+
+def sum_of_values_body(first: int, /, *values: int) -> int:
+    return first + sum(values)
+
+
+sum_of_values = flow(compile=True, executor=executor)(sum_of_values_body)
+
+
+class TestFlowWithCompiledInvoker(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        executor.shutdown()
+
+    def setUp(self):
+        greet_using_greeting_mock.reset_mock()
+        hello_world_mock.reset_mock()
+
+    def test_flow_with_compiled_invoker(self):
+        self.assertEqual(
+            inspect.signature(hello_world),
+            inspect.signature(flow(**hello_world_configuration)(hello_world_body)),
+        )
+
+        self.assertEqual(hello_world(11, user_name="Vinko"), "Hello, Vinko! Vinko")
+        greet_using_greeting_mock.assert_called_once_with("Hello, Vinko! - 11")
+        hello_world_mock.assert_called_once_with("Hello, Vinko! Vinko")
+
+    def test_compiled_flow_with_var_keyword_arguments(self):
+        interpreted_greeting_with_options = flow(**hello_world_configuration)(
+            greeting_with_options_body
+        )
+        for greeting_flow in (greeting_with_options, interpreted_greeting_with_options):
+            with self.subTest(greeting_flow=greeting_flow):
+                self.assertEqual(
+                    "Hi {'tone': 'warm'}",
+                    greeting_flow(prefix="Hi", user_name="Vinko", tone="warm"),
+                )
+
+    def test_compiled_concurrent_flow_with_positional_arguments(self):
+        self.assertEqual(6, sum_of_values(1, 2, 3))
+
+    def test_compiled_lambda_flow(self):
+        lambda_flow = flow(compile=True)(lambda: 1)
+
+        self.assertEqual(1, lambda_flow())
+        self.assertEqual("<lambda>", lambda_flow.__name__)
+
+    def test_compiled_flow_with_overriding_flow_function(self):
+        self.assertEqual(hola_mundo(user_name="Ana"), "Hola, Mundo!")
+        greet_using_greeting_mock.assert_called_once_with("Hello, Ana! - 13")
+
+    def test_compiled_flow_with_incomplete_configuration(self):
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`greeting` FlowFunction is required by the flow"
+            " `hello_world_with_missing_greeting` but is missing in the flow context.",
+        ):
+            hello_world_with_missing_greeting()
+
+    def test_flow_option_used_as_flow_function_alias(self):
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`compile` is a flow option and cannot be used as a flow function alias.",
+        ):
+            flow(**{"compile": greeting_hola_mundo})
@@ -0,0 +1,174 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import Mock
+
+from flow_compose import flow, flow_function, Flow, FlowFunction
+
+executor = ThreadPoolExecutor(max_workers=4)
+lookups_mock = Mock()
+
+
+class Lookups:
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+
+def lookup(name: str) -> None:
+    lookups_mock(name)
+    with Lookups.lock:
+        Lookups.running += 1
+        Lookups.max_running = max(Lookups.max_running, Lookups.running)
+    time.sleep(0.05)
+    with Lookups.lock:
+        Lookups.running -= 1
+
+
+@flow_function(cached=True, io_bound=True)
+def user() -> str:
+    lookup("user")
+    return "Vinko"
+
+
+@flow_function(cached=True, io_bound=True)
+def permissions() -> list[str]:
+    lookup("permissions")
+    return ["greet"]
+
+
+@flow_function(cached=True, io_bound=True)
+def failing_permissions() -> list[str]:
+    lookup("permissions")
+    raise PermissionError("Permissions not found.")
+
+
+@flow_function(cached=True)
+def tenant() -> str:
+    lookup("tenant")
+    return "execution-flows"
+
+
+@flow_function()
+def greeting(
+    user: FlowFunction[str],
+    permissions: FlowFunction[list[str]],
+    tenant: FlowFunction[str],
+) -> str:
+    return f"Hello, {user()} from {tenant()}!" if "greet" in permissions() else ""
+
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "user": user,
+    "permissions": permissions,
+    "tenant": tenant,
+    "greeting": greeting,
+}
+
+
+@flow(executor=executor, **configuration)
+def greet(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(executor=executor, compile=True, **configuration)
+def greet_compiled(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(executor=executor, **configuration)
+def greet_in_body(user: FlowFunction[str], permissions: FlowFunction[list[str]]) -> str:
+    return f"Hello, {user()}!" if "greet" in permissions() else ""
+
+
+@flow(executor=executor, compile=True, **configuration)
+def greet_in_body_positionally(
+    user: FlowFunction[str], permissions: FlowFunction[list[str]], /
+) -> str:
+    return f"Hello, {user()}!" if "greet" in permissions() else ""
+
+
+@flow(**configuration)
+def greet_sequentially(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(executor=executor, **{**configuration, "permissions": failing_permissions})
+def greet_without_permissions(greeting: FlowFunction[str]) -> str:
+    return greeting()
+
+
+@flow(executor=executor, greet=Flow(greet_in_body), **configuration)
+def greet_composed(greet: FlowFunction[str]) -> str:
+    return greet()
+
+
+class TestFlowWithIoBoundDependencies(unittest.TestCase):
+    def setUp(self) -> None:
+        lookups_mock.reset_mock()
+        Lookups.max_running = 0
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        executor.shutdown()
+
+    def test_independent_io_bound_dependencies_are_called_concurrently(self) -> None:
+        for greet_flow in (
+            greet,
+            greet_compiled,
+            greet_in_body,
+            greet_in_body_positionally,
+            greet_composed,
+        ):
+            with self.subTest(flow=greet_flow.__name__):
+                Lookups.max_running = 0
+
+                greet_flow()
+
+                self.assertEqual(Lookups.max_running, 2)
+
+    def test_io_bound_dependencies_are_called_once(self) -> None:
+        self.assertEqual(greet(), "Hello, Vinko from execution-flows!")
+
+        self.assertEqual(
+            sorted(name for (name,), _ in lookups_mock.call_args_list),
+            ["permissions", "tenant", "user"],
+        )
+
+    def test_dependencies_are_called_sequentially_without_executor(self) -> None:
+        self.assertEqual(greet_sequentially(), "Hello, Vinko from execution-flows!")
+
+        self.assertEqual(Lookups.max_running, 1)
+
+    def test_exception_of_io_bound_dependency_is_raised_by_its_call(self) -> None:
+        with self.assertRaises(PermissionError):
+            greet_without_permissions()
+
+    def test_io_bound_flow_function_has_to_be_cached(self) -> None:
+        with self.assertRaises(AssertionError) as error:
+
+            @flow_function(io_bound=True)
+            def lookup_user() -> str:
+                return "Vinko"
+
+        self.assertEqual(str(error.exception), "`io_bound` requires `cached`.")
+
+    def test_executor_has_to_be_executor(self) -> None:
+        with self.assertRaises(AssertionError) as error:
+
+            @flow(executor=True)  # type: ignore[arg-type]
+            def greet_with_invalid_executor(greeting: FlowFunction[str]) -> str:
+                return greeting()
+
+        self.assertEqual(
+            str(error.exception), "Flow option `executor` has to be `Executor`."
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
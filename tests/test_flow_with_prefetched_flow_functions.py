@@ -0,0 +1,159 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from flow_compose import flow, flow_function, FlowContext, FlowFunction
+
+user_mock = Mock()
+permissions_mock = Mock()
+executor = ThreadPoolExecutor(max_workers=2)
+permissions_started = threading.Event()
+
+
+@flow_function(cached=True)
+def user() -> str:
+    user_mock(threading.current_thread() is threading.main_thread())
+    # waits for permissions, so both are executed concurrently
+    assert permissions_started.wait(timeout=5)
+    return "Vinko"
+
+
+@flow_function(cached=True)
+def permissions() -> list[str]:
+    permissions_mock(threading.current_thread() is threading.main_thread())
+    permissions_started.set()
+    return ["greet"]
+
+
+@flow_function(cached=True)
+def failing_permissions() -> list[str]:
+    permissions_mock(threading.current_thread() is threading.main_thread())
+    permissions_started.set()
+    raise PermissionError("Permissions not found.")
+
+
+@flow_function()
+def greeting(user: FlowFunction[str], permissions: FlowFunction[list[str]]) -> str:
+    return f"Hello, {user()}!" if "greet" in permissions() else ""
+
+
+@flow_function()
+def greeting_with_prefetch(
+    flow_context: FlowContext,
+    greeting: FlowFunction[str],
+) -> str:
+    flow_context.prefetch("user", "permissions", executor=executor)
+    return greeting()
+
+
+@flow(
+    user=user,
+    permissions=permissions,
+    greeting=greeting,
+)
+def greet(flow_context: FlowContext, greeting: FlowFunction[str]) -> str:
+    flow_context.prefetch("user", "permissions", executor=executor)
+    return greeting()
+
+
+@flow(
+    user=user,
+    permissions=permissions,
+    greeting=greeting,
+    compile=True,
+)
+def greet_compiled(flow_context: FlowContext, greeting: FlowFunction[str]) -> str:
+    flow_context.prefetch("user", "permissions", executor=executor)
+    return greeting()
+
+
+@flow(
+    user=user,
+    permissions=permissions,
+    greeting=greeting,
+)
+def greet_in_flow_function(
+    greet: FlowFunction[str] = greeting_with_prefetch,
+) -> str:
+    return greet()
+
+
+@flow(
+    user=user,
+    permissions=failing_permissions,
+    greeting=greeting,
+)
+def greet_without_permissions(
+    flow_context: FlowContext, greeting: FlowFunction[str]
+) -> str:
+    flow_context.prefetch("user", "permissions", executor=executor)
+    return greeting()
+
+
+@flow(
+    user=user,
+    permissions=permissions,
+    greeting=greeting,
+)
+def greet_with_immediate_prefetch(
+    flow_context: FlowContext, greeting: FlowFunction[str]
+) -> str:
+    flow_context.prefetch("permissions")
+    permissions_mock.assert_called_once_with(True)
+    return greeting()
+
+
+@flow(
+    user=user,
+    permissions=permissions,
+    greeting=greeting,
+)
+def greet_with_prefetched_greeting(
+    flow_context: FlowContext, greeting: FlowFunction[str]
+) -> str:
+    flow_context.prefetch("greeting")
+    return greeting()
+
+
+class TestFlowWithPrefetchedFlowFunctions(unittest.TestCase):
+    def setUp(self) -> None:
+        user_mock.reset_mock()
+        permissions_mock.reset_mock()
+        permissions_started.clear()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        executor.shutdown()
+
+    def test_prefetched_flow_functions_are_executed_once_in_executor(self) -> None:
+        for greet_flow in (greet, greet_compiled, greet_in_flow_function):
+            with self.subTest(greet_flow=greet_flow.__name__):
+                self.setUp()
+                self.assertEqual(greet_flow(), "Hello, Vinko!")
+                user_mock.assert_called_once_with(False)
+                permissions_mock.assert_called_once_with(False)
+
+    def test_prefetched_exception_is_raised_by_later_call(self) -> None:
+        with self.assertRaisesRegex(PermissionError, "Permissions not found."):
+            greet_without_permissions()
+
+    def test_prefetch_without_executor_executes_immediately(self) -> None:
+        permissions_started.set()
+        self.assertEqual(greet_with_immediate_prefetch(), "Hello, Vinko!")
+        permissions_mock.assert_called_once_with(True)
+
+    def test_prefetched_flow_function_has_to_be_cached(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`greeting` FlowFunction has to be cached"
+            " and callable without arguments to be prefetched.",
+        ):
+            greet_with_prefetched_greeting()
+
+    def test_flow_context_is_not_a_flow_argument(self) -> None:
+        with self.assertRaises(TypeError):
+            greet(flow_context=FlowContext())
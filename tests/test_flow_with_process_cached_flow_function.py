@@ -0,0 +1,131 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+from unittest import mock
+from unittest.mock import Mock
+
+from flow_compose import flow, flow_function, FlowArgument, FlowContext, FlowFunction
+
+greeting_mock = Mock()
+greet_mock = Mock()
+
+
+@flow_function(cached="process", maxsize=2, ttl=60)
+def greeting_with_index(index: int) -> str:
+    greeting_mock(index)
+    return f"Hello World! - {index}"
+
+
+@flow(
+    greeting=greeting_with_index,
+)
+def hello_world(index: int, greeting: FlowFunction[str]) -> None:
+    greet_mock(greeting(index))
+    greet_mock(greeting(index=index))
+
+
+@flow_function(cached="process")
+def greetings() -> dict[int, str]:
+    return {1: "Hello", 2: "Hola"}
+
+
+@flow_function(cached="process")
+def greeting_in_language(
+    language_id: int, greetings: FlowFunction[dict[int, str]]
+) -> str:
+    return (greetings())[language_id]
+
+
+@flow_function(cached="process")
+def user_greeting(user_id: FlowFunction[int]) -> str:
+    return f"Hello, user {user_id()}!"
+
+
+@flow(
+    greetings=greetings,
+    greeting=greeting_in_language,
+    language_id=FlowArgument(int),
+)
+def greet_in_language(
+    language_id: FlowFunction[int], greeting: FlowFunction[str]
+) -> str:
+    return greeting(language_id())
+
+
+class TestFlowWithProcessCachedFlowFunction(unittest.TestCase):
+    def setUp(self) -> None:
+        greeting_with_index.cache_clear()
+        greeting_mock.reset_mock()
+        greet_mock.reset_mock()
+
+    def test_result_is_shared_by_flow_invocations(self) -> None:
+        hello_world(index=11)
+        hello_world(index=11)
+        greeting_mock.assert_called_once_with(11)
+        greet_mock.assert_has_calls([mock.call("Hello World! - 11")] * 4)
+        cache_info = greeting_with_index.cache_info()
+        self.assertEqual(cache_info.hits, 3)
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.maxsize, 2)
+        self.assertEqual(cache_info.currsize, 1)
+
+    def test_least_recently_used_result_is_evicted(self) -> None:
+        hello_world(index=11)
+        hello_world(index=13)
+        hello_world(index=11)
+        hello_world(index=17)
+        hello_world(index=11)
+        hello_world(index=13)
+        greeting_mock.assert_has_calls(
+            [mock.call(11), mock.call(13), mock.call(17), mock.call(13)]
+        )
+        self.assertEqual(greeting_mock.call_count, 4)
+        self.assertEqual(greeting_with_index.cache_info().currsize, 2)
+
+    def test_expired_result_is_executed_again(self) -> None:
+        with mock.patch(
+            "flow_compose.implementation.classes.base.flow_function_cache.time.monotonic",
+            side_effect=[0, 1, 61, 61, 62],
+        ):
+            hello_world(index=11)
+            hello_world(index=11)
+        greeting_mock.assert_has_calls([mock.call(11), mock.call(11)])
+        self.assertEqual(greeting_mock.call_count, 2)
+
+    def test_ttl_requires_process_scope(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError, "`ttl` requires `cached='process'`."
+        ):
+
+            @flow_function(cached=True, ttl=60)
+            def greeting_hello_world() -> str:
+                return "Hello World!"
+
+    def test_process_cached_dependency_is_shared(self) -> None:
+        self.assertEqual("Hello", greet_in_language(language_id=1))
+        self.assertEqual("Hola", greet_in_language(language_id=2))
+
+    def test_dependency_on_flow_argument(self) -> None:
+        # the result of the first flow invocation would be returned to the others
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`user_greeting` FlowFunction cached with the 'process' scope"
+            " can depend only on flow functions cached with the 'process' scope,"
+            " but `user_id` is not.",
+        ):
+
+            @flow(user_id=FlowArgument(int), user_greeting=user_greeting)
+            def greet_user(user_greeting: FlowFunction[str]) -> str:
+                return user_greeting()
+
+    def test_dependency_on_flow_context(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`user_settings` FlowFunction cached with the 'process' scope"
+            " cannot have a FlowContext argument.",
+        ):
+
+            @flow_function(cached="process")
+            def user_settings(flow_context: FlowContext) -> dict[str, str]:
+                return {}
@@ -0,0 +1,141 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+from unittest.mock import Mock
+
+from flow_compose import flow, flow_function, FlowContext, FlowFunction, FlowArgument
+
+user_mock = Mock()
+greeting_mock = Mock()
+farewell_mock = Mock()
+signature_mock = Mock()
+
+
+@flow_function(cached=True)
+def user__using_user_name(user_name: FlowFunction[str]) -> str:
+    user_mock()
+    return user_name().capitalize()
+
+
+@flow_function()
+def greeting__using_user(user: FlowFunction[str]) -> str:
+    greeting_mock()
+    return f"Hello, {user()}!"
+
+
+@flow_function()
+def farewell__using_user(user: FlowFunction[str]) -> str:
+    farewell_mock()
+    return f"Goodbye, {user()}!"
+
+
+@flow_function()
+def signature__using_user(user: FlowFunction[str]) -> str:
+    signature_mock()
+    return f"-- {user()}"
+
+
+base_flow_configuration = {
+    "user_name": FlowArgument(str),
+    "user": user__using_user_name,
+    "greeting": greeting__using_user,
+    "farewell": farewell__using_user,
+    "signature": signature__using_user,
+}
+
+
+@flow(**base_flow_configuration)
+def hello_world(
+    say_goodbye: bool,
+    user: FlowFunction[str],
+    greeting: FlowFunction[str],
+    farewell: FlowFunction[str],
+) -> str:
+    if not say_goodbye:
+        return greeting()
+    return f"{greeting()} {farewell()} {user()}"
+
+
+@flow(**base_flow_configuration)
+def hello_world_with_flow_context(
+    greeting: FlowFunction[str], flow_context: FlowContext
+) -> tuple[str, set[str]]:
+    # the aliases of the invokers created in the flow context so far
+    return greeting(), set(flow_context.keys())
+
+
+@flow_function()
+def signature_lookups(
+    flow_context: FlowContext,
+) -> tuple[bool, object, bool, int, str, bool]:
+    signature_before = (
+        "signature" in flow_context,
+        flow_context.get("signature"),
+        "signature" in list(flow_context.keys()),
+        len(flow_context),
+    )
+    # subscripting the alias creates its invoker
+    signature = flow_context["signature"]()  # type: ignore[operator]
+    return *signature_before, signature, "signature" in flow_context
+
+
+@flow(**base_flow_configuration)
+def hello_world_with_signature_lookups(
+    lookups: FlowFunction[
+        tuple[bool, object, bool, int, str, bool]
+    ] = signature_lookups,
+) -> tuple[bool, object, bool, int, str, bool]:
+    return lookups()
+
+
+class TestFlowWithUnusedFlowFunctionsInConfiguration(unittest.TestCase):
+    def setUp(self) -> None:
+        for mock in (user_mock, greeting_mock, farewell_mock, signature_mock):
+            mock.reset_mock()
+
+    def test_flow_with_unused_flow_functions_in_configuration(self):
+        self.assertEqual(
+            hello_world(say_goodbye=False, user_name="vinko"), "Hello, Vinko!"
+        )
+        user_mock.assert_called_once_with()
+        greeting_mock.assert_called_once_with()
+        farewell_mock.assert_not_called()
+
+        user_mock.reset_mock()
+        greeting_mock.reset_mock()
+
+        self.assertEqual(
+            hello_world(say_goodbye=True, user_name="ana"),
+            "Hello, Ana! Goodbye, Ana! Ana",
+        )
+        user_mock.assert_called_once_with()
+        greeting_mock.assert_called_once_with()
+        farewell_mock.assert_called_once_with()
+        signature_mock.assert_not_called()
+
+    def test_flow_creates_invokers_only_for_used_flow_functions(self):
+        greeting, aliases = hello_world_with_flow_context(user_name="vinko")
+
+        self.assertEqual("Hello, Vinko!", greeting)
+        self.assertEqual({"user_name", "user", "greeting"}, aliases)
+        signature_mock.assert_not_called()
+        farewell_mock.assert_not_called()
+
+    def test_flow_context_lists_only_created_invokers(self):
+        (
+            signature_in_context,
+            signature_invoker,
+            signature_in_keys,
+            invokers_count,
+            signature,
+            signature_in_context_when_used,
+        ) = hello_world_with_signature_lookups(user_name="vinko")
+
+        self.assertFalse(signature_in_context)
+        self.assertIsNone(signature_invoker)
+        self.assertFalse(signature_in_keys)
+        # `user_name` and `lookups`
+        self.assertEqual(2, invokers_count)
+        self.assertEqual("-- Vinko", signature)
+        self.assertTrue(signature_in_context_when_used)
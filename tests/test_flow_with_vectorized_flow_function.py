@@ -0,0 +1,262 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+from collections.abc import Sequence
+from typing import Any
+from unittest.mock import Mock, call
+
+from flow_compose import flow, flow_function, FlowArgument, FlowFunction
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment, unused-ignore]
+
+calls_mock = Mock()
+
+
+@flow_function(vectorized=True)
+def price_with_tax(
+    price: FlowFunction[Sequence[float]], tax_rate: FlowFunction[Sequence[float]]
+) -> list[float]:
+    calls_mock.price_with_tax(len(price()))
+    return [value * (1 + rate) for value, rate in zip(price(), tax_rate())]
+
+
+@flow_function(vectorized=True)
+def array_price_with_tax(price: FlowFunction[Any], tax_rate: FlowFunction[Any]) -> Any:
+    calls_mock.array_price_with_tax(type(price()), type(tax_rate()))
+    return price() * (1 + tax_rate())
+
+
+@flow_function(vectorized=True)
+def discounted(prices: Sequence[float], discount: float = 0.5) -> list[float]:
+    calls_mock.discounted(len(prices))
+    return [value * (1 - discount) for value in prices]
+
+
+@flow_function()
+def label(name: FlowFunction[str], price_with_tax: FlowFunction[float]) -> str:
+    calls_mock.label(name())
+    return f"{name()}: {price_with_tax()}"
+
+
+@flow_function()
+def tagged_label(label: FlowFunction[str], tags: FlowFunction[list[str]]) -> str:
+    return f"{label()} {tags()}"
+
+
+@flow_function()
+def currency() -> str:
+    calls_mock.currency()
+    return "EUR"
+
+
+@flow_function(write_batched=True)
+def audit_log(rows: list[str]) -> None:
+    calls_mock.audit_log(rows)
+
+
+configuration: dict[str, FlowFunction[Any]] = {
+    "price": FlowArgument(float),
+    "name": FlowArgument(str),
+    "tax_rate": FlowArgument(float, default=0.25),
+    "price_with_tax": price_with_tax,
+    "discounted": discounted,
+    "label": label,
+    "currency": currency,
+    "audit_log": audit_log,
+}
+
+
+@flow(**configuration)
+def price_list(
+    label: FlowFunction[str],
+    currency: FlowFunction[str],
+    price_with_tax: FlowFunction[float],
+) -> tuple[Any, ...]:
+    return label(), currency(), price_with_tax()
+
+
+@flow(**configuration)
+def discounted_price_list(
+    price_with_tax: FlowFunction[float], discounted: FlowFunction[float]
+) -> Any:
+    return discounted(price_with_tax())
+
+
+@flow(**configuration)
+def array_price_list(
+    array_price_with_tax: FlowFunction[Any] = array_price_with_tax,
+) -> Any:
+    return array_price_with_tax()
+
+
+@flow(tags=FlowArgument(list), tagged_label=tagged_label, **configuration)
+def tagged_price_list(tagged_label: FlowFunction[str]) -> str:
+    return tagged_label()
+
+
+@flow(**configuration)
+def audited_price_list(label: FlowFunction[str], audit_log: FlowFunction[None]) -> None:
+    audit_log(label())
+
+
+class TestFlowWithVectorizedFlowFunction(unittest.TestCase):
+    def setUp(self) -> None:
+        calls_mock.reset_mock()
+
+    def test_flow_with_single_values(self) -> None:
+        self.assertEqual(("A: 12.5", "EUR", 12.5), price_list(price=10.0, name="A"))
+        # the vectorized flow function is called with columns of one value
+        self.assertEqual(
+            [call.price_with_tax(1), call.price_with_tax(1)],
+            calls_mock.price_with_tax.call_args_list,
+        )
+
+    def test_vectorized_flow_function_invoked_outside_flow(self) -> None:
+        self.assertEqual(5.0, discounted(10.0))
+        self.assertEqual(8.0, discounted(10.0, discount=0.2))
+        self.assertEqual(8.0, discounted(10.0, 0.2))
+
+    def test_vectorized_flow_function_invoked_with_keyword_arguments(self) -> None:
+        self.assertEqual(5.0, discounted(prices=10.0))
+        self.assertEqual(8.0, discounted(prices=10.0, discount=0.2))
+
+    def test_map_columns_calls_vectorized_flow_function_once(self) -> None:
+        labels, _, prices = price_list.map_columns(  # type: ignore[attr-defined]
+            {"price": [10.0, 20.0, 30.0], "name": ["A", "B", "C"]}
+        )
+
+        self.assertEqual([12.5, 25.0, 37.5], list(prices))
+        self.assertEqual(["A: 12.5", "B: 25.0", "C: 37.5"], labels)
+        # the rows of `label` take their values from the column
+        calls_mock.price_with_tax.assert_called_once_with(3)
+
+    def test_map_columns_calls_flow_functions_depending_on_columns_per_row(
+        self,
+    ) -> None:
+        price_list.map_columns({"price": [10.0, 20.0], "name": ["A", "B"]})  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            [call.label("A"), call.label("B")], calls_mock.label.call_args_list
+        )
+
+    def test_map_columns_calls_independent_flow_functions_once(self) -> None:
+        _, currency_result, _ = price_list.map_columns(  # type: ignore[attr-defined]
+            {"price": [10.0, 20.0], "name": ["A", "B"]}
+        )
+
+        self.assertEqual("EUR", currency_result)
+        calls_mock.currency.assert_called_once_with()
+
+    def test_map_columns_shares_single_values_of_flow_arguments(self) -> None:
+        _, _, prices = price_list.map_columns(  # type: ignore[attr-defined]
+            {"price": [10.0, 20.0]}, name="A", tax_rate=0.5
+        )
+
+        self.assertEqual([15.0, 30.0], list(prices))
+
+    def test_map_columns_shares_sequences_passed_as_single_values(self) -> None:
+        for tags in (["x"], ["x", "y"]):
+            with self.subTest(tags=tags):
+                labels = tagged_price_list.map_columns(  # type: ignore[attr-defined]
+                    {"price": [10.0, 20.0], "name": ["A", "B"]}, tags=tags
+                )
+
+                # a single value with the length of the columns is not split
+                self.assertEqual(
+                    [f"A: 12.5 {tags}", f"B: 25.0 {tags}"],
+                    labels,
+                )
+
+    def test_map_columns_passes_column_arguments_to_vectorized_flow_function(
+        self,
+    ) -> None:
+        prices = discounted_price_list.map_columns({"price": [10.0, 20.0]}, name="A")  # type: ignore[attr-defined]
+
+        self.assertEqual([6.25, 12.5], list(prices))
+        calls_mock.discounted.assert_called_once_with(2)
+
+    def test_map_columns_writes_values_of_rows(self) -> None:
+        audited_price_list.map_columns({"price": [10.0, 20.0], "name": ["A", "B"]})  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            [call.audit_log(["A: 12.5"]), call.audit_log(["B: 25.0"])],
+            calls_mock.audit_log.call_args_list,
+        )
+
+    def test_map_columns_with_columns_of_different_length(self) -> None:
+        with self.assertRaises(AssertionError) as context:
+            price_list.map_columns({"price": [10.0, 20.0], "name": ["A"]})  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            "Flow argument columns of `map_columns` have to have the same length.",
+            str(context.exception),
+        )
+
+    def test_map_columns_without_columns(self) -> None:
+        with self.assertRaises(AssertionError) as context:
+            price_list.map_columns({}, price=10.0, name="A")  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            "`map_columns` requires at least one flow argument column.",
+            str(context.exception),
+        )
+
+    def test_map_columns_with_column_that_is_not_a_sequence(self) -> None:
+        with self.assertRaises(AssertionError) as context:
+            price_list.map_columns({"price": 10.0}, name="A")  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            "Flow argument column `price` of `map_columns` has to be"
+            " a sequence or a NumPy array.",
+            str(context.exception),
+        )
+
+    def test_map_columns_with_column_passed_as_single_value(self) -> None:
+        with self.assertRaises(AssertionError) as context:
+            price_list.map_columns({"price": [10.0]}, price=10.0, name="A")  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            "Flow argument `price` is passed to `map_columns`"
+            " both as a column and as a single value.",
+            str(context.exception),
+        )
+
+    def test_vectorized_cached_flow_function(self) -> None:
+        with self.assertRaises(AssertionError) as context:
+
+            @flow_function(cached=True, vectorized=True)
+            def cached_discounted(prices: Sequence[float]) -> list[float]:
+                return list(prices)
+
+        self.assertEqual(
+            "`vectorized` cannot be combined with `cached`, `batched`"
+            " or `write_batched`.",
+            str(context.exception),
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed.")
+    def test_flow_with_numpy_arrays_of_single_values(self) -> None:
+        self.assertEqual(12.5, array_price_list(price=10.0, name="A"))
+        calls_mock.array_price_with_tax.assert_called_once_with(
+            numpy.ndarray, numpy.ndarray
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed.")
+    def test_map_columns_with_numpy_arrays(self) -> None:
+        prices = array_price_list.map_columns(  # type: ignore[attr-defined]
+            {"price": numpy.array([10.0, 20.0])}, name="A"
+        )
+
+        self.assertEqual([12.5, 25.0], prices.tolist())
+        # the single value of `tax_rate` is repeated to a column
+        calls_mock.array_price_with_tax.assert_called_once_with(
+            numpy.ndarray, numpy.ndarray
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
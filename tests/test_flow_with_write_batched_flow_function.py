@@ -0,0 +1,166 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import unittest
+from unittest.mock import Mock, call
+
+from flow_compose import flow, flow_function, FlowContext, FlowFunction
+
+writes_mock = Mock()
+
+
+@flow_function(write_batched=True)
+def audit_log(rows: list[str]) -> None:
+    writes_mock.audit_log(rows)
+
+
+@flow_function(write_batched=True)
+def counter(names: list[str]) -> None:
+    writes_mock.counter(names)
+
+
+@flow_function(write_batched=True)
+def failing_audit_log(rows: list[str]) -> None:
+    raise ConnectionError("Audit log is not available.")
+
+
+@flow_function()
+def greeting(
+    name: str, audit_log: FlowFunction[None], counter: FlowFunction[None]
+) -> str:
+    counter("greetings")
+    audit_log(f"greeted {name}")
+    writes_mock.greeting(name)
+    return f"Hello, {name}!"
+
+
+@flow(
+    audit_log=audit_log,
+    counter=counter,
+    greeting=greeting,
+)
+def greet(names: list[str], greeting: FlowFunction[str]) -> list[str]:
+    return [greeting(name) for name in names]
+
+
+@flow(
+    audit_log=audit_log,
+    counter=counter,
+    greeting=greeting,
+    compile=True,
+)
+def greet_compiled(names: list[str], greeting: FlowFunction[str]) -> list[str]:
+    return [greeting(name) for name in names]
+
+
+@flow(
+    audit_log=audit_log,
+    counter=counter,
+    greeting=greeting,
+)
+def greet_and_fail(names: list[str], greeting: FlowFunction[str]) -> list[str]:
+    for name in names:
+        greeting(name)
+    raise ValueError("Greeting failed.")
+
+
+@flow(
+    audit_log=audit_log,
+    counter=counter,
+    greeting=greeting,
+)
+def greet_with_flush(
+    names: list[str], flow_context: FlowContext, greeting: FlowFunction[str]
+) -> list[str]:
+    greetings = []
+    for name in names:
+        greetings.append(greeting(name))
+        flow_context.flush()
+    return greetings
+
+
+@flow(
+    audit_log=failing_audit_log,
+    counter=counter,
+    greeting=greeting,
+)
+def greet_without_audit_log(names: list[str], greeting: FlowFunction[str]) -> list[str]:
+    return [greeting(name) for name in names]
+
+
+class TestFlowWithWriteBatchedFlowFunction(unittest.TestCase):
+    def setUp(self) -> None:
+        writes_mock.reset_mock()
+
+    def test_writes_are_flushed_in_one_call_when_flow_returns(self) -> None:
+        for greet_flow in (greet, greet_compiled):
+            with self.subTest(greet_flow=greet_flow.__name__):
+                self.setUp()
+                self.assertEqual(
+                    greet_flow(names=["Vinko", "Ana"]),
+                    ["Hello, Vinko!", "Hello, Ana!"],
+                )
+                self.assertEqual(
+                    writes_mock.mock_calls,
+                    [
+                        call.greeting("Vinko"),
+                        call.greeting("Ana"),
+                        call.counter(["greetings", "greetings"]),
+                        call.audit_log(["greeted Vinko", "greeted Ana"]),
+                    ],
+                )
+
+    def test_writes_are_discarded_when_flow_raises(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Greeting failed."):
+            greet_and_fail(names=["Vinko"])
+        self.assertEqual(writes_mock.mock_calls, [call.greeting("Vinko")])
+
+    def test_writes_are_flushed_at_flush_point(self) -> None:
+        self.assertEqual(
+            greet_with_flush(names=["Vinko", "Ana"]),
+            ["Hello, Vinko!", "Hello, Ana!"],
+        )
+        self.assertEqual(
+            writes_mock.mock_calls,
+            [
+                call.greeting("Vinko"),
+                call.counter(["greetings"]),
+                call.audit_log(["greeted Vinko"]),
+                call.greeting("Ana"),
+                call.counter(["greetings"]),
+                call.audit_log(["greeted Ana"]),
+            ],
+        )
+
+    def test_flush_exception_is_raised_by_flow(self) -> None:
+        with self.assertRaisesRegex(ConnectionError, "Audit log is not available."):
+            greet_without_audit_log(names=["Vinko"])
+        self.assertEqual(
+            writes_mock.mock_calls,
+            [call.greeting("Vinko"), call.counter(["greetings"])],
+        )
+
+    def test_write_batched_flow_function_outside_flow(self) -> None:
+        audit_log("greeted Vinko")
+        writes_mock.audit_log.assert_called_once_with(["greeted Vinko"])
+
+    def test_write_batched_flow_function_is_not_cached(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`write_batched` cannot be combined with `cached` or `batched`.",
+        ):
+
+            @flow_function(cached=True, write_batched=True)
+            def cached_audit_log(rows: list[str]) -> None:
+                pass
+
+    def test_write_batched_flow_function_has_one_argument_for_values(self) -> None:
+        with self.assertRaisesRegex(
+            AssertionError,
+            "`audit_log_with_level` write batched FlowFunction has to have"
+            " one argument that is not FlowFunction, the list of values.",
+        ):
+
+            @flow_function(write_batched=True)
+            def audit_log_with_level(rows: list[str], level: str) -> None:
+                pass